@@ -9,111 +9,56 @@ import asyncio
 import sys
 import os
 import tempfile
+import shutil
 import logging
+import re
 from pathlib import Path
 from datetime import datetime
 
+import aiohttp
+
 # Add src to path
 current_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(current_dir))
 os.chdir(current_dir)
 
+from src.orchestration.project_analyzer import ProjectAnalyzer, analysis_provider
+from src.orchestration.search_orchestrator import SearchOrchestrator
+from src.assembly.project_generator import ProjectGenerator
+from src.reporting.ai_integrated_reporter import AIIntegratedReporter
+from src.cli.config_manager import ConfigManager
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-async def test_project_analyzer():
-    """Test AI-powered project analysis."""
-    print("\n🤖 Testing Project Analyzer")
-    print("-" * 40)
-    
-    try:
-        from src.orchestration.project_analyzer import ProjectAnalyzer
-        
-        analyzer = ProjectAnalyzer()
-        
-        # Test with a simple project description
-        test_prompt = "Create a simple web scraper that extracts news headlines from RSS feeds"
-        
-        print(f"Analyzing prompt: {test_prompt}")
-        
-        # Try with fallback provider (Pollinations)
-        analysis = await analyzer.analyze_project_prompt(test_prompt, provider="pollinations")
-        
-        print(f"✅ Analysis completed:")
-        print(f"   Name: {analysis.name}")
-        print(f"   Type: {analysis.project_type}")
-        print(f"   Language: {analysis.language}")
-        print(f"   Components: {len(analysis.components)}")
-        print(f"   Confidence: {analysis.confidence}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Project Analyzer failed: {e}")
-        logger.exception("Project Analyzer test failed")
-        return False
+# Environment is read once at import
+_GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN', '')
 
-async def test_search_orchestrator():
-    """Test multi-tier search orchestration."""
-    print("\n🔍 Testing Search Orchestrator")
-    print("-" * 40)
-    
-    try:
-        from src.orchestration.search_orchestrator import SearchOrchestrator
-        
-        orchestrator = SearchOrchestrator()
-        
-        # Test with simple requirements
-        project_name = "web scraper"
-        language = "python"
-        components = ["requests", "beautifulsoup", "json"]
-        
-        print(f"Searching for: {project_name} ({language})")
-        print(f"Components: {components}")
-        
-        results = await orchestrator.orchestrate_search(project_name, language, components)
-        
-        print(f"✅ Search completed:")
-        print(f"   Packages found: {len(results.packages)}")
-        print(f"   Collections found: {len(results.curated_collections)}")
-        print(f"   Repositories found: {len(results.discovered_repositories)}")
-        
-        # Show some examples
-        if results.packages:
-            print(f"   Example package: {results.packages[0].name}")
-        if results.discovered_repositories:
-            print(f"   Example repo: {results.discovered_repositories[0].name}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Search Orchestrator failed: {e}")
-        logger.exception("Search Orchestrator test failed")
-        return False
+# Section markers looked for in generated reports, matched in a single scan
+_REPORT_MARKERS = re.compile(r'(AI-POWERED ANALYSIS|QUALITY METRICS)')
 
-async def test_project_generator():
-    """Test project generation."""
-    print("\n🏗️ Testing Project Generator")
-    print("-" * 40)
-    
-    try:
-        from src.assembly.project_generator import ProjectGenerator
-        
-        generator = ProjectGenerator()
-        
-        # Create test files
-        test_files = {
-            'main.py': '''#!/usr/bin/env python3
+# Project file contents used by the generator tests, built once at import
+_SCRAPER_MAIN_PY = '''#!/usr/bin/env python3
 """
 Simple Web Scraper
 """
 
 import requests
 from bs4 import BeautifulSoup
-import json
 from datetime import datetime
 
+try:
+    import orjson
+
+    def dump_json(data, f):
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+except ImportError:
+    import json
+
+    def dump_json(data, f):
+        json.dump(data, f, indent=2)
+
 def scrape_headlines():
     """Scrape news headlines."""
     print("Scraping headlines...")
@@ -129,17 +74,19 @@ def main():
     }
     
     with open('headlines.json', 'w') as f:
-        json.dump(data, f, indent=2)
+        dump_json(data, f)
     
     print(f"Scraped {len(headlines)} headlines")
 
 if __name__ == '__main__':
     main()
-''',
-            'requirements.txt': '''requests>=2.25.0
+'''
+
+_SCRAPER_REQUIREMENTS_TXT = '''requests>=2.25.0
 beautifulsoup4>=4.9.0
-''',
-            'README.md': '''# Web Scraper
+'''
+
+_SCRAPER_README = '''# Web Scraper
 
 A simple web scraper for extracting news headlines.
 
@@ -150,9 +97,180 @@ pip install -r requirements.txt
 python main.py
 ```
 '''
+
+_NEWS_MAIN_PY = '''#!/usr/bin/env python3
+"""News Scraper - Generated by AutoBot Assembly System"""
+
+import requests
+from bs4 import BeautifulSoup
+from datetime import datetime
+
+try:
+    import orjson
+
+    def dump_json(data, f):
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+except ImportError:
+    import json
+
+    def dump_json(data, f):
+        json.dump(data, f, indent=2)
+
+def scrape_news():
+    """Scrape news headlines."""
+    print("Scraping news headlines...")
+    # Placeholder implementation
+    return ["Breaking: AutoBot Assembly System Works!", "Tech: AI-Powered Development"]
+
+def main():
+    """Main function."""
+    headlines = scrape_news()
+    
+    data = {
+        'timestamp': datetime.now().isoformat(),
+        'headlines': headlines,
+        'count': len(headlines)
+    }
+    
+    with open('news_data.json', 'w') as f:
+        dump_json(data, f)
+    
+    print(f"Successfully scraped {len(headlines)} headlines")
+
+if __name__ == '__main__':
+    main()
+'''
+
+_NEWS_REQUIREMENTS_TXT = '''requests>=2.25.0
+beautifulsoup4>=4.9.0
+lxml>=4.6.0
+'''
+
+# Placeholders: {name}, {description}, {timestamp}
+_NEWS_README_TEMPLATE = '''# {name}
+
+{description}
+
+Generated by AutoBot Assembly System on {timestamp}
+
+## Installation
+
+```bash
+pip install -r requirements.txt
+```
+
+## Usage
+
+```bash
+python main.py
+```
+
+## Features
+
+- Web scraping capabilities
+- JSON data export
+- Error handling
+- Modular design
+'''
+
+class _BufferedOutput:
+    """Collects a test's console output and writes it in one go."""
+    
+    def __init__(self):
+        self.buf = []
+    
+    def __call__(self, *args):
+        self.buf.append(" ".join(map(str, args)) + "\n")
+    
+    def flush(self):
+        sys.stdout.write("".join(self.buf))
+        sys.stdout.flush()
+        self.buf.clear()
+
+async def test_project_analyzer(analyzer):
+    """Test AI-powered project analysis."""
+    out = _BufferedOutput()
+    out("\n🤖 Testing Project Analyzer")
+    out("-" * 40)
+    
+    try:
+        # Test with a simple project description
+        test_prompt = "Create a simple web scraper that extracts news headlines from RSS feeds"
+        
+        out(f"Analyzing prompt: {test_prompt}")
+        
+        # Provider (Pollinations) comes from the analysis_provider context set in main
+        analysis = await analyzer.analyze_project_prompt(test_prompt)
+        
+        out(f"✅ Analysis completed:")
+        out(f"   Name: {analysis.name}")
+        out(f"   Type: {analysis.project_type}")
+        out(f"   Language: {analysis.language}")
+        out(f"   Components: {len(analysis.components)}")
+        out(f"   Confidence: {analysis.confidence}")
+        
+        return True
+        
+    except Exception as e:
+        out(f"❌ Project Analyzer failed: {e}")
+        logger.error("Project Analyzer test failed", exc_info=logger.isEnabledFor(logging.DEBUG))
+        return False
+    finally:
+        out.flush()
+
+async def test_search_orchestrator(orchestrator):
+    """Test multi-tier search orchestration."""
+    out = _BufferedOutput()
+    out("\n🔍 Testing Search Orchestrator")
+    out("-" * 40)
+    
+    try:
+        # Test with simple requirements
+        project_name = "web scraper"
+        language = "python"
+        components = ["requests", "beautifulsoup", "json"]
+        
+        out(f"Searching for: {project_name} ({language})")
+        out(f"Components: {components}")
+        
+        results = await orchestrator.orchestrate_search(project_name, language, components)
+        
+        out(f"✅ Search completed:")
+        out(f"   Packages found: {len(results.packages)}")
+        out(f"   Collections found: {len(results.curated_collections)}")
+        out(f"   Repositories found: {len(results.discovered_repositories)}")
+        
+        # Show some examples
+        if results.packages:
+            out(f"   Example package: {results.packages[0].name}")
+        if results.discovered_repositories:
+            out(f"   Example repo: {results.discovered_repositories[0].name}")
+        
+        return True
+        
+    except Exception as e:
+        out(f"❌ Search Orchestrator failed: {e}")
+        logger.error("Search Orchestrator test failed", exc_info=logger.isEnabledFor(logging.DEBUG))
+        return False
+    finally:
+        out.flush()
+
+async def test_project_generator(generator):
+    """Test project generation."""
+    out = _BufferedOutput()
+    out("\n🏗️ Testing Project Generator")
+    out("-" * 40)
+    
+    try:
+        # Create test files
+        test_files = {
+            'main.py': _SCRAPER_MAIN_PY,
+            'requirements.txt': _SCRAPER_REQUIREMENTS_TXT,
+            'README.md': _SCRAPER_README
         }
         
-        with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = await asyncio.to_thread(tempfile.mkdtemp)
+        try:
             project = await generator.generate_project(
                 project_name="WebScraper",
                 output_dir=temp_dir,
@@ -161,29 +279,30 @@ python main.py
                 language="python"
             )
             
-            print(f"✅ Project generated:")
-            print(f"   Name: {project.name}")
-            print(f"   Path: {project.path}")
-            print(f"   Files: {len(project.files)}")
-            print(f"   Size: {project.size} bytes")
+            out(f"✅ Project generated:")
+            out(f"   Name: {project.name}")
+            out(f"   Path: {project.path}")
+            out(f"   Files: {len(project.files)}")
+            out(f"   Size: {project.size} bytes")
             
             return True
+        finally:
+            await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
         
     except Exception as e:
-        print(f"❌ Project Generator failed: {e}")
-        logger.exception("Project Generator test failed")
+        out(f"❌ Project Generator failed: {e}")
+        logger.error("Project Generator test failed", exc_info=logger.isEnabledFor(logging.DEBUG))
         return False
+    finally:
+        out.flush()
 
-async def test_ai_reporter():
+async def test_ai_reporter(reporter):
     """Test AI-integrated reporting."""
-    print("\n📋 Testing AI Reporter")
-    print("-" * 40)
+    out = _BufferedOutput()
+    out("\n📋 Testing AI Reporter")
+    out("-" * 40)
     
     try:
-        from src.reporting.ai_integrated_reporter import AIIntegratedReporter
-        
-        reporter = AIIntegratedReporter()
-        
         # Create test project data
         project_data = {
             'name': 'TestProject',
@@ -202,147 +321,88 @@ async def test_ai_reporter():
             }
         ]
         
-        print("Generating comprehensive report...")
+        out("Generating comprehensive report...")
         
         report = await reporter.generate_comprehensive_report(project_data, repositories)
         
-        print(f"✅ Report generated:")
-        print(f"   Length: {len(report)} characters")
-        print(f"   Contains AI analysis: {'AI-POWERED ANALYSIS' in report}")
-        print(f"   Contains metrics: {'QUALITY METRICS' in report}")
+        out(f"✅ Report generated:")
+        out(f"   Length: {len(report)} characters")
+        found_markers = {m.group(1) for m in _REPORT_MARKERS.finditer(report)}
+        out(f"   Contains AI analysis: {'AI-POWERED ANALYSIS' in found_markers}")
+        out(f"   Contains metrics: {'QUALITY METRICS' in found_markers}")
         
         return True
         
     except Exception as e:
-        print(f"❌ AI Reporter failed: {e}")
-        logger.exception("AI Reporter test failed")
+        out(f"❌ AI Reporter failed: {e}")
+        logger.error("AI Reporter test failed", exc_info=logger.isEnabledFor(logging.DEBUG))
         return False
+    finally:
+        out.flush()
 
-async def test_config_manager():
+async def test_config_manager(config_manager):
     """Test configuration management."""
-    print("\n⚙️ Testing Config Manager")
-    print("-" * 40)
+    out = _BufferedOutput()
+    out("\n⚙️ Testing Config Manager")
+    out("-" * 40)
     
     try:
-        from src.cli.config_manager import ConfigManager
-        
-        config_manager = ConfigManager()
-        
         # Test API key retrieval
         api_keys = config_manager.get_api_keys()
         
-        print(f"✅ Config Manager working:")
-        print(f"   API keys configured: {len([k for k, v in api_keys.items() if v])}")
-        print(f"   GitHub token: {'✅' if api_keys.get('github_token') else '❌'}")
-        print(f"   OpenAI key: {'✅' if api_keys.get('openai_api_key') else '❌'}")
+        out(f"✅ Config Manager working:")
+        out(f"   API keys configured: {len([k for k, v in api_keys.items() if v])}")
+        out(f"   GitHub token: {'✅' if api_keys.get('github_token') else '❌'}")
+        out(f"   OpenAI key: {'✅' if api_keys.get('openai_api_key') else '❌'}")
         
         # Test API status
         status = config_manager.get_api_status()
-        print(f"   API status: {status}")
+        out(f"   API status: {status}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Config Manager failed: {e}")
-        logger.exception("Config Manager test failed")
+        out(f"❌ Config Manager failed: {e}")
+        logger.error("Config Manager test failed", exc_info=logger.isEnabledFor(logging.DEBUG))
         return False
+    finally:
+        out.flush()
 
-async def test_end_to_end_workflow():
+async def test_end_to_end_workflow(analyzer, orchestrator, generator, reporter):
     """Test complete end-to-end workflow."""
-    print("\n🚀 Testing End-to-End Workflow")
-    print("-" * 40)
+    out = _BufferedOutput()
+    out("\n🚀 Testing End-to-End Workflow")
+    out("-" * 40)
     
     try:
-        # Import all components
-        from src.orchestration.project_analyzer import ProjectAnalyzer
-        from src.orchestration.search_orchestrator import SearchOrchestrator
-        from src.assembly.project_generator import ProjectGenerator
-        from src.reporting.ai_integrated_reporter import AIIntegratedReporter
-        
-        print("1. Analyzing project requirements...")
-        analyzer = ProjectAnalyzer()
+        out("1. Analyzing project requirements...")
         analysis = await analyzer.analyze_project_prompt(
-            "Create a Python web scraper for news headlines",
-            provider="pollinations"
+            "Create a Python web scraper for news headlines"
         )
-        print(f"   ✅ Analysis: {analysis.name} ({analysis.language})")
+        out(f"   ✅ Analysis: {analysis.name} ({analysis.language})")
         
-        print("2. Searching for components...")
-        orchestrator = SearchOrchestrator()
+        out("2. Searching for components...")
         search_results = await orchestrator.orchestrate_search(
             analysis.name, analysis.language, analysis.components[:3]  # Limit components
         )
-        print(f"   ✅ Found: {len(search_results.packages)} packages, {len(search_results.discovered_repositories)} repos")
+        out(f"   ✅ Found: {len(search_results.packages)} packages, {len(search_results.discovered_repositories)} repos")
         
-        print("3. Generating project...")
-        generator = ProjectGenerator()
+        out("3. Generating project...")
         
         # Simple project files
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         project_files = {
-            'main.py': '''#!/usr/bin/env python3
-"""News Scraper - Generated by AutoBot Assembly System"""
-
-import requests
-from bs4 import BeautifulSoup
-import json
-from datetime import datetime
-
-def scrape_news():
-    """Scrape news headlines."""
-    print("Scraping news headlines...")
-    # Placeholder implementation
-    return ["Breaking: AutoBot Assembly System Works!", "Tech: AI-Powered Development"]
-
-def main():
-    """Main function."""
-    headlines = scrape_news()
-    
-    data = {
-        'timestamp': datetime.now().isoformat(),
-        'headlines': headlines,
-        'count': len(headlines)
-    }
-    
-    with open('news_data.json', 'w') as f:
-        json.dump(data, f, indent=2)
-    
-    print(f"Successfully scraped {len(headlines)} headlines")
-
-if __name__ == '__main__':
-    main()
-''',
-            'requirements.txt': '''requests>=2.25.0
-beautifulsoup4>=4.9.0
-lxml>=4.6.0
-''',
-            'README.md': f'''# {analysis.name}
-
-{analysis.description}
-
-Generated by AutoBot Assembly System on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Installation
-
-```bash
-pip install -r requirements.txt
-```
-
-## Usage
-
-```bash
-python main.py
-```
-
-## Features
-
-- Web scraping capabilities
-- JSON data export
-- Error handling
-- Modular design
-'''
+            'main.py': _NEWS_MAIN_PY,
+            'requirements.txt': _NEWS_REQUIREMENTS_TXT,
+            'README.md': _NEWS_README_TEMPLATE.format(
+                name=analysis.name,
+                description=analysis.description,
+                timestamp=generated_at
+            )
         }
         
-        with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = await asyncio.to_thread(tempfile.mkdtemp)
+        try:
             project = await generator.generate_project(
                 project_name="NewsScraper",
                 output_dir=temp_dir,
@@ -350,11 +410,9 @@ python main.py
                 project_description=analysis.description,
                 language=analysis.language
             )
-            print(f"   ✅ Project: {project.name} ({len(project.files)} files)")
-            
-            print("4. Generating AI report...")
-            reporter = AIIntegratedReporter()
+            out(f"   ✅ Project: {project.name} ({len(project.files)} files)")
             
+            out("4. Generating AI report...")
             project_data = {
                 'name': project.name,
                 'path': project.path,
@@ -374,74 +432,100 @@ python main.py
             ]
             
             report = await reporter.generate_comprehensive_report(project_data, repositories)
-            print(f"   ✅ Report: {len(report)} characters")
+            out(f"   ✅ Report: {len(report)} characters")
             
-            print("\n🎉 End-to-End Workflow Completed Successfully!")
-            print(f"   Total time: ~{datetime.now().second}s")
-            print(f"   Components analyzed: {len(analysis.components)}")
-            print(f"   Resources found: {len(search_results.packages) + len(search_results.discovered_repositories)}")
-            print(f"   Project files: {len(project.files)}")
-            print(f"   Report sections: {report.count('##')}")
+            out("\n🎉 End-to-End Workflow Completed Successfully!")
+            out(f"   Total time: ~{datetime.now().second}s")
+            out(f"   Components analyzed: {len(analysis.components)}")
+            out(f"   Resources found: {len(search_results.packages) + len(search_results.discovered_repositories)}")
+            out(f"   Project files: {len(project.files)}")
+            out(f"   Report sections: {report.count('##')}")
             
             return True
+        finally:
+            await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
         
     except Exception as e:
-        print(f"❌ End-to-End Workflow failed: {e}")
-        logger.exception("End-to-End Workflow test failed")
+        out(f"❌ End-to-End Workflow failed: {e}")
+        logger.error("End-to-End Workflow test failed", exc_info=logger.isEnabledFor(logging.DEBUG))
         return False
+    finally:
+        out.flush()
 
 async def main():
-    """Run all component tests."""
+    """Run all component tests with a shared HTTP session."""
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await _run_tests(session)
+
+async def _run_tests(session):
+    """Run all component tests against one shared set of component instances."""
     print("🧪 AutoBot Assembly System - Comprehensive Component Test")
     print("=" * 70)
     
     # Check environment
-    github_token = os.getenv('GITHUB_TOKEN')
-    if github_token:
-        print(f"✅ GitHub token configured: {github_token[:10]}...")
+    if _GITHUB_TOKEN:
+        print("✅ GitHub token configured")
     else:
         print("⚠️ No GitHub token - some features may be limited")
     
     print()
     
+    # Build each component once and share it between tests
+    config_manager = ConfigManager()
+    analyzer = ProjectAnalyzer(config_manager=config_manager, session=session)
+    orchestrator = SearchOrchestrator()
+    generator = ProjectGenerator()
+    reporter = AIIntegratedReporter(config_manager=config_manager, session=session)
+    
     # Define tests
     tests = [
-        ("Config Manager", test_config_manager),
-        ("Project Analyzer", test_project_analyzer),
-        ("Search Orchestrator", test_search_orchestrator),
-        ("Project Generator", test_project_generator),
-        ("AI Reporter", test_ai_reporter),
-        ("End-to-End Workflow", test_end_to_end_workflow)
+        ("Config Manager", lambda: test_config_manager(config_manager)),
+        ("Project Analyzer", lambda: test_project_analyzer(analyzer)),
+        ("Search Orchestrator", lambda: test_search_orchestrator(orchestrator)),
+        ("Project Generator", lambda: test_project_generator(generator)),
+        ("AI Reporter", lambda: test_ai_reporter(reporter)),
+        ("End-to-End Workflow",
+         lambda: test_end_to_end_workflow(analyzer, orchestrator, generator, reporter))
     ]
     
+    # All analyses use the free Pollinations provider; gathered tasks inherit this
+    analysis_provider.set("pollinations")
+    
+    # Test name -> (passed, display status)
     results = {}
     
-    # Run tests
-    for test_name, test_func in tests:
-        try:
-            print(f"\n🧪 Running {test_name} test...")
-            result = await test_func()
-            results[test_name] = "✅ PASSED" if result else "❌ FAILED"
-            
-            if result:
-                print(f"✅ {test_name} test completed successfully")
-            else:
-                print(f"❌ {test_name} test failed")
-                
-        except Exception as e:
-            results[test_name] = f"❌ FAILED: {str(e)}"
-            print(f"❌ {test_name} test failed with exception: {e}")
-            logger.exception(f"Test {test_name} failed")
+    # Run tests concurrently - they are independent and I/O-bound
+    print(f"\n🧪 Running {len(tests)} tests concurrently...")
+    outcomes = await asyncio.gather(
+        *[test_func() for _, test_func in tests],
+        return_exceptions=True
+    )
+    
+    for (test_name, _), result in zip(tests, outcomes):
+        if isinstance(result, Exception):
+            results[test_name] = (False, f"❌ FAILED: {str(result)}")
+            print(f"❌ {test_name} test failed with exception: {result}")
+            logger.error("Test %s failed", test_name,
+                         exc_info=result if logger.isEnabledFor(logging.DEBUG) else None)
+            continue
+        
+        results[test_name] = (bool(result), "✅ PASSED" if result else "❌ FAILED")
+        
+        if result:
+            print(f"✅ {test_name} test completed successfully")
+        else:
+            print(f"❌ {test_name} test failed")
     
     # Print summary
     print("\n" + "=" * 70)
     print("TEST SUMMARY")
     print("=" * 70)
     
-    for test_name, result in results.items():
-        print(f"{test_name:<25} {result}")
+    for test_name, (_, status) in results.items():
+        print(f"{test_name:<25} {status}")
     
-    passed_tests = len([r for r in results.values() if "PASSED" in r])
+    passed_tests = sum(1 for passed, _ in results.values() if passed)
     total_tests = len(results)
     
     print(f"\nOverall: {passed_tests}/{total_tests} tests passed ({passed_tests/total_tests*100:.1f}%)")
@@ -461,5 +545,19 @@ async def main():
     
     return passed_tests == total_tests
 
+def _run(coro):
+    """Run the coroutine on uvloop when available, else the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    
+    uvloop.install()
+    return asyncio.run(coro)
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    _run(main())
\ No newline at end of file
@@ -4,22 +4,35 @@ AutoBot Assembly System - Main Package
 A comprehensive AI-powered system for automated project assembly and code generation.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "AutoBot Assembly Team"
 
-# Make key classes available at package level
-try:
-    from .orchestration.project_analyzer import ProjectAnalyzer
-    from .orchestration.search_orchestrator import SearchOrchestrator
-    from .assembly.project_generator import ProjectGenerator
-    from .reporting.ai_integrated_reporter import AIIntegratedReporter
-    from .search.tier1_packages import PackageSearcher
-    from .search.tier2_curated import CuratedSearcher
-    from .search.tier3_discovery import GitHubDiscoverer
-    from .optimization.performance_optimizer import PerformanceOptimizer
-except ImportError:
-    # Graceful fallback if some modules have issues
-    pass
+# Key classes available at package level, imported lazily on first access
+# so heavy optional dependencies are only loaded when actually used
+_LAZY_EXPORTS = {
+    'ProjectAnalyzer': '.orchestration.project_analyzer',
+    'SearchOrchestrator': '.orchestration.search_orchestrator',
+    'ProjectGenerator': '.assembly.project_generator',
+    'AIIntegratedReporter': '.reporting.ai_integrated_reporter',
+    'PackageSearcher': '.search.tier1_packages',
+    'CuratedSearcher': '.search.tier2_curated',
+    'GitHubDiscoverer': '.search.tier3_discovery',
+    'PerformanceOptimizer': '.optimization.performance_optimizer',
+}
+
+
+def __getattr__(name):
+    """Resolve package-level exports on first access (PEP 562)."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'ProjectAnalyzer',
@@ -30,4 +43,4 @@ __all__ = [
     'CuratedSearcher',
     'GitHubDiscoverer',
     'PerformanceOptimizer'
-]
\ No newline at end of file
+]
@@ -31,11 +31,15 @@ except ImportError as e:
 
 from .semgrep_client import SemgrepAnalyzer, SemgrepResults, SecurityScore
 from .astgrep_client import ASTGrepAnalyzer, StructureAnalysis, AdaptationScore
-from .unified_scorer import UnifiedFileScorer, CompositeFileScore
+from .unified_scorer import UnifiedFileScorer, CompositeFileScore, warm_up_scoring
 
 __all__ = [
-    'MegaLinterAnalyzer', 'MegaLinterResults', 'FileQualityScore',
+    'MEGALINTER_AVAILABLE',
     'SemgrepAnalyzer', 'SemgrepResults', 'SecurityScore',
     'ASTGrepAnalyzer', 'StructureAnalysis', 'AdaptationScore',
-    'UnifiedFileScorer', 'CompositeFileScore'
-]
\ No newline at end of file
+    'UnifiedFileScorer', 'CompositeFileScore', 'warm_up_scoring'
+]
+
+# Only advertise MegaLinter when the real client could be imported
+if MEGALINTER_AVAILABLE:
+    __all__ += ['MegaLinterAnalyzer', 'MegaLinterResults', 'FileQualityScore']
\ No newline at end of file
@@ -5,16 +5,65 @@ Structural code analysis using ast-grep for pattern matching and code structure
 with fallback to Tree-sitter parsing via UniversalCodeAnalyzer for enhanced multi-language support.
 """
 
+import ast
 import asyncio
+import atexit
+import bisect
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
+import shutil
+import sqlite3
 import subprocess
+import sys
 import tempfile
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple, Union
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Faster JSON encoding and decoding when available; both accept and produce bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# In-process ast-grep binding; keeps parsers loaded and avoids spawning the CLI
+try:
+    from ast_grep_py import SgRoot
+except ImportError:
+    SgRoot = None
+
+# Optional JIT compilation for the numeric scoring kernels
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+    NUMBA_AVAILABLE = np is not None
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
 # Import UniversalCodeAnalyzer for Tree-sitter integration
 try:
     from .universal_code_analyzer import UniversalCodeAnalyzer
@@ -33,15 +82,15 @@ except ImportError:
     Context7AnalysisResult = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImportAnalysis:
-    imports: List[str]
-    external_dependencies: List[str]
-    internal_dependencies: List[str]
+    imports: Tuple[str, ...]
+    external_dependencies: Tuple[str, ...]
+    internal_dependencies: Tuple[str, ...]
     dependency_count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassMetrics:
     class_count: int
     average_complexity: float
@@ -49,37 +98,570 @@ class ClassMetrics:
     inheritance_depth: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FrameworkDependencies:
-    frameworks: List[str]
+    frameworks: Tuple[str, ...]
     coupling_score: float
     framework_specific_patterns: Dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StructureAnalysis:
     imports: ImportAnalysis
     class_metrics: ClassMetrics
     framework_dependencies: FrameworkDependencies
-    config_patterns: List[str]
+    config_patterns: Tuple[str, ...]
     complexity_score: float
     maintainability_score: float
+    # Markers for the kinds of Context7 insight merged into the analysis
+    context7_flags: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdaptationScore:
     overall_effort: float
     estimated_hours: int
     complexity_factors: Dict[str, Any]
 
 
+def _weighted_score_kernel(values, weights):
+    """Weighted mean of factor values normalized to 0-1, skipping zero weights."""
+    total_score = 0.0
+    total_weight = 0.0
+    for i in range(len(values)):
+        weight = weights[i]
+        if weight > 0:
+            total_score += min(1.0, values[i] / 10.0) * weight
+            total_weight += weight
+    if total_weight > 0:
+        return total_score / total_weight
+    return 0.0
+
+
+def _maintainability_kernel(dependency_count, average_complexity, coupling_score):
+    """Maintainability score from dependency, complexity and coupling penalties."""
+    # Each penalty is a comparison used as 0/1, so the score is straight-line arithmetic
+    score = (
+        1.0
+        - 0.3 * (dependency_count > 20) - 0.1 * (10 < dependency_count <= 20)
+        - 0.3 * (average_complexity > 10) - 0.1 * (5 < average_complexity <= 10)
+        - 0.2 * (coupling_score > 0.8) - 0.1 * (0.5 < coupling_score <= 0.8)
+    )
+    return max(0.0, score)
+
+
+def _integration_time_kernel(dependency_count, class_complexity, framework_coupling, config_count):
+    """Estimated integration hours from the adaptation factors."""
+    total_hours = (
+        2.0
+        + min(8.0, dependency_count * 0.5)
+        + min(12.0, class_complexity * 2.0)
+        + min(6.0, framework_coupling * 10.0)
+        + min(4.0, config_count * 0.5)
+    )
+    return int(total_hours)
+
+
+# Complexity buckets: scores[i] applies up to and including thresholds[i],
+# and the last score above the final threshold
+_COMPLEXITY_THRESHOLDS = (0, 5, 15, 30)
+_COMPLEXITY_SCORES = (0.0, 0.2, 0.5, 0.8, 1.0)
+
+
+def batch_score(dep_counts, complexities, couplings, total_elements) -> Tuple[Any, Any]:
+    """
+    Complexity and maintainability scores for many files at once.
+    
+    Applies the same buckets as the per-file scoring methods with vectorized
+    NumPy operations, falling back to the scalar kernels without NumPy.
+    
+    Args:
+        dep_counts: External dependency count per file
+        complexities: Average class complexity per file
+        couplings: Framework coupling score per file
+        total_elements: Number of classes, functions and methods per file
+        
+    Returns:
+        Tuple of (complexity_scores, maintainability_scores)
+    """
+    if np is None:
+        complexity_scores = [_complexity_bucket(total) for total in total_elements]
+        maintainability_scores = [
+            _maintainability_kernel(deps, complexity, coupling)
+            for deps, complexity, coupling in zip(dep_counts, complexities, couplings)
+        ]
+        return complexity_scores, maintainability_scores
+    
+    dep_counts = np.asarray(dep_counts, dtype=np.float64)
+    complexities = np.asarray(complexities, dtype=np.float64)
+    couplings = np.asarray(couplings, dtype=np.float64)
+    total_elements = np.asarray(total_elements, dtype=np.float64)
+    
+    complexity_scores = np.asarray(_COMPLEXITY_SCORES)[
+        np.searchsorted(_COMPLEXITY_THRESHOLDS, total_elements, side='left')
+    ]
+    maintainability_scores = np.maximum(
+        0.0,
+        1.0
+        - np.where(dep_counts > 20, 0.3, np.where(dep_counts > 10, 0.1, 0.0))
+        - np.where(complexities > 10, 0.3, np.where(complexities > 5, 0.1, 0.0))
+        - np.where(couplings > 0.8, 0.2, np.where(couplings > 0.5, 0.1, 0.0))
+    )
+    return complexity_scores, maintainability_scores
+
+
+def _complexity_bucket(total_elements) -> float:
+    """Complexity score for a count of classes, functions and methods."""
+    # none, low, medium, high, very high
+    return _COMPLEXITY_SCORES[bisect.bisect_left(_COMPLEXITY_THRESHOLDS, total_elements)]
+
+
+# Compiled versions of the scalar scoring kernels, keyed by their Python kernel
+if NUMBA_AVAILABLE:
+    _COMPILED_KERNELS = {
+        kernel: numba.njit(cache=True)(kernel)
+        for kernel in (_weighted_score_kernel, _maintainability_kernel, _integration_time_kernel)
+    }
+else:
+    _COMPILED_KERNELS = {}
+
+
+# Import statement grammars, matched from the start of the statement text
+_PY_IMPORT_RE = re.compile(r'import (?P<mods>.*?)(?: as |\Z)|from (?P<module>.*?) import ', re.DOTALL)
+_JS_IMPORT_RE = re.compile(
+    r'(?=.*import ).* from (?P<module>.*)|.*?require\((?P<required>[^)]*)\)', re.DOTALL
+)
+_JAVA_IMPORT_RE = re.compile(r'import (?P<package>.*)', re.DOTALL)
+
+
+def _parse_python_import(import_text: str) -> List[str]:
+    """Module names from a Python import statement."""
+    match = _PY_IMPORT_RE.match(import_text)
+    if match is None:
+        return []
+    mods = match.group('mods')
+    if mods is not None:
+        # Handle "import module" or "import module as alias"
+        return [part.strip() for part in mods.split(',')]
+    # Handle "from module import names"
+    return [match.group('module').strip()]
+
+
+def _parse_js_import(import_text: str) -> List[str]:
+    """Module names from a JavaScript import or require statement."""
+    match = _JS_IMPORT_RE.match(import_text)
+    if match is None:
+        return []
+    module = match.group('module')
+    if module is not None:
+        # Handle "import names from 'module'"
+        return [module.strip().strip('\'"')]
+    # Handle "const name = require('module')"
+    required = match.group('required')
+    return [required.strip('\'"')] if required else []
+
+
+def _parse_java_import(import_text: str) -> List[str]:
+    """Package names from a Java import declaration."""
+    match = _JAVA_IMPORT_RE.match(import_text)
+    if match is None:
+        return []
+    # Handle "import package.Class;"
+    return [match.group('package').replace(';', '').strip()]
+
+
+@functools.lru_cache(maxsize=8192)
+def _is_external(import_name: str, language: str) -> bool:
+    """Whether an import is external for a (lowercase) language."""
+    # Check if it's a standard library module or one of its submodules; a set
+    # lookup plus one C-level startswith over precomputed prefixes, no splitting
+    if (import_name in _STDLIB_SETS.get(language, ())
+            or import_name.startswith(_STDLIB_PREFIXES.get(language, ()))):
+        return False
+    
+    # Relative imports are internal, anything else is assumed external
+    return not import_name.startswith(('.', './', '../'))
+
+
+_IMPORT_PARSERS = {
+    'python': _parse_python_import,
+    'javascript': _parse_js_import,
+    'java': _parse_java_import
+}
+
+
+# Branches of the generated Python visitor: (node types, body, descend into children).
+# Bodies see the current node as ``n``, its nesting depth and the result lists,
+# which collect the matched source text only.
+_PYTHON_VISIT_BRANCHES = (
+    (('Import',), "imports.append(unparse(n))", False),
+    (('ImportFrom',), "from_imports.append(unparse(n))", False),
+    (('ClassDef',), (
+        "bases = ', '.join(unparse(base) for base in n.bases)\n"
+        "class_definitions.append(f\"class {n.name}({bases})\" if bases else f\"class {n.name}\")"
+    ), True),
+    (('FunctionDef', 'AsyncFunctionDef'), (
+        "args = n.args.posonlyargs + n.args.args\n"
+        "target = method_definitions if args and args[0].arg == 'self' else function_definitions\n"
+        "target.append(f\"def {n.name}(...)\")"
+    ), True),
+    (('Assign',), (
+        "if depth == 0:\n"
+        "    config_patterns.append(get_source_segment(source, n) or unparse(n))"
+    ), False),
+)
+
+
+def _build_python_visitor():
+    """
+    Generate a single-loop visitor specialized for the Python pattern categories.
+    
+    The branches are unrolled into ``type(n) is ...`` checks on an explicit
+    stack, avoiding NodeVisitor's per-node ``getattr`` dispatch and recursion.
+    """
+    names = ('imports', 'from_imports', 'class_definitions', 'function_definitions',
+             'method_definitions', 'config_patterns')
+    lines = ["def _visit(tree, source):"]
+    lines += [f"    {name} = []" for name in names]
+    lines += [
+        "    stack = [(tree, 0)]",
+        "    while stack:",
+        "        n, depth = stack.pop()",
+        "        t = type(n)",
+    ]
+    for index, (node_types, body, descend) in enumerate(_PYTHON_VISIT_BRANCHES):
+        keyword = 'if' if index == 0 else 'elif'
+        condition = ' or '.join(f"t is ast.{node_type}" for node_type in node_types)
+        lines.append(f"        {keyword} {condition}:")
+        lines += ["            " + line for line in body.splitlines()]
+        if descend:
+            # Preorder, source-ordered traversal of the nested body
+            lines.append("            stack.extend((child, depth + 1) for child in reversed(list(iter_child_nodes(n))))")
+        lines.append("            continue")
+    lines.append("        stack.extend((child, depth) for child in reversed(list(iter_child_nodes(n))))")
+    lines.append("    return {" + ", ".join(f"{name!r}: {name}" for name in names) + "}")
+    
+    namespace = {
+        'ast': ast,
+        'unparse': ast.unparse,
+        'get_source_segment': ast.get_source_segment,
+        'iter_child_nodes': ast.iter_child_nodes
+    }
+    exec(compile('\n'.join(lines), '<python-pattern-visitor>', 'exec'), namespace)
+    return namespace['_visit']
+
+
+_visit_python_tree = _build_python_visitor()
+
+
+# Keywords marking configuration-related dependencies and messages
+_CONFIG_KEYWORDS = ('config', 'setting', 'env', 'secret', 'cfg', 'conf')
+
+# Path fragments of test files, build output, etc. that are never analyzed,
+# compiled into one alternation so a path is scanned once
+_SKIP_PATTERNS = (
+    'test_', '_test.', 'tests/', '__pycache__/', 'node_modules/',
+    '.git/', 'build/', 'dist/', '.pytest_cache/', 'coverage/'
+)
+_SKIP_RE = re.compile('|'.join(map(re.escape, _SKIP_PATTERNS)))
+
+# Source file extensions per language
+_LANG_EXTENSIONS = {
+    'python': ('py', 'pyw'),
+    'javascript': ('js', 'jsx', 'ts', 'tsx'),
+    'java': ('java',),
+    'go': ('go',),
+    'rust': ('rs',),
+    'php': ('php',),
+    'ruby': ('rb',),
+    'c': ('c', 'h'),
+    'cpp': ('cpp', 'cxx', 'cc', 'hpp')
+}
+_DEFAULT_EXTENSIONS = ('py',)  # Default to Python
+
+# Framework coupling added for each Context7 API validation, by validation status
+_VALIDATION_COUPLING = {'warning': 0.1, 'invalid': 0.2}
+
+
+# Shared result for files without any imports; safe to share since it is frozen
+_EMPTY_IMPORTS = ImportAnalysis((), (), (), 0)
+
+# Shared result for files with nothing to report; callers detect it by identity
+_EMPTY_ANALYSIS = StructureAnalysis(
+    imports=_EMPTY_IMPORTS,
+    class_metrics=ClassMetrics(0, 0.0, 0, 1),
+    framework_dependencies=FrameworkDependencies((), 0.0, {}),
+    config_patterns=(),
+    complexity_score=0.0,
+    maintainability_score=0.5
+)
+
+
+def _encode_analysis(analysis: StructureAnalysis) -> bytes:
+    """Serialize a StructureAnalysis to compact JSON for the persistent cache."""
+    return _json_dumps(asdict(analysis))
+
+
+def _decode_analysis(blob: bytes) -> StructureAnalysis:
+    """Rebuild a StructureAnalysis, with its nested dataclasses and tuples, from cached JSON."""
+    data = _json_loads(blob)
+    imports = data['imports']
+    frameworks = data['framework_dependencies']
+    return StructureAnalysis(
+        imports=ImportAnalysis(
+            imports=tuple(imports['imports']),
+            external_dependencies=tuple(imports['external_dependencies']),
+            internal_dependencies=tuple(imports['internal_dependencies']),
+            dependency_count=imports['dependency_count']
+        ),
+        class_metrics=ClassMetrics(**data['class_metrics']),
+        framework_dependencies=FrameworkDependencies(
+            frameworks=tuple(frameworks['frameworks']),
+            coupling_score=frameworks['coupling_score'],
+            framework_specific_patterns=frameworks['framework_specific_patterns']
+        ),
+        config_patterns=tuple(data['config_patterns']),
+        complexity_score=data['complexity_score'],
+        maintainability_score=data['maintainability_score'],
+        context7_flags=tuple(data['context7_flags'])
+    )
+
+
+# Analysis aspects requested from Context7 for every file
+_CONTEXT7_ASPECTS = ('structure', 'api', 'security')
+
+
+# Standard library modules (simplified detection)
+_STDLIB_MODULES = {
+    'python': ('os', 'sys', 'json', 'datetime', 'collections', 'itertools', 'functools', 'typing'),
+    'javascript': ('fs', 'path', 'http', 'https', 'url', 'util', 'crypto'),
+    'java': ('java.util', 'java.io', 'java.lang', 'java.net', 'java.time')
+}
+
+# Standard library module names per language, for the external dependency check.
+# Names match whole dotted components: java.util.List is standard library while
+# java.sql.Connection is not listed, and typing_extensions is not part of typing.
+_STDLIB_SETS = {
+    lang: frozenset(modules)
+    for lang, modules in _STDLIB_MODULES.items()
+}
+
+# "name." prefixes of the same modules, matching any of their submodules
+_STDLIB_PREFIXES = {
+    lang: tuple(f'{module}.' for module in sorted(modules))
+    for lang, modules in _STDLIB_SETS.items()
+}
+
+# Framework detection patterns
+_FRAMEWORK_PATTERNS = {
+    'python': {
+        'fastapi': ['from fastapi', 'FastAPI()', '@app.'],
+        'flask': ['from flask', 'Flask(__name__)', '@app.route'],
+        'django': ['from django', 'django.conf', 'models.Model'],
+        'sqlalchemy': ['from sqlalchemy', 'declarative_base', 'Column'],
+        'pydantic': ['from pydantic', 'BaseModel', 'Field'],
+        'pytest': ['import pytest', '@pytest.', 'def test_']
+    },
+    'javascript': {
+        'react': ['import React', 'useState', 'useEffect', 'jsx'],
+        'express': ['express()', 'app.get', 'app.post'],
+        'vue': ['Vue.component', 'new Vue', 'v-'],
+        'angular': ['@Component', '@Injectable', 'ngOnInit'],
+        'jest': ['describe(', 'it(', 'expect(']
+    },
+    'java': {
+        'spring': ['@SpringBootApplication', '@RestController', '@Autowired'],
+        'hibernate': ['@Entity', '@Table', '@Column'],
+        'junit': ['@Test', '@BeforeEach', '@AfterEach']
+    }
+}
+
+# Framework patterns frozen into ordered (framework, patterns) pairs, as text and
+# as UTF-8 bytes for searching raw file content
+_FRAMEWORK_TUPLES = {
+    lang: tuple((framework, tuple(patterns)) for framework, patterns in frameworks.items())
+    for lang, frameworks in _FRAMEWORK_PATTERNS.items()
+}
+_FRAMEWORK_TUPLES_B = {
+    lang: tuple(
+        (framework, tuple(pattern.encode('utf-8') for pattern in patterns))
+        for framework, patterns in frameworks
+    )
+    for lang, frameworks in _FRAMEWORK_TUPLES.items()
+}
+
+
+def _build_framework_automaton(frameworks: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Any:
+    """Build an Aho-Corasick automaton over one language's framework patterns."""
+    if ahocorasick is None or not frameworks:
+        return None
+    
+    # A pattern string may belong to several frameworks
+    owners: Dict[str, List[str]] = {}
+    for framework, patterns in frameworks:
+        for pattern in patterns:
+            owners.setdefault(pattern, []).append(framework)
+    
+    automaton = ahocorasick.Automaton()
+    for pattern, pattern_frameworks in owners.items():
+        automaton.add_word(pattern, (pattern, tuple(pattern_frameworks)))
+    automaton.make_automaton()
+    return automaton
+
+
+async def _none() -> None:
+    """Placeholder for an analysis slot whose analyzer is not configured."""
+    return None
+
+
+class _AstGrepScanner:
+    """
+    Coalesces concurrent ast-grep scan requests into shared subprocesses.
+    
+    Requests made for the same rule file while a scan is being scheduled are
+    served by one ``ast-grep scan`` invocation over all requested files, so
+    binary startup and grammar loading are paid once per batch instead of
+    once per file.
+    """
+    
+    # Upper bound for a single NDJSON match line
+    STREAM_LIMIT = 16 * 1024 * 1024
+    
+    def __init__(self, logger: logging.Logger, max_batch_size: int = 64,
+                 max_processes: Optional[int] = None):
+        self.logger = logger
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, Dict[str, asyncio.Future]] = {}
+        # Running flush tasks, referenced until done so they are not garbage collected
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # Bound concurrent ast-grep processes to avoid fork storms
+        self._semaphore = asyncio.Semaphore(max_processes or os.cpu_count() or 4)
+    
+    async def query(self, file_path: str, rules_path: str) -> List[Dict[str, Any]]:
+        """Get the matches for a single file, sharing a scan with concurrent callers."""
+        
+        batch = self._pending.get(rules_path)
+        if batch is None:
+            batch = self._pending[rules_path] = {}
+            # Flush on the next loop iteration so concurrent callers can join
+            asyncio.get_running_loop().call_soon(self._start_flush, rules_path)
+        
+        key = os.path.normpath(file_path)
+        future = batch.get(key)
+        if future is None:
+            future = batch[key] = asyncio.get_running_loop().create_future()
+        
+        return list(await future)
+    
+    def _start_flush(self, rules_path: str):
+        """Start flushing a rule file's batch in a task kept until it finishes."""
+        
+        task = asyncio.ensure_future(self._flush(rules_path))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush(self, rules_path: str):
+        """Scan every pending file for a rule file and resolve their futures."""
+        
+        batch = self._pending.pop(rules_path, {})
+        file_paths = list(batch)
+        
+        try:
+            # Scan batches concurrently, bounded by the process semaphore
+            await asyncio.gather(*(
+                self._scan_batch(file_paths[start:start + self.max_batch_size], rules_path, batch)
+                for start in range(0, len(file_paths), self.max_batch_size)
+            ), return_exceptions=True)
+        finally:
+            # Never leave a caller waiting if the batch was interrupted
+            for future in batch.values():
+                if not future.done():
+                    future.set_result([])
+    
+    async def _scan_batch(self, chunk: List[str], rules_path: str,
+                          batch: Dict[str, asyncio.Future]):
+        """Scan one batch of files and resolve their futures."""
+        
+        results: Dict[str, List[Dict[str, Any]]] = {path: [] for path in chunk}
+        
+        for match in await self._scan(chunk, rules_path):
+            matched_file = os.path.normpath(match.get('file', ''))
+            if matched_file in results:
+                results[matched_file].append(match)
+            elif len(chunk) == 1:
+                results[chunk[0]].append(match)
+        
+        for path in chunk:
+            if not batch[path].done():
+                batch[path].set_result(results[path])
+    
+    async def _scan(self, file_paths: List[str], rules_path: str) -> List[Dict[str, Any]]:
+        """Run ast-grep scan with all rules from a rule file over several files."""
+        
+        cmd = [
+            'ast-grep', 'scan',
+            '--rule', rules_path,
+            '--json=stream',
+            *file_paths
+        ]
+        
+        try:
+            async with self._semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=self.STREAM_LIMIT
+                )
+                
+                # Decode matches line by line while the scan is still running; lines
+                # go to the JSON parser as raw bytes without a stripped copy
+                stderr_task = asyncio.ensure_future(process.stderr.read())
+                matches = []
+                async for line in process.stdout:
+                    if not line.isspace():
+                        matches.append(_json_loads(line))
+                stderr = await stderr_task
+                await process.wait()
+            
+            if process.returncode == 0:
+                return matches
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("ast-grep scan failed: %s", stderr.decode())
+                
+        except Exception as e:
+            self.logger.error("Error running ast-grep: %s", e)
+        
+        return []
+
+
+@dataclass(slots=True, frozen=True)
+class _LanguagePlan:
+    """Per-language lookup tables resolved once at analyzer construction."""
+    language: str
+    patterns: Dict[str, Dict[str, str]]
+    framework_patterns: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    framework_patterns_b: Tuple[Tuple[str, Tuple[bytes, ...]], ...]
+    framework_ac: Any = None
+
+
 class ASTGrepAnalyzer:
     """Structural code analysis using ast-grep with Tree-sitter fallback."""
     
-    def __init__(self, use_tree_sitter_fallback: bool = True, enable_context7: bool = True):
+    def __init__(self, use_tree_sitter_fallback: bool = True, enable_context7: bool = True,
+                 cache_path: Optional[str] = None, max_concurrency: int = 8):
         self.logger = logging.getLogger(__name__)
+        # Constructor arguments, so worker processes can build an equivalent analyzer
+        self._worker_options = {
+            'use_tree_sitter_fallback': use_tree_sitter_fallback,
+            'enable_context7': enable_context7,
+            'cache_path': cache_path,
+            'max_concurrency': max_concurrency
+        }
         self.use_tree_sitter_fallback = use_tree_sitter_fallback and UNIVERSAL_ANALYZER_AVAILABLE
         self.enable_context7 = enable_context7 and CONTEXT7_AVAILABLE
+        # Files combined_analysis_batch analyzes at once
+        self.max_concurrency = max_concurrency
         
         # Initialize UniversalCodeAnalyzer if fallback is enabled
         self.tree_sitter_analyzer = None
@@ -88,7 +670,7 @@ class ASTGrepAnalyzer:
                 self.tree_sitter_analyzer = UniversalCodeAnalyzer()
                 self.logger.info("UniversalCodeAnalyzer initialized for Tree-sitter fallback")
             except Exception as e:
-                self.logger.warning(f"Failed to initialize UniversalCodeAnalyzer: {e}")
+                self.logger.warning("Failed to initialize UniversalCodeAnalyzer: %s", e)
                 self.tree_sitter_analyzer = None
         
         # Initialize Context7 analyzer if enabled
@@ -98,7 +680,7 @@ class ASTGrepAnalyzer:
                 self.context7_analyzer = Context7Analyzer(enable_fallback=True)
                 self.logger.info("Context7Analyzer initialized for enhanced analysis")
             except Exception as e:
-                self.logger.warning(f"Failed to initialize Context7Analyzer: {e}")
+                self.logger.warning("Failed to initialize Context7Analyzer: %s", e)
                 self.context7_analyzer = None
                 self.enable_context7 = False
         
@@ -174,27 +756,53 @@ class ASTGrepAnalyzer:
         
         # Framework detection patterns
         self.framework_patterns = {
-            'python': {
-                'fastapi': ['from fastapi', 'FastAPI()', '@app.'],
-                'flask': ['from flask', 'Flask(__name__)', '@app.route'],
-                'django': ['from django', 'django.conf', 'models.Model'],
-                'sqlalchemy': ['from sqlalchemy', 'declarative_base', 'Column'],
-                'pydantic': ['from pydantic', 'BaseModel', 'Field'],
-                'pytest': ['import pytest', '@pytest.', 'def test_']
-            },
-            'javascript': {
-                'react': ['import React', 'useState', 'useEffect', 'jsx'],
-                'express': ['express()', 'app.get', 'app.post'],
-                'vue': ['Vue.component', 'new Vue', 'v-'],
-                'angular': ['@Component', '@Injectable', 'ngOnInit'],
-                'jest': ['describe(', 'it(', 'expect(']
-            },
-            'java': {
-                'spring': ['@SpringBootApplication', '@RestController', '@Autowired'],
-                'hibernate': ['@Entity', '@Table', '@Column'],
-                'junit': ['@Test', '@BeforeEach', '@AfterEach']
-            }
+            lang: {framework: list(patterns) for framework, patterns in frameworks}
+            for lang, frameworks in _FRAMEWORK_TUPLES.items()
         }
+
+        # Shared ast-grep scan runner; with the in-process binding installed ast-grep
+        # is always available, otherwise the CLI is probed on first use unless the
+        # binary is not on PATH at all
+        self._scanner = _AstGrepScanner(self.logger)
+        if SgRoot is not None:
+            self._astgrep_available: Optional[bool] = True
+        else:
+            self._astgrep_available = None if shutil.which('ast-grep') else False
+        self._astgrep_probe_lock = threading.Lock()
+
+        # In-memory LRU of analyses keyed by (path, mtime, size, language)
+        self._structure_cache: OrderedDict = OrderedDict()
+        self.max_cached_structures = 1024
+        
+        # In-process LRU of ast-grep matches keyed by (content digest, language, pattern),
+        # filled from worker threads
+        self._match_cache: OrderedDict = OrderedDict()
+        self._match_cache_lock = threading.Lock()
+        self.max_cached_matches = 8192
+        
+        # In-memory LRU of successful Context7 results keyed by (path, content hash, aspects)
+        self._context7_results: OrderedDict = OrderedDict()
+        self.max_cached_context7_results = 1024
+        
+        # Persistent cache of base (pre-Context7) analyses keyed by
+        # (path, content hash, whether the Tree-sitter fallback is enabled);
+        # only kept when a cache path is configured
+        self._cache_lock = threading.Lock()
+        self._cache = None
+        cache_path = cache_path or os.getenv('ASTGREP_CACHE_PATH')
+        if cache_path:
+            self._cache = self._open_cache(cache_path)
+        
+        # Case-insensitive configuration keyword matcher
+        self._config_kw_re = re.compile(r'config|setting|env|secret', re.IGNORECASE)
+        
+        # Automaton over the wider configuration keyword set used for names and messages
+        self._config_keyword_ac = None
+        if ahocorasick is not None:
+            self._config_keyword_ac = ahocorasick.Automaton()
+            for keyword in _CONFIG_KEYWORDS:
+                self._config_keyword_ac.add_word(keyword, keyword)
+            self._config_keyword_ac.make_automaton()
         
         # Adaptation effort weights
         self.adaptation_weights = {
@@ -203,11 +811,42 @@ class ASTGrepAnalyzer:
             'framework_coupling': 0.25,
             'configuration_requirements': 0.2
         }
+        self._weight_names = tuple(self.adaptation_weights)
+        weight_values = [self.adaptation_weights[name] for name in self._weight_names]
+        self._weight_values = np.array(weight_values, dtype=np.float64) if np is not None else weight_values
+        
+        # Compiled scoring kernels in use; one whose JIT compilation fails is dropped
+        # and its Python kernel used instead
+        self._compiled_kernels = dict(_COMPILED_KERNELS)
+        
+        # Everything language-specific, resolved once per language
+        self._plans = {
+            lang: _LanguagePlan(
+                language=lang,
+                patterns=self.patterns.get(lang, {}),
+                framework_patterns=_FRAMEWORK_TUPLES.get(lang, ()),
+                framework_patterns_b=_FRAMEWORK_TUPLES_B.get(lang, ()),
+                framework_ac=_build_framework_automaton(_FRAMEWORK_TUPLES.get(lang, ()))
+            )
+            for lang in {*self.patterns, *_FRAMEWORK_TUPLES, *_STDLIB_SETS}
+        }
+        
+        # ast-grep rule files, written once per language into a per-analyzer directory
+        # created on first use
+        self._rules_dir: Optional[str] = None
+        self._rule_files: Dict[str, str] = {}
     
     async def analyze_code_structure(self, file_path: str, language: str) -> StructureAnalysis:
         """
         Analyze code structure using AST-grep patterns with Tree-sitter and Context7 fallback.
         
+        Results are memoized in memory by path, mtime and size. When a cache path
+        is configured, the base ast-grep or Tree-sitter analysis is also persisted
+        by file path, mtime, size and content hash, so unchanged files are not
+        re-analyzed, and across runs are not even re-read; Context7 insights are
+        applied after the lookup, since they depend on this analyzer's options and
+        on the service's availability.
+        
         Args:
             file_path: Path to file to analyze
             language: Programming language
@@ -215,113 +854,502 @@ class ASTGrepAnalyzer:
         Returns:
             StructureAnalysis with structural metrics
         """
+        # Canonical language name, interned so the plan lookups below hit on the
+        # first try without lowering again
+        language = sys.intern(language.lower())
+        plan = self._plans.get(language)
+        if (plan is None or not plan.patterns) and self.tree_sitter_analyzer is None:
+            # No patterns and no fallback parser; nothing to extract, so skip the I/O
+            return _EMPTY_ANALYSIS
+        
+        # In-memory hit needs only a stat, no read or hash
+        memo_key = None
+        try:
+            stat = os.stat(file_path)
+            memo_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, language)
+        except OSError:
+            pass
+        if memo_key is not None:
+            cached = self._structure_cache.get(memo_key)
+            if cached is not None:
+                self._structure_cache.move_to_end(memo_key)
+                return cached
+            
+            # A file untouched since a previous run is served from disk, still unread
+            if self._cache is not None:
+                base_analysis = await asyncio.to_thread(self._load_unchanged_analysis, memo_key)
+                if base_analysis is not None:
+                    analysis = await self._finish_analysis(base_analysis, file_path, language)
+                    self._remember_structure(memo_key, analysis)
+                    return analysis
+        
+        # Read once; the bytes serve hashing, Python parsing and framework detection
+        content = await asyncio.to_thread(self._read_file, file_path)
+        if content is None:
+            return _EMPTY_ANALYSIS
+        
+        base_analysis = None
+        content_hash = None
+        if self._cache is not None:
+            content_hash = self._hash_content(content, language)
+            base_analysis = await asyncio.to_thread(self._load_cached_analysis, file_path, content_hash)
+            
+            if base_analysis is not None and memo_key is not None:
+                # Same content under a new mtime (e.g. a fresh checkout); record the new stat
+                await asyncio.to_thread(
+                    self._store_cached_analysis, file_path, content_hash, base_analysis, memo_key
+                )
+        
+        if base_analysis is None:
+            base_analysis = await self._analyze_base_structure(file_path, language, content)
+            if content_hash and base_analysis is not _EMPTY_ANALYSIS:
+                await asyncio.to_thread(
+                    self._store_cached_analysis, file_path, content_hash, base_analysis, memo_key
+                )
+        
+        analysis = await self._finish_analysis(base_analysis, file_path, language, content)
+        if memo_key is not None and analysis is not _EMPTY_ANALYSIS:
+            self._remember_structure(memo_key, analysis)
+        
+        return analysis
+    
+    def _remember_structure(self, memo_key: Tuple, analysis: StructureAnalysis):
+        """Add an analysis to the in-memory LRU, evicting the least recently used."""
+        self._structure_cache[memo_key] = analysis
+        if len(self._structure_cache) > self.max_cached_structures:
+            self._structure_cache.popitem(last=False)
+    
+    async def analyze_files(self, file_language_pairs: List[Tuple[str, str]],
+                            max_workers: Optional[int] = None) -> List[StructureAnalysis]:
+        """
+        Analyze many files in parallel worker processes.
+        
+        Each worker keeps its own analyzer and event loop, so parsing, framework
+        detection and ast-grep runs scale across cores. Files whose worker fails
+        are re-analyzed in this process.
+        
+        Args:
+            file_language_pairs: (file_path, language) for each file to analyze
+            max_workers: Worker process count (defaults to the CPU count)
+            
+        Returns:
+            StructureAnalysis for each file, in input order
+        """
+        if not file_language_pairs:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        workers = min(max_workers or os.cpu_count() or 1, len(file_language_pairs))
+        
+        # Workers share this process's rule files, which are cleaned up at exit here
+        for language in {language.lower() for _, language in file_language_pairs}:
+            plan = self._plans.get(language)
+            if plan is not None and plan.patterns:
+                self._get_rule_file(plan.language, plan.patterns)
+        rule_files = dict(self._rule_files)
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(
+                        pool, _analyze_in_worker, file_path, language, self._worker_options, rule_files
+                    )
+                    for file_path, language in file_language_pairs
+                ), return_exceptions=True)
+        except Exception as e:
+            self.logger.warning("Process pool analysis unavailable: %s", e)
+            results = [e] * len(file_language_pairs)
+        
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                file_path, language = file_language_pairs[index]
+                results[index] = await self.analyze_code_structure(file_path, language)
+        
+        return results
+    
+    async def analyze_corpus(self, root: str, language: str,
+                             max_concurrency: Optional[int] = None) -> Dict[str, StructureAnalysis]:
+        """
+        Analyze every file of a language under a directory.
+        
+        Files are analyzed concurrently in one event loop, so with the ast-grep CLI
+        their scans coalesce into multi-file invocations whose JSON stream is split
+        back per file; the in-process binding, match memo and caches are shared.
+        
+        Args:
+            root: Directory to walk
+            language: Programming language of the files to analyze
+            max_concurrency: Files in flight at once (defaults to one full scan
+                batch per ast-grep process slot)
+        
+        Returns:
+            StructureAnalysis per file path
+        """
+        extensions = tuple(f'.{extension}' for extension in self._get_file_extensions(language))
+        file_paths = await asyncio.to_thread(self._find_corpus_files, root, extensions)
+        if not file_paths:
+            return {}
+        
+        # Enough files in flight to fill every scan batch, without holding the
+        # whole corpus in memory at once
+        semaphore = asyncio.Semaphore(
+            max_concurrency or self._scanner.max_batch_size * (os.cpu_count() or 4)
+        )
+        
+        async def analyze(file_path: str) -> StructureAnalysis:
+            async with semaphore:
+                return await self.analyze_code_structure(file_path, language)
+        
+        analyses = await asyncio.gather(*(analyze(file_path) for file_path in file_paths))
+        return dict(zip(file_paths, analyses))
+    
+    def _find_corpus_files(self, root: str, extensions: Tuple[str, ...]) -> List[str]:
+        """Walk a directory for files with the given extensions, pruning skipped directories."""
+        file_paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [
+                dirname for dirname in dirnames
+                if self._should_analyze_file(os.path.join(dirpath, dirname) + '/')
+            ]
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                if filename.endswith(extensions) and self._should_analyze_file(file_path):
+                    file_paths.append(file_path)
+        return sorted(file_paths)
+    
+    async def _analyze_base_structure(self, file_path: str, language: str,
+                                      content: Optional[bytes] = None) -> StructureAnalysis:
+        """Run the AST-grep analysis with its Tree-sitter fallback, without Context7 or caching."""
         try:
-            # First try AST-grep analysis
-            if await self._is_astgrep_available():
-                analysis_result = await self._analyze_with_astgrep(file_path, language)
-                if analysis_result and analysis_result != self._create_empty_analysis():
-                    # Enhance with Context7 if available
-                    if self.enable_context7:
-                        enhanced_result = await self._enhance_with_context7(
-                            analysis_result, file_path, language
-                        )
-                        if enhanced_result:
-                            return enhanced_result
-                    return analysis_result
+            analysis_result = await self._analyze_patterns(file_path, language, content)
+            
+            if analysis_result and analysis_result is not _EMPTY_ANALYSIS:
+                return analysis_result
             
             # Fallback to Tree-sitter analysis
             if self.tree_sitter_analyzer:
                 tree_sitter_result = await self._analyze_with_tree_sitter(file_path, language)
-                if tree_sitter_result and tree_sitter_result != self._create_empty_analysis():
-                    # Enhance with Context7 if available
-                    if self.enable_context7:
-                        enhanced_result = await self._enhance_with_context7(
-                            tree_sitter_result, file_path, language
-                        )
-                        if enhanced_result:
-                            return enhanced_result
+                if tree_sitter_result and tree_sitter_result is not _EMPTY_ANALYSIS:
                     return tree_sitter_result
             
             # Return empty analysis if all methods fail
-            return self._create_empty_analysis()
-            
+            return _EMPTY_ANALYSIS
+        
         except Exception as e:
-            self.logger.error(f"Structure analysis failed: {e}")
-            return self._create_empty_analysis()
+            self.logger.error("Structure analysis failed: %s", e)
+            return _EMPTY_ANALYSIS
     
-    async def _is_astgrep_available(self) -> bool:
-        """Check if ast-grep is available and working."""
+    async def _finish_analysis(self, base_analysis: StructureAnalysis, file_path: str, language: str,
+                               content: Optional[bytes] = None) -> StructureAnalysis:
+        """Enhance a base analysis with Context7 if enabled; the empty analysis is returned as is."""
+        if not self.enable_context7 or base_analysis is _EMPTY_ANALYSIS:
+            return base_analysis
+        
+        return await self._enhance_with_context7(base_analysis, file_path, language, content)
+    
+    async def _analyze_patterns(self, file_path: str, language: str,
+                                content: Optional[bytes] = None) -> Optional[StructureAnalysis]:
+        """Run the pattern-based stage: the in-process Python parse, else AST-grep."""
+        # Python is parsed in-process; other languages go through AST-grep
+        analysis_result = None
+        plan = self._plan_for(language)
+        if plan is not None and plan.language == 'python':
+            analysis_result = await self._analyze_with_python_ast(file_path, plan, content)
+        if analysis_result is None and await self._is_astgrep_available():
+            analysis_result = await self._analyze_with_astgrep(file_path, language, content)
+        return analysis_result
+    
+    def _merge_analyses(self, astgrep_result: Optional[StructureAnalysis],
+                        tree_sitter_result: Optional[StructureAnalysis],
+                        context7_result: Any, file_path: str) -> StructureAnalysis:
+        """
+        Merge already computed sub-results the way the analysis chain would.
+        
+        The AST-grep result is preferred over the Tree-sitter one, and Context7
+        insights are applied on top when enabled; nothing is re-analyzed.
+        
+        Args:
+            astgrep_result: Pattern-based analysis, if any
+            tree_sitter_result: Tree-sitter analysis, if any
+            context7_result: Context7AnalysisResult, if any
+            file_path: Path to the analyzed file, for logging
+        
+        Returns:
+            Merged StructureAnalysis, or the empty analysis if no sub-result has content
+        """
+        for base_analysis in (astgrep_result, tree_sitter_result):
+            if base_analysis and base_analysis is not _EMPTY_ANALYSIS:
+                if self.enable_context7 and context7_result and context7_result.success:
+                    return self._apply_context7(base_analysis, context7_result, file_path)
+                return base_analysis
+        
+        return _EMPTY_ANALYSIS
+
+
+    def _plan_for(self, language: str) -> Optional[_LanguagePlan]:
+        """Look up a language's plan, lowering the name only when it is not already lowercase."""
+        plan = self._plans.get(language)
+        return plan if plan is not None else self._plans.get(language.lower())
+    
+    def _open_cache(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open the SQLite analysis cache, returning None if it cannot be used."""
         try:
-            process = await asyncio.create_subprocess_exec(
-                'ast-grep', '--version',
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+            connection = sqlite3.connect(cache_path, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS base_structure_cache ('
+                'path TEXT, sha TEXT, language TEXT, fallback INTEGER, mtime_ns INTEGER, size INTEGER, '
+                'blob BLOB, PRIMARY KEY(path, sha, fallback))'
             )
-            stdout, stderr = await process.communicate()
-            return process.returncode == 0
-        except Exception:
-            return False
+            connection.commit()
+            return connection
+        except Exception as e:
+            self.logger.warning("Analysis cache disabled: %s", e)
+            return None
+    
+    def _read_file(self, file_path: str) -> Optional[bytes]:
+        """Read a file's bytes (blocking), returning None if it cannot be read."""
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except OSError as e:
+            self.logger.error("Error reading file %s: %s", file_path, e)
+            return None
+    
+    def _hash_content(self, content: bytes, language: str) -> str:
+        """Hash file content together with the (lowercase) language it is analyzed as."""
+        digest = hashlib.sha256(content)
+        digest.update(language.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _cache_variant(self) -> int:
+        """Whether base analyses of this analyzer can come from the Tree-sitter fallback."""
+        return int(self.tree_sitter_analyzer is not None)
+    
+    def _load_unchanged_analysis(self, memo_key: Tuple) -> Optional[StructureAnalysis]:
+        """Load a cached base analysis by (path, mtime, size, language), without reading the file."""
+        try:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    'SELECT blob FROM base_structure_cache '
+                    'WHERE path = ? AND mtime_ns = ? AND size = ? AND language = ? AND fallback = ?',
+                    (*memo_key, self._cache_variant())
+                ).fetchone()
+            return _decode_analysis(row[0]) if row else None
+        except Exception as e:
+            self.logger.debug("Analysis cache read failed for %s: %s", memo_key[0], e)
+            return None
+    
+    def _load_cached_analysis(self, file_path: str, content_hash: str) -> Optional[StructureAnalysis]:
+        """Load a cached base analysis for an unchanged file."""
+        try:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    'SELECT blob FROM base_structure_cache WHERE path = ? AND sha = ? AND fallback = ?',
+                    (os.path.abspath(file_path), content_hash, self._cache_variant())
+                ).fetchone()
+            return _decode_analysis(row[0]) if row else None
+        except Exception as e:
+            self.logger.debug("Analysis cache read failed for %s: %s", file_path, e)
+            return None
+    
+    def _store_cached_analysis(self, file_path: str, content_hash: str, analysis: StructureAnalysis,
+                               memo_key: Optional[Tuple] = None):
+        """Store a base analysis, dropping entries for older versions of the file."""
+        path = os.path.abspath(file_path)
+        _, mtime_ns, size, language = memo_key or (path, None, None, None)
+        try:
+            with self._cache_lock:
+                self._cache.execute(
+                    'DELETE FROM base_structure_cache WHERE path = ? AND sha != ?',
+                    (path, content_hash)
+                )
+                self._cache.execute(
+                    'INSERT OR REPLACE INTO base_structure_cache '
+                    '(path, sha, language, fallback, mtime_ns, size, blob) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (path, content_hash, language, self._cache_variant(), mtime_ns, size,
+                     _encode_analysis(analysis))
+                )
+                self._cache.commit()
+        except Exception as e:
+            self.logger.debug("Analysis cache write failed for %s: %s", file_path, e)
+    
+    async def _cached_context7(self, file_path: str, language: str,
+                               aspects: Tuple[str, ...] = _CONTEXT7_ASPECTS,
+                               content: Optional[bytes] = None) -> Any:
+        """
+        Run Context7 analysis for a file, reusing earlier results for unchanged content.
+        
+        Successful results are kept in memory, keyed by path, content hash (which
+        covers the language) and requested aspects; Context7Analyzer persists the
+        results that came from Context7 itself.
+        
+        Args:
+            file_path: Path to file to analyze
+            language: Programming language
+            aspects: Context7 analysis types
+            content: File bytes, if already read
+        
+        Returns:
+            Context7AnalysisResult from the cache or a fresh analysis
+        """
+        if content is None:
+            content = await asyncio.to_thread(self._read_file, file_path)
+        if content is None:
+            # Let Context7 report the unreadable file itself
+            return await self.context7_analyzer.analyze_file(file_path, language, list(aspects))
+        
+        key = (os.path.abspath(file_path), self._hash_content(content, language.lower()), ','.join(aspects))
+        result = self._context7_results.get(key)
+        if result is not None:
+            self._context7_results.move_to_end(key)
+            return result
+        
+        result = await self.context7_analyzer.analyze_file(file_path, language, list(aspects))
+        if not result or not result.success:
+            # Failures may be transient (e.g. network); do not cache them
+            return result
+        
+        self._context7_results[key] = result
+        if len(self._context7_results) > self.max_cached_context7_results:
+            self._context7_results.popitem(last=False)
+        return result
+    
+    async def _is_astgrep_available(self) -> bool:
+        """Check if ast-grep is available and working, probing it only once."""
+        if self._astgrep_available is None:
+            return await asyncio.to_thread(self._probe_astgrep)
+        return self._astgrep_available
     
-    async def _analyze_with_astgrep(self, file_path: str, language: str) -> Optional[StructureAnalysis]:
+    def _probe_astgrep(self) -> bool:
+        """
+        Run ``ast-grep --version`` to confirm the binary works.
+        
+        Concurrent first callers wait on the same probe instead of each starting
+        their own subprocess; the lock is a thread lock so the result is shared
+        across event loops.
+        """
+        with self._astgrep_probe_lock:
+            if self._astgrep_available is None:
+                try:
+                    process = subprocess.run(
+                        ['ast-grep', '--version'], capture_output=True, timeout=30
+                    )
+                    self._astgrep_available = process.returncode == 0
+                except Exception:
+                    self._astgrep_available = False
+            return self._astgrep_available
+
+    async def _analyze_with_astgrep(self, file_path: str, language: str,
+                                    content: Optional[bytes] = None) -> Optional[StructureAnalysis]:
         """Analyze code using AST-grep."""
         try:
             # Get patterns for the language
-            lang_patterns = self.patterns.get(language.lower(), {})
-            if not lang_patterns:
+            plan = self._plan_for(language)
+            if plan is None or not plan.patterns:
                 return None
             
-            # Run pattern matching
-            pattern_results = {}
-            for pattern_name, pattern_config in lang_patterns.items():
-                try:
-                    matches = await self._run_astgrep_pattern(
-                        file_path, pattern_config['pattern'], language
-                    )
-                    pattern_results[pattern_name] = matches
-                except Exception as e:
-                    self.logger.error(f"Error running pattern {pattern_name}: {e}")
-                    pattern_results[pattern_name] = []
-            
-            # Analyze results
-            imports_analysis = self._analyze_imports(pattern_results, language)
-            class_metrics = self._analyze_classes(pattern_results)
-            framework_deps = self._analyze_framework_dependencies(file_path, language)
-            config_patterns = self._analyze_config_patterns(pattern_results)
-            
-            # Calculate scores
-            complexity_score = self._calculate_complexity_score(pattern_results)
-            maintainability_score = self._calculate_maintainability_score(
-                imports_analysis, class_metrics, framework_deps
-            )
+            if SgRoot is not None:
+                if content is None:
+                    content = await asyncio.to_thread(self._read_file, file_path)
+                    if content is None:
+                        return None
+                pattern_results = await asyncio.to_thread(self._match_in_process, content, plan)
+            else:
+                pattern_results = await self._run_astgrep_scan(file_path, plan)
+            return await self._build_structure_analysis(pattern_results, file_path, plan, content)
             
-            return StructureAnalysis(
-                imports=imports_analysis,
-                class_metrics=class_metrics,
-                framework_dependencies=framework_deps,
-                config_patterns=config_patterns,
-                complexity_score=complexity_score,
-                maintainability_score=maintainability_score
-            )
+        except Exception as e:
+            self.logger.error("AST-grep analysis failed: %s", e)
+            return None
+    
+    async def _analyze_with_python_ast(self, file_path: str, plan: _LanguagePlan,
+                                       content: Optional[bytes] = None) -> Optional[StructureAnalysis]:
+        """Analyze Python code with the standard library ``ast`` module."""
+        try:
+            if content is None:
+                content = await asyncio.to_thread(self._read_file, file_path)
+                if content is None:
+                    return None
+            pattern_results = await asyncio.to_thread(self._analyze_python_native, file_path, content)
+            return await self._build_structure_analysis(pattern_results, file_path, plan, content)
             
         except Exception as e:
-            self.logger.error(f"AST-grep analysis failed: {e}")
+            self.logger.debug("Python AST analysis failed for %s: %s", file_path, e)
             return None
     
+    def _analyze_python_native(self, file_path: str,
+                               content: Optional[bytes] = None) -> Dict[str, List[str]]:
+        """
+        Collect the Python pattern matches from a single ``ast`` parse.
+        
+        Args:
+            file_path: Path to the Python file
+            content: File bytes, if already read
+            
+        Returns:
+            Matched source texts keyed like the ast-grep pattern names
+        """
+        if content is None:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+        source = content.decode('utf-8', errors='replace')
+        
+        pattern_results = defaultdict(list)
+        pattern_results.update(_visit_python_tree(ast.parse(source, filename=file_path), source))
+        return pattern_results
+    
+    async def _build_structure_analysis(self, pattern_results: Dict[str, List], file_path: str,
+                                        plan: _LanguagePlan,
+                                        content: Optional[bytes] = None) -> StructureAnalysis:
+        """Build a StructureAnalysis from pattern matches grouped by pattern name."""
+        
+        # Nothing matched (often a wrong language guess); skip the helpers entirely
+        if not any(pattern_results.values()):
+            return _EMPTY_ANALYSIS
+        
+        # Analyze results
+        imports_analysis = self._analyze_imports(pattern_results, plan)
+        class_metrics = self._analyze_classes(pattern_results)
+        if content is None:
+            content = await asyncio.to_thread(self._read_file, file_path)
+        framework_deps = self._analyze_framework_dependencies(content, plan)
+        config_patterns = self._analyze_config_patterns(pattern_results)
+        
+        # Calculate scores
+        complexity_score = self._calculate_complexity_score(pattern_results)
+        maintainability_score = self._calculate_maintainability_score(
+            imports_analysis, class_metrics, framework_deps
+        )
+        
+        return StructureAnalysis(
+            imports=imports_analysis,
+            class_metrics=class_metrics,
+            framework_dependencies=framework_deps,
+            config_patterns=tuple(config_patterns),
+            complexity_score=complexity_score,
+            maintainability_score=maintainability_score
+        )
+    
     async def _analyze_with_tree_sitter(self, file_path: str, language: str) -> StructureAnalysis:
         """Analyze code using Tree-sitter via UniversalCodeAnalyzer."""
         try:
-            # Use UniversalCodeAnalyzer to get comprehensive analysis
-            tree_sitter_result = self.tree_sitter_analyzer.analyze_file(file_path, language)
+            # Use UniversalCodeAnalyzer to get comprehensive analysis; it reads and
+            # parses the file synchronously, so keep it off the event loop
+            tree_sitter_result = await asyncio.to_thread(
+                self.tree_sitter_analyzer.analyze_file, file_path, language
+            )
             
             if not tree_sitter_result or not tree_sitter_result.get('success'):
-                return self._create_empty_analysis()
+                return _EMPTY_ANALYSIS
             
             # Convert Tree-sitter results to StructureAnalysis format
             return self._convert_tree_sitter_to_structure_analysis(tree_sitter_result, language)
             
         except Exception as e:
-            self.logger.error(f"Tree-sitter analysis failed: {e}")
-            return self._create_empty_analysis()
+            self.logger.error("Tree-sitter analysis failed: %s", e)
+            return _EMPTY_ANALYSIS
     
     def _convert_tree_sitter_to_structure_analysis(self, tree_sitter_result: Dict[str, Any], language: str) -> StructureAnalysis:
         """Convert UniversalCodeAnalyzer results to StructureAnalysis format."""
@@ -333,11 +1361,17 @@ class ASTGrepAnalyzer:
         imports_list = structure.get('imports', [])
         dependencies_list = structure.get('dependencies', [])
         
+        # Split relative (internal) from external dependencies in one pass
+        external_deps = []
+        internal_deps = []
+        for dep in dependencies_list:
+            (internal_deps if dep.startswith('.') else external_deps).append(dep)
+        
         # Create ImportAnalysis
         imports_analysis = ImportAnalysis(
-            imports=imports_list,
-            external_dependencies=[dep for dep in dependencies_list if not dep.startswith('.')],
-            internal_dependencies=[dep for dep in dependencies_list if dep.startswith('.')],
+            imports=tuple(imports_list),
+            external_dependencies=tuple(external_deps),
+            internal_dependencies=tuple(internal_deps),
             dependency_count=len(set(dependencies_list))
         )
         
@@ -363,7 +1397,7 @@ class ASTGrepAnalyzer:
             imports=imports_analysis,
             class_metrics=class_metrics,
             framework_dependencies=framework_deps,
-            config_patterns=config_patterns,
+            config_patterns=tuple(config_patterns),
             complexity_score=complexity_score,
             maintainability_score=maintainability_score
         )
@@ -378,16 +1412,39 @@ class ASTGrepAnalyzer:
         detected_frameworks = []
         framework_patterns = {}
         
-        lang_frameworks = self.framework_patterns.get(language.lower(), {})
+        plan = self._plan_for(language)
+        if plan is not None and plan.framework_ac is not None:
+            # One automaton pass per name; a pattern counts once for dependencies
+            # and once more for imports, as in the substring scan below
+            counts: Dict[str, int] = {}
+            for names in (dependencies, structure.get('imports', ())):
+                found = {value for name in names for _, value in plan.framework_ac.iter(name)}
+                for pattern, pattern_frameworks in found:
+                    for framework in pattern_frameworks:
+                        counts[framework] = counts.get(framework, 0) + 1
+            
+            for framework, _ in plan.framework_patterns:
+                if framework in counts:
+                    detected_frameworks.append(framework)
+                    framework_patterns[framework] = counts[framework]
+            
+            return FrameworkDependencies(
+                frameworks=tuple(detected_frameworks),
+                coupling_score=min(1.0, sum(counts.values()) / 10.0),
+                framework_specific_patterns=framework_patterns
+            )
         
-        for framework, patterns in lang_frameworks.items():
+        lang_frameworks = plan.framework_patterns if plan is not None else ()
+        imports = structure.get('imports')
+        
+        for framework, patterns in lang_frameworks:
             pattern_count = 0
             for pattern in patterns:
                 # Check in dependencies
                 if any(pattern in dep for dep in dependencies):
                     pattern_count += 1
                 # Check in imports if available
-                if 'imports' in structure and any(pattern in imp for imp in structure['imports']):
+                if imports is not None and any(pattern in imp for imp in imports):
                     pattern_count += 1
             
             if pattern_count > 0:
@@ -399,7 +1456,7 @@ class ASTGrepAnalyzer:
         coupling_score = min(1.0, total_patterns / 10.0)
         
         return FrameworkDependencies(
-            frameworks=detected_frameworks,
+            frameworks=tuple(detected_frameworks),
             coupling_score=coupling_score,
             framework_specific_patterns=framework_patterns
         )
@@ -409,15 +1466,19 @@ class ASTGrepAnalyzer:
         config_patterns = []
         
         # Check for common configuration patterns in dependencies
-        dependencies = structure.get('dependencies', [])
-        config_keywords = ['config', 'setting', 'env', 'secret', 'cfg', 'conf']
-        
-        for dep in dependencies:
-            if any(keyword in dep.lower() for keyword in config_keywords):
+        for dep in structure.get('dependencies', []):
+            if self._has_config_keyword(dep):
                 config_patterns.append(dep)
         
         return config_patterns
     
+    def _has_config_keyword(self, text: str) -> bool:
+        """Check whether text mentions any configuration keyword (case-insensitive)."""
+        lowered = text.lower()
+        if self._config_keyword_ac is not None:
+            return next(self._config_keyword_ac.iter(lowered), None) is not None
+        return any(keyword in lowered for keyword in _CONFIG_KEYWORDS)
+    
     def assess_adaptation_effort(self, structure_analysis: StructureAnalysis) -> AdaptationScore:
         """
         Estimate how much work needed to integrate this code.
@@ -436,10 +1497,21 @@ class ASTGrepAnalyzer:
         }
         
         # Calculate weighted adaptation effort score
-        effort_score = self._calculate_weighted_score(factors, self.adaptation_weights)
+        
+        # Factor values in weight order, as a float array for the compiled kernel
+        values = [float(factors.get(name, 0.0)) for name in self._weight_names]
+        if np is not None:
+            values = np.array(values, dtype=np.float64)
+        effort_score = float(self._run_kernel(_weighted_score_kernel, values, self._weight_values))
         
         # Estimate integration time based on complexity factors
-        estimated_hours = self._estimate_integration_time(factors)
+        estimated_hours = int(self._run_kernel(
+            _integration_time_kernel,
+            float(factors['dependency_count']),
+            float(factors['class_complexity']),
+            float(factors['framework_coupling']),
+            float(factors['configuration_requirements'])
+        ))
         
         return AdaptationScore(
             overall_effort=effort_score,
@@ -447,81 +1519,157 @@ class ASTGrepAnalyzer:
             complexity_factors=factors
         )
     
-    async def _run_astgrep_pattern(self, file_path: str, pattern: str, language: str) -> List[Dict[str, Any]]:
-        """Run ast-grep with a specific pattern."""
+    def _build_rule_file(self, language: str, lang_patterns: Dict[str, Dict[str, str]]) -> str:
+        """
+        Write an ast-grep rule file containing one rule per pattern.
         
-        cmd = [
-            'ast-grep',
-            '--pattern', pattern,
-            '--lang', language,
-            '--json',
-            file_path
+        Args:
+            language: Programming language the rules apply to
+            lang_patterns: Pattern configurations keyed by pattern name
+            
+        Returns:
+            Path to the generated rule file
+        """
+        # JSON strings are valid YAML scalars, so patterns need no extra escaping
+        rules = [
+            f"id: {pattern_name}\n"
+            f"language: {language}\n"
+            f"rule:\n"
+            f"  pattern: {json.dumps(pattern_config['pattern'])}\n"
+            for pattern_name, pattern_config in lang_patterns.items()
         ]
         
-        try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+        rules_path = os.path.join(self._rules_dir, f'{language}.yml')
+        with open(rules_path, 'w', encoding='utf-8') as rule_file:
+            rule_file.write('---\n'.join(rules))
+        
+        return rules_path
+    
+    def _get_rule_file(self, language: str, lang_patterns: Dict[str, Dict[str, str]]) -> str:
+        """Get the rule file for a language, writing it on first use."""
+        
+        rules_path = self._rule_files.get(language)
+        if rules_path is None:
+            if self._rules_dir is None:
+                self._rules_dir = tempfile.mkdtemp(prefix='astgrep_rules_')
+                atexit.register(shutil.rmtree, self._rules_dir, ignore_errors=True)
+            rules_path = self._build_rule_file(language, lang_patterns)
+            self._rule_files[language] = rules_path
+        return rules_path
+    
+    async def _run_astgrep_scan(self, file_path: str, plan: _LanguagePlan) -> Dict[str, List[str]]:
+        """
+        Run every pattern for a language over a file in one ast-grep scan.
+        
+        Args:
+            file_path: Path to the file to scan
+            plan: Language plan whose patterns make up the rule pack
             
-            stdout, stderr = await process.communicate()
+        Returns:
+            Matched source texts grouped by pattern name (the rule id)
+        """
+        rules_path = self._get_rule_file(plan.language, plan.patterns)
+        
+        pattern_results = defaultdict(list)
+        for match in await self._scanner.query(file_path, rules_path):
+            rule_id = match.get('ruleId')
+            if rule_id in plan.patterns:
+                pattern_results[rule_id].append(match.get('text', ''))
+        
+        return pattern_results
+    
+    def _match_in_process(self, content: bytes, plan: _LanguagePlan) -> Dict[str, List[str]]:
+        """
+        Run every pattern for a language over file content with the ast-grep binding.
+        
+        The source is parsed once and each pattern is matched against the same tree.
+        Matches are memoized by content digest and pattern, so rescanning unchanged
+        content (after a fallback, or from combined analysis) skips the parse entirely.
+        
+        Args:
+            content: Raw file content
+            plan: Language plan whose patterns are matched
+        
+        Returns:
+            Matched source texts grouped by pattern name, as from the CLI scan
+        """
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        root = None
+        
+        pattern_results = defaultdict(list)
+        for pattern_name, pattern_config in plan.patterns.items():
+            memo_key = (digest, plan.language, pattern_config['pattern'])
+            with self._match_cache_lock:
+                matches = self._match_cache.get(memo_key)
+                if matches is not None:
+                    self._match_cache.move_to_end(memo_key)
             
-            if process.returncode == 0:
-                output = stdout.decode('utf-8')
-                if output.strip():
-                    return json.loads(output)
-            else:
-                self.logger.debug(f"ast-grep pattern failed: {stderr.decode()}")
+            if matches is None:
+                if root is None:
+                    root = SgRoot(content.decode('utf-8', errors='replace'), plan.language).root()
+                try:
+                    nodes = root.find_all(pattern=pattern_config['pattern'])
+                except Exception as e:
+                    # An invalid pattern only loses its own matches
+                    self.logger.debug("ast-grep pattern %s failed: %s", pattern_name, e)
+                    continue
+                matches = tuple(node.text() for node in nodes)
                 
-        except Exception as e:
-            self.logger.error(f"Error running ast-grep: {e}")
+                with self._match_cache_lock:
+                    self._match_cache[memo_key] = matches
+                    if len(self._match_cache) > self.max_cached_matches:
+                        self._match_cache.popitem(last=False)
+            
+            pattern_results[pattern_name] = list(matches)
         
-        return []
+        return pattern_results
     
-    def _analyze_imports(self, pattern_results: Dict[str, List], language: str) -> ImportAnalysis:
+    def _analyze_imports(self, pattern_results: Dict[str, List], plan: _LanguagePlan) -> ImportAnalysis:
         """Analyze import statements."""
         
-        all_imports = []
+        language = plan.language
         
         # Collect imports from different pattern types
-        if 'imports' in pattern_results:
-            all_imports.extend(pattern_results['imports'])
-        if 'from_imports' in pattern_results:
-            all_imports.extend(pattern_results['from_imports'])
-        if 'require_imports' in pattern_results:
-            all_imports.extend(pattern_results['require_imports'])
-        
-        # Extract import names
+        all_imports = (
+            pattern_results['imports']
+            + pattern_results['from_imports']
+            + pattern_results['require_imports']
+        )
+        if not all_imports:
+            return _EMPTY_IMPORTS
+        
+        # Extract and categorize import names in one pass, deduplicating
+        # dependencies in first-seen order
+        parser = _IMPORT_PARSERS.get(language)
+        if parser is None:
+            return _EMPTY_IMPORTS
         import_names = []
-        for imp in all_imports:
-            # Extract import name from match text
-            text = imp.get('text', '')
-            if text:
-                import_names.extend(self._extract_import_names(text, language))
-        
-        # Categorize imports
-        external_deps = []
-        internal_deps = []
+        external_deps = {}
+        internal_deps = {}
         
-        for imp_name in import_names:
-            if self._is_external_dependency(imp_name, language):
-                external_deps.append(imp_name)
-            else:
-                internal_deps.append(imp_name)
+        for text in all_imports:
+            # Extract import name from match text
+            if not text:
+                continue
+            for imp_name in parser(text):
+                import_names.append(imp_name)
+                if _is_external(imp_name, language):
+                    external_deps[imp_name] = None
+                else:
+                    internal_deps[imp_name] = None
         
         return ImportAnalysis(
-            imports=import_names,
-            external_dependencies=list(set(external_deps)),
-            internal_dependencies=list(set(internal_deps)),
-            dependency_count=len(set(external_deps))
+            imports=tuple(import_names),
+            external_dependencies=tuple(external_deps),
+            internal_dependencies=tuple(internal_deps),
+            dependency_count=len(external_deps)
         )
     
     def _analyze_classes(self, pattern_results: Dict[str, List]) -> ClassMetrics:
         """Analyze class definitions."""
         
-        classes = pattern_results.get('class_definitions', [])
-        methods = pattern_results.get('method_definitions', []) + pattern_results.get('function_definitions', [])
+        classes = pattern_results['class_definitions']
+        methods = pattern_results['method_definitions'] + pattern_results['function_definitions']
         
         class_count = len(classes)
         method_count = len(methods)
@@ -534,8 +1682,7 @@ class ASTGrepAnalyzer:
         
         # Estimate inheritance depth (simplified)
         inheritance_depth = 1  # Default depth
-        for cls in classes:
-            text = cls.get('text', '')
+        for text in classes:
             if 'extends' in text or '(' in text:  # Has inheritance
                 inheritance_depth = max(inheritance_depth, 2)
         
@@ -546,37 +1693,47 @@ class ASTGrepAnalyzer:
             inheritance_depth=inheritance_depth
         )
     
-    def _analyze_framework_dependencies(self, file_path: str, language: str) -> FrameworkDependencies:
-        """Analyze framework dependencies by reading file content."""
+    def _analyze_framework_dependencies(self, content: Optional[bytes], plan: _LanguagePlan) -> FrameworkDependencies:
+        """Analyze framework dependencies in file content."""
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            self.logger.error(f"Error reading file {file_path}: {e}")
-            return FrameworkDependencies([], 0.0, {})
+        if not content:
+            return FrameworkDependencies((), 0.0, {})
         
         detected_frameworks = []
         framework_patterns = {}
-        
-        lang_frameworks = self.framework_patterns.get(language.lower(), {})
-        
-        for framework, patterns in lang_frameworks.items():
-            pattern_count = 0
-            for pattern in patterns:
-                if pattern in content:
-                    pattern_count += 1
+        automaton = plan.framework_ac
+        
+        if automaton is not None:
+            # Single pass over the content; each distinct pattern counts once
+            found = {value for _, value in automaton.iter(content.decode('utf-8', errors='replace'))}
+            counts: Dict[str, int] = {}
+            for pattern, pattern_frameworks in found:
+                for framework in pattern_frameworks:
+                    counts[framework] = counts.get(framework, 0) + 1
             
-            if pattern_count > 0:
-                detected_frameworks.append(framework)
-                framework_patterns[framework] = pattern_count
+            # Keep the configured framework order
+            for framework, _ in plan.framework_patterns:
+                if framework in counts:
+                    detected_frameworks.append(framework)
+                    framework_patterns[framework] = counts[framework]
+        else:
+            # Search the raw bytes directly; nothing is decoded
+            for framework, patterns in plan.framework_patterns_b:
+                pattern_count = 0
+                for pattern in patterns:
+                    if content.find(pattern) != -1:
+                        pattern_count += 1
+                
+                if pattern_count > 0:
+                    detected_frameworks.append(framework)
+                    framework_patterns[framework] = pattern_count
         
         # Calculate coupling score (0-1, higher means more tightly coupled)
         total_patterns = sum(framework_patterns.values())
         coupling_score = min(1.0, total_patterns / 10.0)  # Normalize to 0-1
         
         return FrameworkDependencies(
-            frameworks=detected_frameworks,
+            frameworks=tuple(detected_frameworks),
             coupling_score=coupling_score,
             framework_specific_patterns=framework_patterns
         )
@@ -584,12 +1741,11 @@ class ASTGrepAnalyzer:
     def _analyze_config_patterns(self, pattern_results: Dict[str, List]) -> List[str]:
         """Analyze configuration patterns."""
         
-        config_matches = pattern_results.get('config_patterns', [])
+        config_matches = pattern_results['config_patterns']
         config_items = []
         
-        for match in config_matches:
-            text = match.get('text', '')
-            if text and any(keyword in text.lower() for keyword in ['config', 'setting', 'env', 'secret']):
+        for text in config_matches:
+            if text and self._config_kw_re.search(text):
                 config_items.append(text)
         
         return config_items
@@ -598,189 +1754,117 @@ class ASTGrepAnalyzer:
         """Calculate complexity score based on structural elements."""
         
         # Count various structural elements
-        classes = len(pattern_results.get('class_definitions', []))
-        functions = len(pattern_results.get('function_definitions', []))
-        methods = len(pattern_results.get('method_definitions', []))
+        classes = len(pattern_results['class_definitions'])
+        functions = len(pattern_results['function_definitions'])
+        methods = len(pattern_results['method_definitions'])
         
         # Simple complexity calculation
-        total_elements = classes + functions + methods
-        
-        if total_elements == 0:
-            return 0.0
-        elif total_elements <= 5:
-            return 0.2  # Low complexity
-        elif total_elements <= 15:
-            return 0.5  # Medium complexity
-        elif total_elements <= 30:
-            return 0.8  # High complexity
-        else:
-            return 1.0  # Very high complexity
+        return _complexity_bucket(classes + functions + methods)
     
     def _calculate_maintainability_score(self, imports: ImportAnalysis, 
                                        classes: ClassMetrics, 
                                        frameworks: FrameworkDependencies) -> float:
         """Calculate maintainability score."""
         
-        score = 1.0
-        
-        # Penalty for too many dependencies
-        if imports.dependency_count > 20:
-            score -= 0.3
-        elif imports.dependency_count > 10:
-            score -= 0.1
-        
-        # Penalty for high class complexity
-        if classes.average_complexity > 10:
-            score -= 0.3
-        elif classes.average_complexity > 5:
-            score -= 0.1
+        return float(self._run_kernel(
+            _maintainability_kernel,
+            float(imports.dependency_count),
+            float(classes.average_complexity),
+            float(frameworks.coupling_score)
+        ))
+    
+    def _run_kernel(self, kernel: Callable, *args) -> Any:
+        """Call a scoring kernel, compiled when available, else its Python version."""
+        compiled = self._compiled_kernels.get(kernel)
+        if compiled is not None:
+            try:
+                return compiled(*args)
+            except Exception as e:
+                # JIT compilation failed; degrade to the Python kernel for this and later calls
+                self.logger.warning("Compiled %s failed, falling back to Python: %s", kernel.__name__, e)
+                del self._compiled_kernels[kernel]
+        return kernel(*args)
+    
+    def score_analyses(self, analyses: List[StructureAnalysis]) -> Tuple[List[float], List[float]]:
+        """
+        Recompute complexity and maintainability scores for many analyses in one batch.
         
-        # Penalty for high framework coupling
-        if frameworks.coupling_score > 0.8:
-            score -= 0.2
-        elif frameworks.coupling_score > 0.5:
-            score -= 0.1
+        Args:
+            analyses: Structure analyses, e.g. one per file of a repository
+            
+        Returns:
+            Tuple of (complexity_scores, maintainability_scores), one entry per analysis
+        """
+        if not analyses:
+            return [], []
+        
+        # Single pass to gather the per-file metrics as columns
+        dep_counts, complexities, couplings, total_elements = zip(*(
+            (
+                analysis.imports.dependency_count,
+                analysis.class_metrics.average_complexity,
+                analysis.framework_dependencies.coupling_score,
+                analysis.class_metrics.class_count + analysis.class_metrics.method_count
+            )
+            for analysis in analyses
+        ))
         
-        return max(0.0, score)
+        complexity_scores, maintainability_scores = batch_score(
+            dep_counts, complexities, couplings, total_elements
+        )
+        return [float(score) for score in complexity_scores], [float(score) for score in maintainability_scores]
     
     def _extract_import_names(self, import_text: str, language: str) -> List[str]:
         """Extract import names from import statement text."""
         
-        import_names = []
-        
-        if language.lower() == 'python':
-            if import_text.startswith('import '):
-                # Handle "import module" or "import module as alias"
-                parts = import_text.replace('import ', '').split(' as ')[0].split(',')
-                import_names.extend([part.strip() for part in parts])
-            elif import_text.startswith('from '):
-                # Handle "from module import names"
-                if ' import ' in import_text:
-                    module_part = import_text.split(' import ')[0].replace('from ', '').strip()
-                    import_names.append(module_part)
-        
-        elif language.lower() == 'javascript':
-            if 'import ' in import_text and ' from ' in import_text:
-                # Handle "import names from 'module'"
-                module_part = import_text.split(' from ')[-1].strip().strip('\'"')
-                import_names.append(module_part)
-            elif 'require(' in import_text:
-                # Handle "const name = require('module')"
-                start = import_text.find('require(') + 8
-                end = import_text.find(')', start)
-                if end > start:
-                    module_name = import_text[start:end].strip('\'"')
-                    import_names.append(module_name)
-        
-        elif language.lower() == 'java':
-            if import_text.startswith('import '):
-                # Handle "import package.Class;"
-                import_name = import_text.replace('import ', '').replace(';', '').strip()
-                import_names.append(import_name)
-        
-        return import_names
+        parser = _IMPORT_PARSERS.get(language) or _IMPORT_PARSERS.get(language.lower())
+        return parser(import_text) if parser else []
     
     def _is_external_dependency(self, import_name: str, language: str) -> bool:
         """Determine if an import is an external dependency."""
         
-        # Standard library modules (simplified detection)
-        stdlib_modules = {
-            'python': ['os', 'sys', 'json', 'datetime', 'collections', 'itertools', 'functools', 'typing'],
-            'javascript': ['fs', 'path', 'http', 'https', 'url', 'util', 'crypto'],
-            'java': ['java.util', 'java.io', 'java.lang', 'java.net', 'java.time']
-        }
-        
-        std_modules = stdlib_modules.get(language.lower(), [])
-        
-        # Check if it's a standard library module
-        for std_module in std_modules:
-            if import_name.startswith(std_module):
-                return False
-        
-        # Check if it's a relative import (internal)
-        if import_name.startswith('.') or import_name.startswith('./') or import_name.startswith('../'):
-            return False
-        
-        # Otherwise, assume it's external
-        return True
+        if language not in _STDLIB_SETS:
+            language = language.lower()
+        return _is_external(import_name, language)
     
     def _calculate_weighted_score(self, factors: Dict[str, Any], weights: Dict[str, float]) -> float:
         """Calculate weighted score from factors."""
         
-        total_score = 0.0
-        total_weight = 0.0
-        
-        for factor_name, factor_value in factors.items():
-            weight = weights.get(factor_name, 0.0)
-            if weight > 0:
-                # Normalize factor value to 0-1 range
-                normalized_value = min(1.0, factor_value / 10.0)
-                total_score += normalized_value * weight
-                total_weight += weight
-        
-        if total_weight > 0:
-            return total_score / total_weight
-        else:
-            return 0.0
+        names = list(factors)
+        return float(_weighted_score_kernel(
+            [float(factors[name]) for name in names],
+            [weights.get(name, 0.0) for name in names]
+        ))
     
     def _estimate_integration_time(self, factors: Dict[str, Any]) -> int:
         """Estimate integration time in hours."""
         
-        base_hours = 2  # Minimum time
-        
-        # Add time based on complexity factors
-        dependency_hours = min(8, factors.get('dependency_count', 0) * 0.5)
-        complexity_hours = min(12, factors.get('class_complexity', 0) * 2)
-        coupling_hours = min(6, factors.get('framework_coupling', 0) * 10)
-        config_hours = min(4, factors.get('configuration_requirements', 0) * 0.5)
-        
-        total_hours = base_hours + dependency_hours + complexity_hours + coupling_hours + config_hours
-        
-        return int(total_hours)
+        return int(self._run_kernel(
+            _integration_time_kernel,
+            float(factors.get('dependency_count', 0)),
+            float(factors.get('class_complexity', 0)),
+            float(factors.get('framework_coupling', 0)),
+            float(factors.get('configuration_requirements', 0))
+        ))
     
-    def _get_file_extensions(self, language: str) -> List[str]:
+    def _get_file_extensions(self, language: str) -> Tuple[str, ...]:
         """Get file extensions for language."""
-        
-        extensions = {
-            'python': ['py', 'pyw'],
-            'javascript': ['js', 'jsx', 'ts', 'tsx'],
-            'java': ['java'],
-            'go': ['go'],
-            'rust': ['rs'],
-            'php': ['php'],
-            'ruby': ['rb'],
-            'c': ['c', 'h'],
-            'cpp': ['cpp', 'cxx', 'cc', 'hpp']
-        }
-        
-        return extensions.get(language.lower(), ['py'])  # Default to Python
+        return _LANG_EXTENSIONS.get(language.lower(), _DEFAULT_EXTENSIONS)
     
-    def _should_analyze_file(self, file_path: Path) -> bool:
+    def _should_analyze_file(self, file_path: Union[str, Path]) -> bool:
         """Determine if file should be analyzed."""
         
         # Skip test files, build files, etc.
-        skip_patterns = [
-            'test_', '_test.', 'tests/', '__pycache__/', 'node_modules/',
-            '.git/', 'build/', 'dist/', '.pytest_cache/', 'coverage/'
-        ]
-        
-        file_str = str(file_path)
-        return not any(pattern in file_str for pattern in skip_patterns)
+        file_str = file_path if isinstance(file_path, str) else str(file_path)
+        return _SKIP_RE.search(file_str) is None
     
     def _create_empty_analysis(self) -> StructureAnalysis:
-        """Create empty analysis for failed cases."""
-        
-        return StructureAnalysis(
-            imports=ImportAnalysis([], [], [], 0),
-            class_metrics=ClassMetrics(0, 0.0, 0, 1),
-            framework_dependencies=FrameworkDependencies([], 0.0, {}),
-            config_patterns=[],
-            complexity_score=0.0,
-            maintainability_score=0.5
-        )
+        """Return the shared empty analysis for failed cases."""
+        return _EMPTY_ANALYSIS
     
     async def _enhance_with_context7(self, base_analysis: StructureAnalysis,
-                                   file_path: str, language: str) -> Optional[StructureAnalysis]:
+                                   file_path: str, language: str,
+                                   content: Optional[bytes] = None) -> StructureAnalysis:
         """
         Enhance AST-grep analysis with Context7 insights.
         
@@ -788,38 +1872,60 @@ class ASTGrepAnalyzer:
             base_analysis: Base analysis from AST-grep or Tree-sitter
             file_path: Path to file being analyzed
             language: Programming language
+            content: File bytes, if already read
             
         Returns:
-            Enhanced StructureAnalysis with Context7 insights, or None if enhancement fails
+            Enhanced StructureAnalysis with Context7 insights, or the base analysis
+            unchanged if Context7 is unavailable or fails
         """
         if not self.context7_analyzer or not os.path.exists(file_path):
-            return None
+            return base_analysis
         
         try:
-            self.logger.debug(f"Enhancing analysis with Context7 for {file_path}")
+            self.logger.debug("Enhancing analysis with Context7 for %s", file_path)
             
-            # Perform Context7 analysis
-            context7_result = await self.context7_analyzer.analyze_file(
-                file_path, language, ['structure', 'api', 'security']
-            )
+            # Perform Context7 analysis, reusing the result for unchanged content
+            context7_result = await self._cached_context7(file_path, language, _CONTEXT7_ASPECTS, content)
             
             if not context7_result or not context7_result.success:
-                return None
-            
+                return base_analysis
+        
+        except Exception as e:
+            self.logger.warning("Failed to enhance analysis with Context7 for %s: %s", file_path, e)
+            return base_analysis
+        
+        return self._apply_context7(base_analysis, context7_result, file_path)
+    
+    def _apply_context7(self, base_analysis: StructureAnalysis, context7_result: Any,
+                        file_path: str) -> StructureAnalysis:
+        """
+        Apply a successful Context7 result's insights to a base analysis.
+        
+        Args:
+            base_analysis: Base analysis from AST-grep or Tree-sitter
+            context7_result: Successful Context7AnalysisResult for the same file
+            file_path: Path to file being analyzed
+        
+        Returns:
+            Enhanced StructureAnalysis, or the base analysis unchanged if applying
+            the insights fails
+        """
+        original_analysis = base_analysis
+        try:
             # Enhance base analysis with Context7 insights
-            
+
             # Update complexity score with Context7 insights
             if context7_result.insights:
                 context7_complexity = context7_result.insights.get('complexity_score', 0.0)
-                # Weighted average of base and Context7 complexity
-                base_analysis.complexity_score = (
-                    base_analysis.complexity_score * 0.6 + context7_complexity * 0.4
-                )
-                
-                # Update maintainability score
                 context7_maintainability = context7_result.insights.get('maintainability_index', 0.5)
-                base_analysis.maintainability_score = (
-                    base_analysis.maintainability_score * 0.7 + context7_maintainability * 0.3
+                
+                # Weighted average of base and Context7 complexity and maintainability
+                base_analysis = replace(
+                    base_analysis,
+                    complexity_score=base_analysis.complexity_score * 0.6 + context7_complexity * 0.4,
+                    maintainability_score=(
+                        base_analysis.maintainability_score * 0.7 + context7_maintainability * 0.3
+                    )
                 )
             
             # Add API validation insights to framework dependencies
@@ -829,67 +1935,79 @@ class ASTGrepAnalyzer:
                 enhanced_patterns = base_analysis.framework_dependencies.framework_specific_patterns.copy()
                 enhanced_coupling = base_analysis.framework_dependencies.coupling_score
                 
+                seen_frameworks = set(enhanced_frameworks)
+                
                 # Add API-specific frameworks
                 for validation in context7_result.api_validations:
                     framework_name = f"api_{validation.api_name}"
-                    if framework_name not in enhanced_frameworks:
+                    if framework_name not in seen_frameworks:
+                        seen_frameworks.add(framework_name)
                         enhanced_frameworks.append(framework_name)
                         enhanced_patterns[framework_name] = 1
                     
                     # Adjust coupling based on validation status
-                    if validation.validation_status == 'warning':
-                        enhanced_coupling = min(1.0, enhanced_coupling + 0.1)
-                    elif validation.validation_status == 'invalid':
-                        enhanced_coupling = min(1.0, enhanced_coupling + 0.2)
+                    coupling_delta = _VALIDATION_COUPLING.get(validation.validation_status)
+                    if coupling_delta is not None:
+                        enhanced_coupling = min(1.0, enhanced_coupling + coupling_delta)
                 
-                base_analysis.framework_dependencies = FrameworkDependencies(
-                    frameworks=enhanced_frameworks,
-                    coupling_score=enhanced_coupling,
-                    framework_specific_patterns=enhanced_patterns
+                base_analysis = replace(
+                    base_analysis,
+                    framework_dependencies=FrameworkDependencies(
+                        frameworks=tuple(enhanced_frameworks),
+                        coupling_score=enhanced_coupling,
+                        framework_specific_patterns=enhanced_patterns
+                    )
                 )
             
             # Add configuration patterns from Context7
             if context7_result.code_issues:
-                config_keywords = ['config', 'setting', 'env', 'secret', 'cfg', 'conf']
-                context7_config_patterns = []
-                
-                for issue in context7_result.code_issues:
-                    if any(keyword in issue.get('message', '').lower() for keyword in config_keywords):
-                        context7_config_patterns.append(issue.get('message', ''))
+                context7_config_patterns = (
+                    message
+                    for message in (issue.get('message', '') for issue in context7_result.code_issues)
+                    if self._has_config_keyword(message)
+                )
+                first_pattern = next(context7_config_patterns, None)
                 
-                if context7_config_patterns:
-                    # Merge with existing config patterns
-                    existing_patterns = set(base_analysis.config_patterns)
-                    merged_patterns = list(existing_patterns.union(set(context7_config_patterns)))
-                    base_analysis.config_patterns = merged_patterns[:10]  # Limit to 10 patterns
+                if first_pattern is not None:
+                    # Merge with existing config patterns, deduplicated in first-seen order;
+                    # the remaining issues are only filtered until the limit is reached
+                    merged_patterns = dict.fromkeys(base_analysis.config_patterns)
+                    merged_patterns.setdefault(first_pattern)
+                    for pattern in context7_config_patterns:
+                        if len(merged_patterns) >= 10:
+                            break
+                        merged_patterns.setdefault(pattern)
+                    base_analysis = replace(
+                        base_analysis, config_patterns=tuple(merged_patterns)[:10]  # Limit to 10 patterns
+                    )
             
-            # Add insights as additional components
+            # Record which kinds of insight Context7 contributed
             if context7_result.insights:
-                enhanced_components = list(base_analysis.imports.imports)
+                context7_flags = list(base_analysis.context7_flags)
                 
-                # Add Context7-specific insights as components
-                if 'performance' in str(context7_result.insights).lower():
-                    enhanced_components.append('performance_analysis_performed')
-                if 'security' in str(context7_result.insights).lower():
-                    enhanced_components.append('security_analysis_performed')
+                # Render the insights once for both keyword checks
+                insights_text = str(context7_result.insights).lower()
+                if 'performance' in insights_text:
+                    context7_flags.append('performance_analysis_performed')
+                if 'security' in insights_text:
+                    context7_flags.append('security_analysis_performed')
                 if context7_result.recommendations:
-                    enhanced_components.append('context7_recommendations_available')
+                    context7_flags.append('context7_recommendations_available')
                 
-                # Update imports to include these insights (hack to store additional info)
-                base_analysis.imports.imports = enhanced_components
+                base_analysis = replace(base_analysis, context7_flags=tuple(context7_flags))
             
             # Boost confidence based on Context7 analysis
             if context7_result.confidence_score > 0.7:
                 # This is a hack since StructureAnalysis doesn't have confidence
                 # In a real implementation, we'd add this field
-                self.logger.debug(f"Context7 confidence boost: {context7_result.confidence_score}")
+                self.logger.debug("Context7 confidence boost: %s", context7_result.confidence_score)
             
-            self.logger.debug(f"Enhanced analysis with Context7 insights for {file_path}")
+            self.logger.debug("Enhanced analysis with Context7 insights for %s", file_path)
             return base_analysis
             
         except Exception as e:
-            self.logger.warning(f"Failed to enhance analysis with Context7 for {file_path}: {e}")
-            return None
+            self.logger.warning("Failed to enhance analysis with Context7 for %s: %s", file_path, e)
+            return original_analysis
     
     async def combined_analysis(self, file_path: str, language: str) -> Dict[str, Any]:
         """
@@ -903,7 +2021,7 @@ class ASTGrepAnalyzer:
             Dictionary containing combined analysis results from all methods
         """
         try:
-            self.logger.info(f"Performing combined analysis for {file_path}")
+            self.logger.info("Performing combined analysis for %s", file_path)
             
             # Initialize result dictionary
             combined_result = {
@@ -917,64 +2035,68 @@ class ASTGrepAnalyzer:
             }
             
             # Get timestamp
-            from datetime import datetime
             combined_result['analysis_timestamp'] = datetime.now().isoformat()
             
-            # Perform AST-grep analysis
-            if await self._is_astgrep_available():
-                try:
-                    astgrep_result = await self._analyze_with_astgrep(file_path, language)
-                    if astgrep_result and astgrep_result != self._create_empty_analysis():
-                        combined_result['astgrep_analysis'] = {
-                            'complexity_score': astgrep_result.complexity_score,
-                            'maintainability_score': astgrep_result.maintainability_score,
-                            'dependency_count': astgrep_result.imports.dependency_count,
-                            'class_count': astgrep_result.class_metrics.class_count,
-                            'frameworks': astgrep_result.framework_dependencies.frameworks,
-                            'success': True
-                        }
-                except Exception as e:
-                    self.logger.warning(f"AST-grep analysis failed: {e}")
+            # Read once; every sub-analysis below shares the bytes
+            content = await asyncio.to_thread(self._read_file, file_path)
+            # The three analyses are independent, so run them concurrently; a failing
+            # slot is logged and left empty without aborting the others
+            # (Python is parsed in-process, as in analyze_code_structure; other
+            # languages are skipped when ast-grep is unavailable)
+            astgrep_result, tree_sitter_result, context7_result = await asyncio.gather(
+                self._analyze_patterns(file_path, language, content),
+                self._analyze_with_tree_sitter(file_path, language) if self.tree_sitter_analyzer else _none(),
+                self._cached_context7(file_path, language, _CONTEXT7_ASPECTS, content)
+                if self.context7_analyzer else _none(),
+                return_exceptions=True
+            )
             
-            # Perform Tree-sitter analysis
-            if self.tree_sitter_analyzer:
-                try:
-                    tree_sitter_result = await self._analyze_with_tree_sitter(file_path, language)
-                    if tree_sitter_result and tree_sitter_result != self._create_empty_analysis():
-                        combined_result['tree_sitter_analysis'] = {
-                            'complexity_score': tree_sitter_result.complexity_score,
-                            'maintainability_score': tree_sitter_result.maintainability_score,
-                            'dependency_count': tree_sitter_result.imports.dependency_count,
-                            'class_count': tree_sitter_result.class_metrics.class_count,
-                            'frameworks': tree_sitter_result.framework_dependencies.frameworks,
-                            'success': True
-                        }
-                except Exception as e:
-                    self.logger.warning(f"Tree-sitter analysis failed: {e}")
+            if isinstance(astgrep_result, Exception):
+                self.logger.warning("AST-grep analysis failed: %s", astgrep_result)
+                astgrep_result = None
+            elif astgrep_result and astgrep_result is not _EMPTY_ANALYSIS:
+                combined_result['astgrep_analysis'] = {
+                    'complexity_score': astgrep_result.complexity_score,
+                    'maintainability_score': astgrep_result.maintainability_score,
+                    'dependency_count': astgrep_result.imports.dependency_count,
+                    'class_count': astgrep_result.class_metrics.class_count,
+                    'frameworks': astgrep_result.framework_dependencies.frameworks,
+                    'success': True
+                }
             
-            # Perform Context7 analysis
-            if self.context7_analyzer:
-                try:
-                    context7_result = await self.context7_analyzer.analyze_file(
-                        file_path, language, ['structure', 'api', 'security']
-                    )
-                    if context7_result and context7_result.success:
-                        combined_result['context7_analysis'] = {
-                            'complexity_score': context7_result.insights.get('complexity_score', 0.0),
-                            'maintainability_score': context7_result.insights.get('maintainability_index', 0.5),
-                            'api_validations': len(context7_result.api_validations),
-                            'code_issues': len(context7_result.code_issues),
-                            'recommendations': len(context7_result.recommendations),
-                            'confidence_score': context7_result.confidence_score,
-                            'success': True
-                        }
-                except Exception as e:
-                    self.logger.warning(f"Context7 analysis failed: {e}")
+            if isinstance(tree_sitter_result, Exception):
+                self.logger.warning("Tree-sitter analysis failed: %s", tree_sitter_result)
+                tree_sitter_result = None
+            elif tree_sitter_result and tree_sitter_result is not _EMPTY_ANALYSIS:
+                combined_result['tree_sitter_analysis'] = {
+                    'complexity_score': tree_sitter_result.complexity_score,
+                    'maintainability_score': tree_sitter_result.maintainability_score,
+                    'dependency_count': tree_sitter_result.imports.dependency_count,
+                    'class_count': tree_sitter_result.class_metrics.class_count,
+                    'frameworks': tree_sitter_result.framework_dependencies.frameworks,
+                    'success': True
+                }
             
-            # Perform merged analysis
+            if isinstance(context7_result, Exception):
+                self.logger.warning("Context7 analysis failed: %s", context7_result)
+                context7_result = None
+            elif context7_result and context7_result.success:
+                combined_result['context7_analysis'] = {
+                    'complexity_score': context7_result.insights.get('complexity_score', 0.0),
+                    'maintainability_score': context7_result.insights.get('maintainability_index', 0.5),
+                    'api_validations': len(context7_result.api_validations),
+                    'code_issues': len(context7_result.code_issues),
+                    'recommendations': len(context7_result.recommendations),
+                    'confidence_score': context7_result.confidence_score,
+                    'success': True
+                }
+
+            # Merge the sub-results above instead of re-running every analyzer
             try:
-                merged_analysis = await self.analyze_code_structure(file_path, language)
-                if merged_analysis and merged_analysis != self._create_empty_analysis():
+                merged_analysis = self._merge_analyses(
+                    astgrep_result, tree_sitter_result, context7_result, file_path
+                )
+                if merged_analysis and merged_analysis is not _EMPTY_ANALYSIS:
                     combined_result['merged_analysis'] = {
                         'complexity_score': merged_analysis.complexity_score,
                         'maintainability_score': merged_analysis.maintainability_score,
@@ -985,13 +2107,13 @@ class ASTGrepAnalyzer:
                         'success': True
                     }
             except Exception as e:
-                self.logger.warning(f"Merged analysis failed: {e}")
+                self.logger.warning("Merged analysis failed: %s", e)
             
-            self.logger.info(f"Combined analysis completed for {file_path}")
+            self.logger.info("Combined analysis completed for %s", file_path)
             return combined_result
             
         except Exception as e:
-            self.logger.error(f"Combined analysis failed for {file_path}: {e}")
+            self.logger.error("Combined analysis failed for %s: %s", file_path, e)
             return {
                 'file_path': file_path,
                 'language': language,
@@ -999,6 +2121,27 @@ class ASTGrepAnalyzer:
                 'analysis_timestamp': datetime.now().isoformat()
             }
     
+    async def combined_analysis_batch(self, files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Perform combined analysis on several files concurrently.
+        
+        At most ``max_concurrency`` files are analyzed at once, so their ast-grep,
+        Tree-sitter and Context7 work overlaps without flooding the services.
+        
+        Args:
+            files: (file_path, language) pairs to analyze
+        
+        Returns:
+            Combined analysis dictionaries, in the order of ``files``
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency or 8)
+        
+        async def analyze(file_path: str, language: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.combined_analysis(file_path, language)
+        
+        return await asyncio.gather(*(analyze(file_path, language) for file_path, language in files))
+    
     async def get_analysis_status(self) -> Dict[str, Any]:
         """Get status of all analysis methods."""
         return {
@@ -1008,38 +2151,68 @@ class ASTGrepAnalyzer:
             'tree_sitter_fallback_enabled': self.use_tree_sitter_fallback,
             'context7_enabled': self.enable_context7
         }
+    
+    async def aclose(self):
+        """Close the Context7 session and stop its server process, if one was started."""
+        if self.context7_analyzer is not None:
+            await self.context7_analyzer.aclose()
+    
+    async def __aenter__(self) -> 'ASTGrepAnalyzer':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+# Per-process analyzer and event loop used by analyze_files workers
+_worker_analyzer: Optional[ASTGrepAnalyzer] = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _analyze_in_worker(file_path: str, language: str, options: Dict[str, Any],
+                       rule_files: Dict[str, str]) -> StructureAnalysis:
+    """Analyze one file inside a worker process, reusing the worker's analyzer."""
+    global _worker_analyzer, _worker_loop
+    
+    if _worker_analyzer is None:
+        _worker_loop = asyncio.new_event_loop()
+        _worker_analyzer = ASTGrepAnalyzer(**options)
+    _worker_analyzer._rule_files.update(rule_files)
+    
+    return _worker_loop.run_until_complete(
+        _worker_analyzer.analyze_code_structure(file_path, language)
+    )
 
 
 # Example usage
 async def main():
-    analyzer = ASTGrepAnalyzer(use_tree_sitter_fallback=True)
-    
-    # Test with a Python file
-    test_file = "src/orchestration/project_analyzer.py"
-    if Path(test_file).exists():
-        print(f"Analyzing {test_file}...")
-        
-        analysis = await analyzer.analyze_code_structure(test_file, "python")
-        
-        print(f"\nStructure Analysis Results:")
-        print(f"  Dependencies: {analysis.imports.dependency_count}")
-        print(f"  External deps: {analysis.imports.external_dependencies}")
-        print(f"  Classes: {analysis.class_metrics.class_count}")
-        print(f"  Methods: {analysis.class_metrics.method_count}")
-        print(f"  Frameworks: {analysis.framework_dependencies.frameworks}")
-        print(f"  Complexity: {analysis.complexity_score:.2f}")
-        print(f"  Maintainability: {analysis.maintainability_score:.2f}")
-        
-        # Test adaptation effort
-        effort = analyzer.assess_adaptation_effort(analysis)
-        print(f"\nAdaptation Effort:")
-        print(f"  Overall effort: {effort.overall_effort:.2f}")
-        print(f"  Estimated hours: {effort.estimated_hours}")
-        
-        # Test Tree-sitter fallback
-        print(f"\nTree-sitter fallback available: {analyzer.use_tree_sitter_fallback}")
-    else:
-        print(f"Test file {test_file} not found")
+    async with ASTGrepAnalyzer(use_tree_sitter_fallback=True) as analyzer:
+        # Test with a Python file
+        test_file = "src/orchestration/project_analyzer.py"
+        if Path(test_file).exists():
+            print(f"Analyzing {test_file}...")
+            
+            analysis = await analyzer.analyze_code_structure(test_file, "python")
+            
+            print(f"\nStructure Analysis Results:")
+            print(f"  Dependencies: {analysis.imports.dependency_count}")
+            print(f"  External deps: {analysis.imports.external_dependencies}")
+            print(f"  Classes: {analysis.class_metrics.class_count}")
+            print(f"  Methods: {analysis.class_metrics.method_count}")
+            print(f"  Frameworks: {analysis.framework_dependencies.frameworks}")
+            print(f"  Complexity: {analysis.complexity_score:.2f}")
+            print(f"  Maintainability: {analysis.maintainability_score:.2f}")
+            
+            # Test adaptation effort
+            effort = analyzer.assess_adaptation_effort(analysis)
+            print(f"\nAdaptation Effort:")
+            print(f"  Overall effort: {effort.overall_effort:.2f}")
+            print(f"  Estimated hours: {effort.estimated_hours}")
+            
+            # Test Tree-sitter fallback
+            print(f"\nTree-sitter fallback available: {analyzer.use_tree_sitter_fallback}")
+        else:
+            print(f"Test file {test_file} not found")
 
 
 if __name__ == "__main__":
@@ -6,11 +6,18 @@ with fallback mechanisms when Context7 is unavailable.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, asdict, is_dataclass
+from datetime import datetime
 from pathlib import Path
 
 # Import MCP client for Context7 integration
@@ -31,6 +38,43 @@ try:
 except ImportError:
     ConfigManager = None
 
+# Faster JSON encoding and decoding when available; both accept and produce bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Typed decoding of Context7 responses (optional)
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Aho-Corasick automaton for multi-pattern scans (optional)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional JIT compilation for batched metric thresholds
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+    NUMBA_AVAILABLE = np is not None
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
 # Import UniversalCodeAnalyzer for fallback
 try:
     from .universal_code_analyzer import UniversalCodeAnalyzer
@@ -40,7 +84,70 @@ except ImportError:
     UniversalCodeAnalyzer = None
 
 
-@dataclass
+# Rough source characters per Context7 token, for sizing requests to max_tokens
+_CHARS_PER_TOKEN = 4
+
+# Languages Context7 analyzes; other languages go straight to the fallback
+_SUPPORTED_LANGUAGES = frozenset({
+    'python', 'javascript', 'typescript', 'java', 'go', 'rust',
+    'php', 'ruby', 'c', 'cpp', 'csharp', 'swift', 'kotlin'
+})
+
+# API detection per language: (api_name, patterns, suggestion, security_score)
+_API_PATTERNS = {
+    # FastAPI/Flask patterns
+    'python': ('web_framework', ('@app.', 'fastapi', 'flask'), 'Consider using OpenAPI documentation', 0.8),
+    # Express.js patterns
+    'javascript': ('express_api', ('express()', 'app.get', 'app.post'), 'Consider adding rate limiting', 0.7)
+}
+
+
+def _build_api_automaton(patterns: Tuple[str, ...]) -> Any:
+    """Build an Aho-Corasick automaton matching any of a language's API patterns."""
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+# One automaton per language, so a single pass finds any pattern (None without pyahocorasick)
+_API_AUTOMATA = {
+    language: _build_api_automaton(api_pattern[1])
+    for language, api_pattern in _API_PATTERNS.items()
+} if ahocorasick is not None else {}
+
+
+# Thresholds behind the fallback code issues and recommendations
+_HIGH_COMPLEXITY = 0.8
+_LOW_MAINTAINABILITY = 0.5
+_REFACTOR_COMPLEXITY = 0.7
+_DOCUMENT_MAINTAINABILITY = 0.6
+_AUDIT_LINES_OF_CODE = 1000
+
+
+def _threshold_flags_kernel(complexity, issue_maintainability, maintainability, lines_of_code, flags):
+    """
+    Mark the thresholds each file crosses, one row per file: high complexity and
+    low maintainability issues, then the refactor, documentation and security
+    audit recommendations.
+    """
+    for i in range(complexity.shape[0]):
+        flags[i, 0] = complexity[i] > _HIGH_COMPLEXITY
+        flags[i, 1] = issue_maintainability[i] < _LOW_MAINTAINABILITY
+        flags[i, 2] = complexity[i] > _REFACTOR_COMPLEXITY
+        flags[i, 3] = maintainability[i] < _DOCUMENT_MAINTAINABILITY
+        flags[i, 4] = lines_of_code[i] > _AUDIT_LINES_OF_CODE
+    return flags
+
+
+if NUMBA_AVAILABLE:
+    _threshold_flags = numba.njit(cache=True)(_threshold_flags_kernel)
+else:
+    _threshold_flags = _threshold_flags_kernel
+
+
+@dataclass(slots=True, frozen=True)
 class Context7AnalysisResult:
     """Result of Context7 analysis."""
     success: bool
@@ -54,7 +161,7 @@ class Context7AnalysisResult:
     analysis_timestamp: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Context7APIValidation:
     """API validation result from Context7."""
     api_name: str
@@ -65,17 +172,80 @@ class Context7APIValidation:
     security_score: float
 
 
+def _encode_result(result: Context7AnalysisResult) -> bytes:
+    """Serialize a Context7AnalysisResult to compact JSON for the persistent cache."""
+    data = asdict(result)
+    # Context7 responses carry raw dicts; mark the entries that were validation objects
+    data['api_validation_objects'] = [is_dataclass(validation) for validation in result.api_validations]
+    return _json_dumps(data)
+
+
+def _decode_result(blob: bytes) -> Context7AnalysisResult:
+    """Rebuild a Context7AnalysisResult, including its API validation objects, from cached JSON."""
+    data = _json_loads(blob)
+    is_object = data.pop('api_validation_objects')
+    data['api_validations'] = [
+        Context7APIValidation(**validation) if was_object else validation
+        for validation, was_object in zip(data['api_validations'], is_object)
+    ]
+    return Context7AnalysisResult(**data)
+
+
+if msgspec is not None:
+    class _Context7Response(msgspec.Struct):
+        """Fields read from a Context7 analysis response; anything else is ignored."""
+        insights: Dict[str, Any] = {}
+        api_validations: List[Any] = []
+        code_issues: List[Any] = []
+        recommendations: List[Any] = []
+        confidence_score: float = 0.5
+
+
+@functools.lru_cache(maxsize=8)
+def _load_mcp_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse an MCP config file once per version, shared by every analyzer.
+    
+    Args:
+        path: Path to the MCP config file
+        mtime_ns: Modification time of the file, so an edited file is parsed again
+    
+    Returns:
+        Parsed MCP configuration; shared between callers, so treat it as read-only
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
 class Context7Analyzer:
     """Context7-powered code analysis with MCP integration."""
     
-    def __init__(self, enable_fallback: bool = True):
+    def __init__(self, enable_fallback: bool = True, cache_path: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
         self.enable_fallback = enable_fallback and UNIVERSAL_ANALYZER_AVAILABLE
         
         # Initialize Context7 MCP client
         self.context7_client = None
         self.context7_available = False
+        self._context7_server_config = None
+        
+        # The connection is probed on first use rather than during construction
+        self._probed = False
+        self._probe_task = None
+        
+        # Long-lived MCP session, opened on first use by an owner task that keeps it
+        # open until stopped, and shared by all requests made from that task's loop
+        self._session_loop = None
+        self._session_task = None
+        self._session_ready = None
+        self._session_stop = None
         
+        # Bounded pool of workers that make the MCP tool calls, fed through a queue
+        # so callers fanning out with their own gather cannot swamp the server
+        self._job_queue = None
+        self._workers: List[asyncio.Task] = []
+        self._workers_loop = None
+
         # Initialize fallback analyzer
         self.fallback_analyzer = None
         if self.enable_fallback:
@@ -100,17 +270,41 @@ class Context7Analyzer:
         # Initialize Context7 client
         self._initialize_context7_client()
         
+        # In-memory LRU of successful results keyed by
+        # (path, mtime, size, language, analysis types), each expiring after a TTL
+        self._result_cache: OrderedDict = OrderedDict()
+        self.max_cached_results = 1024
+        self.result_cache_ttl = 300.0
+        self._result_cache_hits = 0
+        self._result_cache_misses = 0
+        
+        # Persistent SQLite copy of the result cache, reused across runs; entries are
+        # also keyed by the Context7 server command so upgrading it invalidates them.
+        # Only kept when a server is configured and a cache path is given
+        self.persistent_cache_ttl = 7 * 24 * 3600.0
+        self._server_tag = self._build_server_tag()
+        self._cache_lock = threading.Lock()
+        self._cache = None
+        cache_path = cache_path or os.getenv('CONTEXT7_CACHE_PATH')
+        if self.context7_available and cache_path:
+            self._cache = self._open_cache(cache_path)
+        
+        # Debounced real-time analyses waiting to run, by file path
+        self._pending_analyses: Dict[str, asyncio.Future] = {}
+        
+        # Threshold kernel for batched conversions; replaced by the Python kernel
+        # if the compiled one fails
+        self._threshold_flags = _threshold_flags
+        
         # Supported languages for Context7 analysis
-        self.supported_languages = [
-            'python', 'javascript', 'typescript', 'java', 'go', 'rust',
-            'php', 'ruby', 'c', 'cpp', 'csharp', 'swift', 'kotlin'
-        ]
+        self.supported_languages = _SUPPORTED_LANGUAGES
     
     def _load_context7_config(self) -> Dict[str, Any]:
         """Load Context7 configuration from environment and config files."""
         config = {
             'enabled': os.getenv('CONTEXT7_ENABLED', 'true').lower() == 'true',
             'max_tokens': int(os.getenv('CONTEXT7_MAX_TOKENS', '10000')),
+            'max_inflight': int(os.getenv('CONTEXT7_MAX_INFLIGHT', '32')),
             'timeout': 30,
             'retry_attempts': 3,
             'mcp_config_path': 'mcp_config.json'
@@ -124,6 +318,7 @@ class Context7Analyzer:
                     config.update({
                         'enabled': func_config.get('enabled', config['enabled']),
                         'max_tokens': func_config.get('max_tokens', config['max_tokens']),
+                        'max_inflight': func_config.get('max_inflight', config['max_inflight']),
                         'timeout': func_config.get('timeout', config['timeout'])
                     })
             except Exception as e:
@@ -144,12 +339,13 @@ class Context7Analyzer:
         try:
             # Load MCP configuration
             mcp_config_path = Path(self.context7_config['mcp_config_path'])
-            if not mcp_config_path.exists():
+            try:
+                mtime_ns = mcp_config_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 self.logger.warning(f"MCP config file not found: {mcp_config_path}")
                 return
             
-            with open(mcp_config_path, 'r') as f:
-                mcp_config = json.load(f)
+            mcp_config = _load_mcp_config(str(mcp_config_path), mtime_ns)
             
             # Initialize Context7 server configuration
             context7_server_config = mcp_config.get('mcpServers', {}).get('context7')
@@ -158,14 +354,10 @@ class Context7Analyzer:
                 return
             
             # Initialize MCP client
-            self.context7_client = stdio_client(
-                command=context7_server_config['command'],
-                args=context7_server_config.get('args', []),
-                env=context7_server_config.get('env', {})
-            )
+            self._context7_server_config = context7_server_config
+            self.context7_client = self._create_context7_client()
             
-            # Test connection
-            asyncio.run(self._test_context7_connection())
+            # Assume the server works until the first analysis probes it
             self.context7_available = True
             self.logger.info("Context7 MCP client initialized successfully")
             
@@ -173,29 +365,258 @@ class Context7Analyzer:
             self.logger.error(f"Failed to initialize Context7 client: {e}")
             self.context7_available = False
     
+    def _build_server_tag(self) -> str:
+        """
+        Describe the configured Context7 server for the persistent cache key,
+        tolerating malformed entries the client itself would reject.
+        
+        Returns:
+            Server command line, or an empty string if no server is configured
+        """
+        server_config = self._context7_server_config
+        if not isinstance(server_config, dict):
+            return ''
+        
+        args = server_config.get('args') or []
+        if not isinstance(args, (list, tuple)):
+            args = [args]
+        return ' '.join(map(str, [server_config.get('command', ''), *args]))
+    
+    def _create_context7_client(self):
+        """Create the stdio transport for the configured Context7 server."""
+        return stdio_client(
+            command=self._context7_server_config['command'],
+            args=self._context7_server_config.get('args', []),
+            env=self._context7_server_config.get('env', {})
+        )
+    
+    async def _ensure_session(self):
+        """
+        Return the shared Context7 session, starting the server and running the
+        MCP handshake only on first use.
+        
+        The transport and session are entered and exited by one owner task per
+        event loop, as MCP's task groups require; callers only await the session
+        it publishes.
+        
+        Returns:
+            Initialized ClientSession
+        """
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # A session belongs to one event loop; close the old loop's and start afresh
+            self._stop_session_owner(self._session_task, self._session_stop)
+            self._session_task = None
+            self._session_ready = None
+            self._session_stop = None
+            self._session_loop = loop
+        
+        if self._session_ready is None:
+            self._session_ready = loop.create_future()
+            self._session_stop = asyncio.Event()
+            self._session_task = loop.create_task(self._own_session(self._session_ready, self._session_stop))
+        
+        ready = self._session_ready
+        try:
+            # Shielded so a cancelled caller does not cancel the start others await
+            return await asyncio.shield(ready)
+        except Exception:
+            # Let the next caller start the server again
+            if self._session_ready is ready:
+                self._session_task = None
+                self._session_ready = None
+                self._session_stop = None
+            raise
+    
+    async def _own_session(self, ready: asyncio.Future, stop: asyncio.Event):
+        """
+        Open the transport and MCP session, publish the session, and close both
+        from this same task once stopped or cancelled.
+        
+        Args:
+            ready: Future resolved with the initialized session, or the start error
+            stop: Event that asks the owner to close the session
+        """
+        try:
+            async with AsyncExitStack() as stack:
+                client = self.context7_client or self._create_context7_client()
+                # A transport can only be entered once, so later sessions need a new one
+                self.context7_client = None
+                
+                streams = await stack.enter_async_context(client)
+                session = await stack.enter_async_context(ClientSession(*streams))
+                await session.initialize()
+                
+                ready.set_result(session)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                self.logger.warning(f"Context7 session closed with an error: {e}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+    
+    def _stop_session_owner(self, task: Optional[asyncio.Task], stop: Optional[asyncio.Event]):
+        """Ask a session owner running on another (or no longer running) loop to close its session."""
+        if task is None or task.done():
+            return
+        owner_loop = task.get_loop()
+        if not owner_loop.is_closed():
+            owner_loop.call_soon_threadsafe(stop.set)
+    
+    def _cancel_workers(self, workers: List[asyncio.Task]):
+        """Cancel MCP workers from outside their loop."""
+        for worker in workers:
+            worker_loop = worker.get_loop()
+            if not worker.done() and not worker_loop.is_closed():
+                worker_loop.call_soon_threadsafe(worker.cancel)
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        """
+        Start the MCP worker pool on the running loop if it is not already running.
+        
+        Returns:
+            Queue of (tool name, arguments, future) jobs the workers consume
+        """
+        loop = asyncio.get_running_loop()
+        if self._workers_loop is not loop:
+            # Workers and their queue belong to one event loop; stop the old loop's
+            # and start afresh on this one
+            self._cancel_workers(self._workers)
+            self._job_queue = asyncio.Queue()
+            self._workers = [
+                loop.create_task(self._mcp_worker(self._job_queue))
+                for _ in range(max(1, self.context7_config['max_inflight']))
+            ]
+            self._workers_loop = loop
+        return self._job_queue
+    
+    async def _mcp_worker(self, job_queue: asyncio.Queue):
+        """Make queued MCP tool calls on the shared session, one at a time."""
+        while True:
+            tool_name, arguments, future = await job_queue.get()
+            try:
+                # Skip jobs whose caller has already given up
+                if future.done():
+                    continue
+                
+                session = await self._ensure_session()
+                result = await session.call_tool(tool_name, arguments)
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                job_queue.task_done()
+    
+    async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Call a Context7 tool through the worker pool, so no more than
+        ``max_inflight`` calls are outstanding on the session at once.
+        
+        Args:
+            tool_name: Name of the MCP tool to call
+            arguments: Tool arguments
+        
+        Returns:
+            Tool call result
+        """
+        job_queue = self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        job_queue.put_nowait((tool_name, arguments, future))
+        return await future
+    
+    async def aclose(self):
+        """Stop the MCP workers, close the shared Context7 session and stop the server process."""
+        loop = asyncio.get_running_loop()
+        workers, job_queue = self._workers, self._job_queue
+        self._workers = []
+        self._job_queue = None
+        self._workers_loop = None
+        
+        local_workers = [worker for worker in workers if worker.get_loop() is loop]
+        self._cancel_workers([worker for worker in workers if worker.get_loop() is not loop])
+        for worker in local_workers:
+            worker.cancel()
+        if local_workers:
+            await asyncio.gather(*local_workers, return_exceptions=True)
+        
+        # Fail any jobs the workers never picked up
+        while job_queue is not None and not job_queue.empty():
+            _, _, future = job_queue.get_nowait()
+            future.cancel()
+        
+        task, stop = self._session_task, self._session_stop
+        self._session_loop = None
+        self._session_task = None
+        self._session_ready = None
+        self._session_stop = None
+        
+        if task is not None and task.get_loop() is loop:
+            # The owner task closes the session and transport it entered
+            stop.set()
+            await asyncio.gather(task, return_exceptions=True)
+        else:
+            self._stop_session_owner(task, stop)
+    
+    async def __aenter__(self) -> 'Context7Analyzer':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _ensure_probed(self) -> bool:
+        """
+        Test the Context7 connection once, on first use, and disable Context7 if it
+        does not respond; concurrent first callers share the same probe.
+        
+        Returns:
+            Whether Context7 is available
+        """
+        if self._probed:
+            return self.context7_available
+        
+        loop = asyncio.get_running_loop()
+        if self._probe_task is None or self._probe_task.get_loop() is not loop:
+            self._probe_task = loop.create_task(self._test_context7_connection())
+        
+        # Shielded so a cancelled caller does not cancel the probe the others await
+        available = await asyncio.shield(self._probe_task)
+        if not self._probed:
+            self._probed = True
+            self.context7_available = available
+            if not available:
+                self.logger.warning("Context7 connection test failed, using fallback analysis")
+        return self.context7_available
+    
     async def _test_context7_connection(self) -> bool:
         """Test Context7 connection with a simple analysis request."""
-        if not self.context7_client:
+        if not self._context7_server_config:
             return False
         
         try:
-            # Create a test session
-            async with self.context7_client as streams:
-                async with ClientSession(*streams) as session:
-                    # Test with a simple code snippet
-                    test_code = "def hello():\n    print('Hello, World!')"
-                    test_request = {
-                        'code': test_code,
-                        'language': 'python',
-                        'analysis_type': 'structure'
-                    }
-                    
-                    # Send test request (adjust based on actual Context7 API)
-                    await session.initialize()
-                    result = await session.call_tool('analyze', test_request)
-                    
-                    return result is not None
-                    
+            session = await self._ensure_session()
+            
+            # Test with a simple code snippet
+            test_code = "def hello():\n    print('Hello, World!')"
+            test_request = {
+                'code': test_code,
+                'language': 'python',
+                'analysis_type': 'structure'
+            }
+            
+            # Send test request (adjust based on actual Context7 API)
+            result = await session.call_tool('analyze', test_request)
+            
+            return result is not None
+        
         except Exception as e:
             self.logger.warning(f"Context7 connection test failed: {e}")
             return False
@@ -213,7 +634,8 @@ class Context7Analyzer:
         Returns:
             Context7AnalysisResult with analysis results
         """
-        if not os.path.exists(file_path):
+        file_stat = await asyncio.to_thread(self._stat_file, file_path)
+        if file_stat is None:
             return Context7AnalysisResult(
                 success=False,
                 file_path=file_path,
@@ -230,19 +652,49 @@ class Context7Analyzer:
         if analysis_types is None:
             analysis_types = ['structure', 'api', 'security']
         
-        # Try Context7 analysis first
-        if self.context7_available and language in self.supported_languages:
+        # Serve unchanged files from the result cache
+        cache_key = (
+            file_path, file_stat.st_mtime_ns, file_stat.st_size, language, tuple(sorted(analysis_types))
+        )
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+        
+        if self._cache is not None:
+            cached_result = await asyncio.to_thread(self._load_persisted_result, cache_key)
+            if cached_result is not None:
+                self._store_cached_result(cache_key, cached_result)
+                return cached_result
+        
+        result, from_context7 = await self._analyze_uncached(file_path, language, analysis_types)
+        if result.success:
+            self._store_cached_result(cache_key, result)
+            # Fallback results stay in memory only, so a later run tries Context7 again
+            if from_context7 and self._cache is not None:
+                await asyncio.to_thread(self._persist_result, cache_key, result)
+        return result
+    
+    async def _analyze_uncached(self, file_path: str, language: str,
+                                analysis_types: List[str]) -> Tuple[Context7AnalysisResult, bool]:
+        """
+        Run Context7 analysis with the Tree-sitter fallback, bypassing the result cache.
+        
+        Returns:
+            The analysis result, and whether it came from Context7 itself
+        """
+        # Try Context7 analysis first, probing the connection on first use
+        if self.context7_available and language in self.supported_languages and await self._ensure_probed():
             try:
                 result = await self._analyze_with_context7(file_path, language, analysis_types)
                 if result and result.success:
-                    return result
+                    return result, True
             except Exception as e:
                 self.logger.warning(f"Context7 analysis failed for {file_path}: {e}")
         
         # Fallback to Tree-sitter analysis
         if self.fallback_analyzer:
             try:
-                return await self._analyze_with_fallback(file_path, language, analysis_types)
+                return await self._analyze_with_fallback(file_path, language, analysis_types), False
             except Exception as e:
                 self.logger.error(f"Fallback analysis failed for {file_path}: {e}")
         
@@ -257,56 +709,204 @@ class Context7Analyzer:
             recommendations=["Manual review required"],
             confidence_score=0.0,
             analysis_timestamp=self._get_timestamp()
-        )
+        ), False
+    
+    async def analyze_files(self, files: List[Tuple[str, str]],
+                            analysis_types: List[str] = None) -> List[Context7AnalysisResult]:
+        """
+        Analyze several files concurrently.
+        
+        Up to ``max_inflight`` requests (CONTEXT7_MAX_INFLIGHT) are in flight at
+        once, so file reads, MCP round-trips and Context7 server work overlap
+        across files instead of running one file at a time.
+        
+        Args:
+            files: (file_path, language) pairs to analyze
+            analysis_types: Types of analysis to perform for every file
+        
+        Returns:
+            Context7AnalysisResult per file, in the order of ``files``
+        """
+        inflight = asyncio.Semaphore(self.context7_config['max_inflight'])
+        
+        async def analyze(file_path: str, language: str) -> Context7AnalysisResult:
+            async with inflight:
+                return await self.analyze_file(file_path, language, analysis_types)
+        
+        return await asyncio.gather(*(analyze(file_path, language) for file_path, language in files))
     
     async def _analyze_with_context7(self, file_path: str, language: str, 
                                    analysis_types: List[str]) -> Context7AnalysisResult:
         """Analyze file using Context7 MCP client."""
         try:
-            async with self.context7_client as streams:
-                async with ClientSession(*streams) as session:
-                    await session.initialize()
-                    
-                    # Read file content
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        code_content = f.read()
-                    
-                    # Prepare analysis request
-                    analysis_request = {
-                        'code': code_content,
-                        'language': language,
-                        'analysis_types': analysis_types,
-                        'max_tokens': self.context7_config['max_tokens']
-                    }
-                    
-                    # Call Context7 analysis tool
-                    result = await session.call_tool('analyze', analysis_request)
-                    
-                    if result:
-                        return self._parse_context7_response(result, file_path, language)
-                    else:
-                        raise Exception("Context7 returned empty result")
-                        
+            # Read file content off the event loop, no more than the token budget can
+            # cover (about four characters per token), so oversized files are neither
+            # loaded whole nor sent in full
+            max_chars = self.context7_config['max_tokens'] * _CHARS_PER_TOKEN
+            code_content = await asyncio.to_thread(self._read_source, file_path, max_chars + 1)
+            
+            # Prepare analysis request
+            analysis_request = {
+                'code': code_content[:max_chars],
+                'language': language,
+                'analysis_types': analysis_types,
+                'max_tokens': self.context7_config['max_tokens']
+            }
+            if len(code_content) > max_chars:
+                analysis_request['truncated'] = True
+            
+            # Call Context7 analysis tool through the bounded worker pool
+            result = await self._call_tool('analyze', analysis_request)
+            
+            if result:
+                return self._parse_context7_response(result, file_path, language)
+            else:
+                raise Exception("Context7 returned empty result")
+        
         except Exception as e:
             self.logger.error(f"Context7 analysis error: {e}")
             raise
     
+    def _stat_file(self, file_path: str) -> Optional[os.stat_result]:
+        """Stat a file (blocking; run in a worker thread), returning None if it does not exist."""
+        try:
+            return os.stat(file_path)
+        except (OSError, ValueError):
+            return None
+    
+    def _get_cached_result(self, cache_key: Tuple) -> Optional[Context7AnalysisResult]:
+        """Return a cached result that has not expired, refreshing its LRU position."""
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            self._result_cache_misses += 1
+            return None
+        
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._result_cache[cache_key]
+            self._result_cache_misses += 1
+            return None
+        
+        self._result_cache.move_to_end(cache_key)
+        self._result_cache_hits += 1
+        return result
+    
+    def _store_cached_result(self, cache_key: Tuple, result: Context7AnalysisResult):
+        """Cache a result for ``result_cache_ttl`` seconds, evicting the least recently used."""
+        self._result_cache[cache_key] = (time.monotonic() + self.result_cache_ttl, result)
+        self._result_cache.move_to_end(cache_key)
+        while len(self._result_cache) > self.max_cached_results:
+            self._result_cache.popitem(last=False)
+    
+    def invalidate(self, file_path: Optional[str] = None):
+        """
+        Drop cached results for a file, or for every file, in memory and on disk.
+        
+        Args:
+            file_path: Path whose cached results to drop; None clears the whole cache
+        """
+        if file_path is None:
+            self._result_cache.clear()
+        else:
+            for cache_key in [key for key in self._result_cache if key[0] == file_path]:
+                del self._result_cache[cache_key]
+        
+        if self._cache is None:
+            return
+        try:
+            with self._cache_lock:
+                if file_path is None:
+                    self._cache.execute('DELETE FROM results')
+                else:
+                    self._cache.execute('DELETE FROM results WHERE path = ?', (os.path.abspath(file_path),))
+                self._cache.commit()
+        except Exception as e:
+            self.logger.debug(f"Result cache invalidation failed: {e}")
+    
+    def _open_cache(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open the SQLite result cache, returning None if it cannot be used."""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+            connection = sqlite3.connect(cache_path, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'path TEXT, mtime_ns INTEGER, size INTEGER, language TEXT, analysis_types TEXT, '
+                'server TEXT, blob BLOB, created_at REAL, '
+                'PRIMARY KEY(path, mtime_ns, size, language, analysis_types, server))'
+            )
+            connection.commit()
+            return connection
+        except Exception as e:
+            self.logger.warning(f"Persistent result cache disabled: {e}")
+            return None
+    
+    def _persisted_key(self, cache_key: Tuple) -> Tuple:
+        """Turn an in-memory cache key into the persistent cache's primary key."""
+        file_path, mtime_ns, size, language, analysis_types = cache_key
+        return (os.path.abspath(file_path), mtime_ns, size, language, ','.join(analysis_types), self._server_tag)
+    
+    def _load_persisted_result(self, cache_key: Tuple) -> Optional[Context7AnalysisResult]:
+        """Load a result from the persistent cache (blocking; run in a worker thread)."""
+        try:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    'SELECT blob FROM results WHERE path = ? AND mtime_ns = ? AND size = ? '
+                    'AND language = ? AND analysis_types = ? AND server = ? AND created_at > ?',
+                    (*self._persisted_key(cache_key), time.time() - self.persistent_cache_ttl)
+                ).fetchone()
+            return _decode_result(row[0]) if row else None
+        except Exception as e:
+            self.logger.debug(f"Result cache read failed for {cache_key[0]}: {e}")
+            return None
+    
+    def _persist_result(self, cache_key: Tuple, result: Context7AnalysisResult):
+        """Store a result in the persistent cache, dropping entries for older versions of the file."""
+        key = self._persisted_key(cache_key)
+        try:
+            with self._cache_lock:
+                self._cache.execute(
+                    'DELETE FROM results WHERE path = ? AND (mtime_ns != ? OR size != ?)', key[:3]
+                )
+                self._cache.execute(
+                    'INSERT OR REPLACE INTO results '
+                    '(path, mtime_ns, size, language, analysis_types, server, blob, created_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (*key, _encode_result(result), time.time())
+                )
+                self._cache.commit()
+        except Exception as e:
+            self.logger.debug(f"Result cache write failed for {cache_key[0]}: {e}")
+    
+    def _read_source(self, file_path: str, max_chars: int = -1) -> str:
+        """Read up to ``max_chars`` of a source file's text (blocking; run in a worker thread)."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read(max_chars)
+    
     def _parse_context7_response(self, response: Any, file_path: str, 
                                 language: str) -> Context7AnalysisResult:
         """Parse Context7 response into structured result."""
         try:
-            # Convert response to dict if it's not already
-            if hasattr(response, '__dict__'):
-                response_data = response.__dict__
-            else:
-                response_data = response
+            # Raw payloads are JSON; other non-dict responses expose their fields as attributes
+            if isinstance(response, (bytes, str)):
+                response = _json_loads(response)
+            elif not isinstance(response, dict) and hasattr(response, '__dict__'):
+                response = response.__dict__
             
-            # Extract analysis results
-            insights = response_data.get('insights', {})
-            api_validations = response_data.get('api_validations', [])
-            code_issues = response_data.get('code_issues', [])
-            recommendations = response_data.get('recommendations', [])
-            confidence_score = float(response_data.get('confidence_score', 0.5))
+            # Extract analysis results, validating their types in one pass when msgspec is available
+            if msgspec is not None:
+                parsed = msgspec.convert(response, _Context7Response, strict=False)
+                insights = parsed.insights
+                api_validations = parsed.api_validations
+                code_issues = parsed.code_issues
+                recommendations = parsed.recommendations
+                confidence_score = parsed.confidence_score
+            else:
+                insights = response.get('insights', {})
+                api_validations = response.get('api_validations', [])
+                code_issues = response.get('code_issues', [])
+                recommendations = response.get('recommendations', [])
+                confidence_score = float(response.get('confidence_score', 0.5))
             
             return Context7AnalysisResult(
                 success=True,
@@ -328,8 +928,11 @@ class Context7Analyzer:
                                    analysis_types: List[str]) -> Context7AnalysisResult:
         """Analyze file using fallback Tree-sitter analyzer."""
         try:
-            # Use UniversalCodeAnalyzer for comprehensive analysis
-            tree_sitter_result = self.fallback_analyzer.analyze_file(file_path, language)
+            # Use UniversalCodeAnalyzer for comprehensive analysis; the parse is blocking,
+            # so it runs in a worker thread while other requests proceed
+            tree_sitter_result = await asyncio.to_thread(
+                self.fallback_analyzer.analyze_file, file_path, language
+            )
             
             if not tree_sitter_result or not tree_sitter_result.get('success'):
                 raise Exception("Tree-sitter analysis failed")
@@ -350,23 +953,10 @@ class Context7Analyzer:
         metrics = tree_sitter_result.get('metrics', {})
         structure = tree_sitter_result.get('structure', {})
         
-        # Extract insights from Tree-sitter analysis
-        insights = {
-            'complexity_score': float(metrics.get('complexity_score', 0.0)),
-            'maintainability_index': float(metrics.get('maintainability_index', 0.5)),
-            'cyclomatic_complexity': int(metrics.get('cyclomatic_complexity', 1)),
-            'lines_of_code': int(metrics.get('lines_of_code', 0)),
-            'comment_ratio': float(metrics.get('comment_ratio', 0.0))
-        }
-        
-        # Extract API-like patterns (simplified detection)
-        api_validations = self._detect_api_patterns(structure, language)
-        
-        # Extract code issues
-        code_issues = self._detect_code_issues(metrics, structure)
-        
-        # Generate recommendations
-        recommendations = self._generate_recommendations(insights, code_issues)
+        # Extract insights, API-like patterns, code issues and recommendations
+        insights, api_validations, code_issues, recommendations = self._analyze_structure(
+            metrics, structure, language
+        )
         
         # Calculate confidence score
         confidence_score = min(0.8, float(metrics.get('confidence_score', 0.5)))
@@ -383,44 +973,154 @@ class Context7Analyzer:
             analysis_timestamp=self._get_timestamp()
         )
     
+    def convert_tree_sitter_batch(self, items: List[Tuple[Dict[str, Any], str, str]]) -> List[Context7AnalysisResult]:
+        """
+        Convert many Tree-sitter analysis results to Context7 format at once.
+        
+        The metric thresholds behind code issues and recommendations are checked
+        for every file in one compiled pass over NumPy columns; without NumPy each
+        result goes through the per-file conversion.
+        
+        Args:
+            items: (tree_sitter_result, file_path, language) triples
+        
+        Returns:
+            Context7AnalysisResult per item, in the order of ``items``
+        """
+        if np is None or not items:
+            return [
+                self._convert_tree_sitter_to_context7_format(tree_sitter_result, file_path, language)
+                for tree_sitter_result, file_path, language in items
+            ]
+        
+        metrics_list = [tree_sitter_result.get('metrics', {}) for tree_sitter_result, _, _ in items]
+        insights_list = [self._extract_insights(metrics) for metrics in metrics_list]
+        # Issues read a missing maintainability index as 0.0, insights as 0.5
+        issue_maintainability_list = [float(metrics.get('maintainability_index', 0.0)) for metrics in metrics_list]
+        
+        complexity = np.array([insights['complexity_score'] for insights in insights_list], dtype=np.float64)
+        issue_maintainability = np.array(issue_maintainability_list, dtype=np.float64)
+        maintainability = np.array(
+            [insights['maintainability_index'] for insights in insights_list], dtype=np.float64
+        )
+        lines_of_code = np.array([insights['lines_of_code'] for insights in insights_list], dtype=np.int64)
+        columns = (complexity, issue_maintainability, maintainability, lines_of_code)
+        try:
+            flags = self._threshold_flags(*columns, np.zeros((len(items), 5), dtype=np.bool_))
+        except Exception as e:
+            if self._threshold_flags is _threshold_flags_kernel:
+                raise
+            # JIT compilation failed; degrade to the Python kernel for this and later batches
+            self.logger.warning(f"Compiled threshold kernel failed, falling back to Python: {e}")
+            self._threshold_flags = _threshold_flags_kernel
+            flags = self._threshold_flags(*columns, np.zeros((len(items), 5), dtype=np.bool_))
+        flags = flags.tolist()
+        
+        results = []
+        for (tree_sitter_result, file_path, language), metrics, insights, maintainability_index, row in zip(
+            items, metrics_list, insights_list, issue_maintainability_list, flags
+        ):
+            structure = tree_sitter_result.get('structure', {})
+            missing_tests = not structure.get('has_tests', False)
+            results.append(Context7AnalysisResult(
+                success=True,
+                file_path=file_path,
+                language=language,
+                insights=insights,
+                api_validations=self._detect_api_patterns(structure, language),
+                code_issues=self._build_code_issues(
+                    row[0], insights['complexity_score'], row[1], maintainability_index, missing_tests
+                ),
+                recommendations=self._build_recommendations(row[2], row[3], missing_tests, row[4]),
+                confidence_score=min(0.8, float(metrics.get('confidence_score', 0.5))),
+                analysis_timestamp=self._get_timestamp()
+            ))
+        return results
+    
+    def _extract_insights(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract insights from Tree-sitter metrics."""
+        return {
+            'complexity_score': float(metrics.get('complexity_score', 0.0)),
+            'maintainability_index': float(metrics.get('maintainability_index', 0.5)),
+            'cyclomatic_complexity': int(metrics.get('cyclomatic_complexity', 1)),
+            'lines_of_code': int(metrics.get('lines_of_code', 0)),
+            'comment_ratio': float(metrics.get('comment_ratio', 0.0))
+        }
+    
+    def _analyze_structure(self, metrics: Dict[str, Any], structure: Dict[str, Any], language: str
+                           ) -> Tuple[Dict[str, Any], List[Context7APIValidation], List[Dict[str, Any]], List[str]]:
+        """
+        Derive insights, API patterns, code issues and recommendations from one
+        Tree-sitter result, reading each metric once.
+        
+        Args:
+            metrics: Tree-sitter metrics
+            structure: Tree-sitter structure
+            language: Programming language
+        
+        Returns:
+            Tuple of insights, API validations, code issues and recommendations
+        """
+        insights = self._extract_insights(metrics)
+        complexity_score = insights['complexity_score']
+        maintainability_index = insights['maintainability_index']
+        
+        # Issues treat a missing maintainability index as 0.0, insights as 0.5
+        issue_maintainability = maintainability_index if 'maintainability_index' in metrics else 0.0
+        missing_tests = not structure.get('has_tests', False)
+        
+        code_issues = self._build_code_issues(
+            complexity_score > _HIGH_COMPLEXITY, complexity_score,
+            issue_maintainability < _LOW_MAINTAINABILITY, issue_maintainability,
+            missing_tests
+        )
+        recommendations = self._build_recommendations(
+            complexity_score > _REFACTOR_COMPLEXITY,
+            maintainability_index < _DOCUMENT_MAINTAINABILITY,
+            missing_tests,
+            insights['lines_of_code'] > _AUDIT_LINES_OF_CODE
+        )
+        
+        return insights, self._detect_api_patterns(structure, language), code_issues, recommendations
+    
     def _detect_api_patterns(self, structure: Dict[str, Any], language: str) -> List[Context7APIValidation]:
         """Detect API-like patterns in code structure."""
         api_validations = []
         
         # Check for common API patterns based on language
-        if language.lower() == 'python':
-            # FastAPI/Flask patterns
-            if any(pattern in str(structure).lower() for pattern in ['@app.', 'fastapi', 'flask']):
-                api_validations.append(Context7APIValidation(
-                    api_name='web_framework',
-                    endpoint='auto-detected',
-                    validation_status='valid',
-                    issues=[],
-                    suggestions=['Consider using OpenAPI documentation'],
-                    security_score=0.8
-                ))
-        
-        elif language.lower() == 'javascript':
-            # Express.js patterns
-            if any(pattern in str(structure).lower() for pattern in ['express()', 'app.get', 'app.post']):
+        language = language.lower()
+        api_pattern = _API_PATTERNS.get(language)
+        if api_pattern is not None:
+            api_name, patterns, suggestion, security_score = api_pattern
+            
+            # Scan the rendered structure once for all of the language's patterns
+            structure_text = str(structure).lower()
+            automaton = _API_AUTOMATA.get(language)
+            if automaton is not None:
+                found = next(automaton.iter(structure_text), None) is not None
+            else:
+                found = any(pattern in structure_text for pattern in patterns)
+            
+            if found:
                 api_validations.append(Context7APIValidation(
-                    api_name='express_api',
+                    api_name=api_name,
                     endpoint='auto-detected',
                     validation_status='valid',
                     issues=[],
-                    suggestions=['Consider adding rate limiting'],
-                    security_score=0.7
+                    suggestions=[suggestion],
+                    security_score=security_score
                 ))
         
         return api_validations
     
-    def _detect_code_issues(self, metrics: Dict[str, Any], structure: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Detect common code issues from metrics and structure."""
+    def _build_code_issues(self, high_complexity: bool, complexity_score: float,
+                           low_maintainability: bool, maintainability_index: float,
+                           missing_tests: bool) -> List[Dict[str, Any]]:
+        """Build the code issues for the thresholds a file crosses."""
         issues = []
         
         # Check complexity issues
-        complexity_score = float(metrics.get('complexity_score', 0.0))
-        if complexity_score > 0.8:
+        if high_complexity:
             issues.append({
                 'type': 'high_complexity',
                 'severity': 'warning',
@@ -429,8 +1129,7 @@ class Context7Analyzer:
             })
         
         # Check maintainability issues
-        maintainability_index = float(metrics.get('maintainability_index', 0.0))
-        if maintainability_index < 0.5:
+        if low_maintainability:
             issues.append({
                 'type': 'low_maintainability',
                 'severity': 'warning',
@@ -439,7 +1138,7 @@ class Context7Analyzer:
             })
         
         # Check for test coverage
-        if not structure.get('has_tests', False):
+        if missing_tests:
             issues.append({
                 'type': 'missing_tests',
                 'severity': 'info',
@@ -449,32 +1148,29 @@ class Context7Analyzer:
         
         return issues
     
-    def _generate_recommendations(self, insights: Dict[str, Any], 
-                                code_issues: List[Dict[str, Any]]) -> List[str]:
-        """Generate improvement recommendations based on analysis."""
+    def _build_recommendations(self, refactor: bool, document: bool, missing_tests: bool,
+                               audit: bool) -> List[str]:
+        """Build the improvement recommendations for the thresholds a file crosses."""
         recommendations = []
         
         # Complexity-based recommendations
-        complexity_score = insights.get('complexity_score', 0.0)
-        if complexity_score > 0.7:
+        if refactor:
             recommendations.append("Consider refactoring complex functions")
         
         # Maintainability-based recommendations
-        maintainability_index = insights.get('maintainability_index', 0.0)
-        if maintainability_index < 0.6:
+        if document:
             recommendations.append("Improve code documentation and structure")
         
         # Test coverage recommendations
-        test_issues = [issue for issue in code_issues if issue['type'] == 'missing_tests']
-        if test_issues:
+        if missing_tests:
             recommendations.append("Add comprehensive test coverage")
         
         # Security recommendations
-        if insights.get('lines_of_code', 0) > 1000:
+        if audit:
             recommendations.append("Consider security audit for large codebase")
         
         return recommendations
-    
+
     async def validate_apis(self, file_path: str, language: str) -> List[Context7APIValidation]:
         """
         Validate API endpoints and patterns in the code.
@@ -503,15 +1199,35 @@ class Context7Analyzer:
             language: Programming language
             debounce_ms: Debounce delay in milliseconds
             
+        Each call cancels the file's pending analysis, and the callers it supersedes
+        receive the newer call's result, so a burst of calls runs a single analysis
+        once the file is quiet.
+        
         Returns:
             Latest analysis result
         """
         try:
-            # Simple implementation with asyncio.sleep for debouncing
-            await asyncio.sleep(debounce_ms / 1000.0)
+            previous = self._pending_analyses.get(file_path)
+            if previous is not None and not previous.done():
+                previous.cancel()
             
-            return await self.analyze_file(file_path, language)
+            task = asyncio.ensure_future(self._debounced_analysis(file_path, language, debounce_ms))
+            self._pending_analyses[file_path] = task
+            task.add_done_callback(lambda done: self._forget_pending(file_path, done))
             
+            while True:
+                # Waiting neither cancels an analysis others await nor raises when it is
+                # cancelled, so only this caller's own cancellation propagates
+                await asyncio.wait((task,))
+                if not task.cancelled():
+                    return task.result()
+                
+                newer = self._pending_analyses.get(file_path)
+                if newer is None or newer is task:
+                    raise asyncio.CancelledError()
+                # Superseded by a later call; wait for its result instead
+                task = newer
+        
         except Exception as e:
             self.logger.error(f"Real-time analysis failed: {e}")
             return Context7AnalysisResult(
@@ -526,53 +1242,68 @@ class Context7Analyzer:
                 analysis_timestamp=self._get_timestamp()
             )
     
+    async def _debounced_analysis(self, file_path: str, language: str,
+                                  debounce_ms: int) -> Context7AnalysisResult:
+        """Wait out the debounce delay, then analyze the file."""
+        await asyncio.sleep(debounce_ms / 1000.0)
+        return await self.analyze_file(file_path, language)
+    
+    def _forget_pending(self, file_path: str, task: asyncio.Future):
+        """Drop a finished debounced analysis unless a newer one replaced it."""
+        if self._pending_analyses.get(file_path) is task:
+            del self._pending_analyses[file_path]
+    
     def get_context7_status(self) -> Dict[str, Any]:
         """Get Context7 integration status."""
         return {
             'context7_available': self.context7_available,
             'fallback_available': self.fallback_analyzer is not None,
-            'supported_languages': self.supported_languages,
+            'supported_languages': sorted(self.supported_languages),
             'config': self.context7_config,
-            'mcp_available': MCP_AVAILABLE
+            'mcp_available': MCP_AVAILABLE,
+            'result_cache': {
+                'size': len(self._result_cache),
+                'hits': self._result_cache_hits,
+                'misses': self._result_cache_misses,
+                'persistent': self._cache is not None
+            }
         }
     
     def _get_timestamp(self) -> str:
         """Get current timestamp for analysis."""
-        from datetime import datetime
         return datetime.now().isoformat()
 
 
 # Example usage
 async def main():
     """Example usage of Context7Analyzer."""
-    analyzer = Context7Analyzer(enable_fallback=True)
-    
-    # Test with a Python file
-    test_file = "src/orchestration/project_analyzer.py"
-    if Path(test_file).exists():
-        print(f"Analyzing {test_file} with Context7...")
-        
-        # Perform comprehensive analysis
-        result = await analyzer.analyze_file(test_file, "python")
-        
-        print(f"\nContext7 Analysis Results:")
-        print(f"  Success: {result.success}")
-        print(f"  Language: {result.language}")
-        print(f"  Confidence: {result.confidence_score:.2f}")
-        print(f"  Insights: {len(result.insights)} items")
-        print(f"  API Validations: {len(result.api_validations)} items")
-        print(f"  Code Issues: {len(result.code_issues)} items")
-        print(f"  Recommendations: {len(result.recommendations)} items")
-        
-        # Show status
-        status = analyzer.get_context7_status()
-        print(f"\nContext7 Status:")
-        print(f"  Context7 Available: {status['context7_available']}")
-        print(f"  Fallback Available: {status['fallback_available']}")
-        print(f"  Supported Languages: {len(status['supported_languages'])}")
-        
-    else:
-        print(f"Test file {test_file} not found")
+    async with Context7Analyzer(enable_fallback=True) as analyzer:
+        # Test with a Python file
+        test_file = "src/orchestration/project_analyzer.py"
+        if Path(test_file).exists():
+            print(f"Analyzing {test_file} with Context7...")
+            
+            # Perform comprehensive analysis
+            result = await analyzer.analyze_file(test_file, "python")
+            
+            print(f"\nContext7 Analysis Results:")
+            print(f"  Success: {result.success}")
+            print(f"  Language: {result.language}")
+            print(f"  Confidence: {result.confidence_score:.2f}")
+            print(f"  Insights: {len(result.insights)} items")
+            print(f"  API Validations: {len(result.api_validations)} items")
+            print(f"  Code Issues: {len(result.code_issues)} items")
+            print(f"  Recommendations: {len(result.recommendations)} items")
+            
+            # Show status
+            status = analyzer.get_context7_status()
+            print(f"\nContext7 Status:")
+            print(f"  Context7 Available: {status['context7_available']}")
+            print(f"  Fallback Available: {status['fallback_available']}")
+            print(f"  Supported Languages: {len(status['supported_languages'])}")
+            
+        else:
+            print(f"Test file {test_file} not found")
 
 
 if __name__ == "__main__":
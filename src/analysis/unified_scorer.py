@@ -12,6 +12,88 @@ from .megalinter_client import MegaLinterResults, FileQualityScore
 from .semgrep_client import SemgrepResults, SecurityScore, SemgrepFinding, SeverityLevel
 from .astgrep_client import StructureAnalysis, AdaptationScore
 
+# Optional numeric acceleration for batch scoring
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+    NUMBA_AVAILABLE = np is not None
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+# Column order of the per-file component score matrix
+SCORE_COMPONENTS = ('quality', 'security', 'structure', 'standalone', 'documentation')
+
+
+def _weighted_sum_kernel(components, weights):
+    """Weighted sum of each row of an (n_files, n_components) score matrix."""
+    n_rows, n_cols = components.shape
+    out = np.empty(n_rows)
+    for i in range(n_rows):
+        total = 0.0
+        for j in range(n_cols):
+            total += components[i, j] * weights[j]
+        out[i] = total
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _weighted_sum_jit = numba.njit(cache=True)(_weighted_sum_kernel)
+else:
+    _weighted_sum_jit = None
+
+
+def combine_component_scores(rows: List[List[float]], weights: List[float]) -> List[float]:
+    """
+    Combine per-file component scores into composite scores.
+    
+    Uses the Numba-compiled kernel when available, NumPy when only NumPy is
+    installed or the kernel fails to compile, and plain Python otherwise.
+    
+    Args:
+        rows: One list of component scores per file, ordered as SCORE_COMPONENTS
+        weights: Component weights, ordered as SCORE_COMPONENTS
+        
+    Returns:
+        Composite score for each row
+    """
+    if not rows:
+        return []
+    
+    if np is None:
+        return [sum(score * weight for score, weight in zip(row, weights)) for row in rows]
+    
+    components = np.asarray(rows, dtype=np.float64)
+    weight_array = np.asarray(weights, dtype=np.float64)
+    
+    global _weighted_sum_jit
+    if _weighted_sum_jit is not None:
+        try:
+            return _weighted_sum_jit(components, weight_array).tolist()
+        except Exception as e:
+            # JIT compilation failed; degrade to NumPy for this and later calls
+            logging.getLogger(__name__).warning(f"Compiled scoring kernel failed, falling back to NumPy: {e}")
+            _weighted_sum_jit = None
+    
+    return (components @ weight_array).tolist()
+
+
+def warm_up_scoring():
+    """
+    Compile the batch scoring kernel before the first real scoring call.
+    
+    Numba compiles the kernel lazily on first use, so calling this is optional;
+    a long-running service can call it at startup to keep that cost out of its
+    first scoring batch. Does nothing when Numba is not available.
+    """
+    if NUMBA_AVAILABLE:
+        combine_component_scores([[0.0] * len(SCORE_COMPONENTS)], [0.0] * len(SCORE_COMPONENTS))
+
 
 @dataclass
 class CompositeFileScore:
@@ -72,21 +154,41 @@ class UnifiedFileScorer:
             CompositeFileScore with unified assessment
         """
         
-        # Calculate individual component scores
-        quality_score = self._normalize_quality_score(megalinter_score) if megalinter_score else 0.5
-        security_score = semgrep_score.overall_score if semgrep_score else 0.5
-        structure_score = self._calculate_structure_score(astgrep_analysis) if astgrep_analysis else 0.5
-        standalone_score = self._calculate_standalone_score(astgrep_analysis) if astgrep_analysis else 0.5
-        documentation_score = megalinter_score.documentation if megalinter_score else 0.5
+        component_scores = self._calculate_component_scores(megalinter_score, semgrep_score, astgrep_analysis)
         
         # Calculate weighted composite score
-        composite_score = (
-            quality_score * self.weight_config['quality'] +
-            security_score * self.weight_config['security'] +
-            structure_score * self.weight_config['structure'] +
-            standalone_score * self.weight_config['standalone'] +
-            documentation_score * self.weight_config['documentation']
+        composite_score = sum(
+            component_scores[component] * self.weight_config[component]
+            for component in SCORE_COMPONENTS
+        )
+        
+        return self._build_composite_score(
+            file_path, composite_score, component_scores,
+            megalinter_score, semgrep_score, astgrep_analysis
         )
+    
+    def _calculate_component_scores(self,
+                                  megalinter_score: Optional[FileQualityScore],
+                                  semgrep_score: Optional[SecurityScore],
+                                  astgrep_analysis: Optional[StructureAnalysis]) -> Dict[str, float]:
+        """Calculate the individual component scores for a file."""
+        
+        return {
+            'quality': self._normalize_quality_score(megalinter_score) if megalinter_score else 0.5,
+            'security': semgrep_score.overall_score if semgrep_score else 0.5,
+            'structure': self._calculate_structure_score(astgrep_analysis) if astgrep_analysis else 0.5,
+            'standalone': self._calculate_standalone_score(astgrep_analysis) if astgrep_analysis else 0.5,
+            'documentation': megalinter_score.documentation if megalinter_score else 0.5
+        }
+    
+    def _build_composite_score(self,
+                             file_path: str,
+                             composite_score: float,
+                             component_scores: Dict[str, float],
+                             megalinter_score: Optional[FileQualityScore],
+                             semgrep_score: Optional[SecurityScore],
+                             astgrep_analysis: Optional[StructureAnalysis]) -> CompositeFileScore:
+        """Assemble a CompositeFileScore from an already-weighted score."""
         
         # Generate recommendation and priority
         recommendation = self._generate_recommendation(composite_score, megalinter_score, semgrep_score, astgrep_analysis)
@@ -99,13 +201,7 @@ class UnifiedFileScorer:
         
         return CompositeFileScore(
             overall_score=composite_score,
-            component_scores={
-                'quality': quality_score,
-                'security': security_score,
-                'structure': structure_score,
-                'standalone': standalone_score,
-                'documentation': documentation_score
-            },
+            component_scores=component_scores,
             recommendation=recommendation,
             integration_priority=integration_priority,
             detailed_analysis=detailed_analysis
@@ -131,7 +227,10 @@ class UnifiedFileScorer:
         if astgrep_analyses:
             all_files.update(astgrep_analyses.keys())
         
-        # Score each file
+        # Gather component scores for every file, then weight them in one batch
+        file_inputs = []
+        component_rows = []
+        
         for file_path in all_files:
             megalinter_score = megalinter_results.file_scores.get(file_path) if megalinter_results else None
             
@@ -145,11 +244,18 @@ class UnifiedFileScorer:
             
             astgrep_analysis = astgrep_analyses.get(file_path) if astgrep_analyses else None
             
-            composite_score = self.calculate_composite_score(
-                file_path, megalinter_score, semgrep_score, astgrep_analysis
+            component_scores = self._calculate_component_scores(megalinter_score, semgrep_score, astgrep_analysis)
+            file_inputs.append((file_path, component_scores, megalinter_score, semgrep_score, astgrep_analysis))
+            component_rows.append([component_scores[component] for component in SCORE_COMPONENTS])
+        
+        weights = [self.weight_config[component] for component in SCORE_COMPONENTS]
+        composite_scores = combine_component_scores(component_rows, weights)
+        
+        for (file_path, component_scores, megalinter_score, semgrep_score, astgrep_analysis), composite_score in zip(file_inputs, composite_scores):
+            file_scores[file_path] = self._build_composite_score(
+                file_path, composite_score, component_scores,
+                megalinter_score, semgrep_score, astgrep_analysis
             )
-            
-            file_scores[file_path] = composite_score
         
         return file_scores
     
@@ -458,6 +564,9 @@ async def main():
     print("  Calculating composite scores...")
     file_scores = scorer.score_repository_files(megalinter_results, semgrep_results, astgrep_analyses)
     
+    # Context7 is no longer needed once the analyses are scored
+    await astgrep.aclose()
+    
     # Generate report
     report = scorer.generate_integration_report(file_scores)
     
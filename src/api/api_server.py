@@ -148,6 +148,11 @@ class APIServer:
     def _register_routes(self):
         """Register API routes."""
         
+        @self.app.on_event("shutdown")
+        async def shutdown():
+            """Close the analyzers' Context7 session and server process."""
+            await self.project_analyzer.aclose()
+        
         @self.app.get("/", response_model=Dict[str, str])
         async def root():
             """Root endpoint."""
@@ -5,6 +5,7 @@ Project Generator
 Generates complete project structures with files, metadata, and analysis reports.
 """
 
+import asyncio
 import os
 import json
 import logging
@@ -13,6 +14,12 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+# Faster JSON serialization when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class GeneratedProject:
@@ -57,24 +64,9 @@ class ProjectGenerator:
         
         self.logger.info(f"Generating project: {project_name}")
         
-        # Create project directory
+        # Create project directory and write files off the event loop
         project_path = os.path.join(output_dir, project_name)
-        os.makedirs(project_path, exist_ok=True)
-        
-        # Write project files
-        for file_name, content in files.items():
-            file_path = os.path.join(project_path, file_name)
-            
-            # Create subdirectories if needed
-            file_dir = os.path.dirname(file_path)
-            if file_dir and file_dir != project_path:
-                os.makedirs(file_dir, exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-        
-        # Calculate project size
-        total_size = sum(len(content.encode('utf-8')) for content in files.values())
+        total_size = await asyncio.to_thread(self._write_project_files, project_path, files)
         
         # Create project metadata
         project_metadata = GeneratedProject(
@@ -95,6 +87,33 @@ class ProjectGenerator:
         self.logger.info(f"Project generated successfully: {project_path}")
         return project_metadata
     
+    def _write_project_files(self, project_path: str, files: Dict[str, str]) -> int:
+        """
+        Create the project directory and write all project files (blocking).
+        
+        Returns:
+            Total size of the written files in bytes
+        """
+        
+        os.makedirs(project_path, exist_ok=True)
+        total_size = 0
+        
+        for file_name, content in files.items():
+            file_path = os.path.join(project_path, file_name)
+            
+            # Create subdirectories if needed
+            file_dir = os.path.dirname(file_path)
+            if file_dir and file_dir != project_path:
+                os.makedirs(file_dir, exist_ok=True)
+            
+            # Encode once: the same bytes are written and counted
+            data = content.encode('utf-8')
+            with open(file_path, 'wb') as f:
+                f.write(data)
+            total_size += len(data)
+        
+        return total_size
+    
     async def _generate_analysis_report(
         self, 
         project: GeneratedProject, 
@@ -143,11 +162,22 @@ class ProjectGenerator:
         
         # Save analysis report
         report_path = os.path.join(project.path, 'analysis_report.json')
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_data, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(self._write_json, report_path, analysis_data)
         
         self.logger.info(f"Analysis report saved: {report_path}")
     
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]):
+        """Write data as pretty-printed JSON (blocking)."""
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly, skipping the str round-trip
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    
     def _process_repository_info(self, repo: Dict[str, Any]) -> Dict[str, Any]:
         """Process repository information to ensure GitHub username/repo-name format."""
         
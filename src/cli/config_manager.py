@@ -4,9 +4,11 @@ Configuration Manager
 User settings and preferences management for AutoBot CLI.
 """
 
+import copy
 import json
 import os
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
@@ -75,9 +77,24 @@ class ConfigManager:
         self.config_dir.mkdir(exist_ok=True)
         self.cache_dir.mkdir(exist_ok=True)
         
+        # Resolved API keys / provider status, computed on first use and
+        # invalidated whenever the configuration is saved or reloaded
+        self._api_keys_cache: Optional[Dict[str, Optional[str]]] = None
+        self._api_status_cache: Dict[Optional[str], Mapping[str, Mapping[str, Any]]] = {}
+        
         # Load configuration
         self._config = self.load_config()
     
+    def _invalidate_caches(self):
+        """Drop cached API keys and provider status."""
+        self._api_keys_cache = None
+        self._api_status_cache.clear()
+    
+    def reload(self):
+        """Reload configuration from disk and re-read environment API keys."""
+        self._invalidate_caches()
+        self._config = self.load_config()
+    
     def load_config(self) -> UserConfig:
         """Load user configuration from file."""
         
@@ -102,6 +119,8 @@ class ConfigManager:
     def save_config(self, config: UserConfig):
         """Save user configuration to file."""
         
+        self._invalidate_caches()
+        
         try:
             with open(self.config_file, 'w') as f:
                 json.dump(asdict(config), f, indent=2)
@@ -113,8 +132,8 @@ class ConfigManager:
             self.logger.error(f"Failed to save config: {e}")
     
     def get_config(self) -> UserConfig:
-        """Get current configuration."""
-        return self._config
+        """Get a copy of the current configuration; pass it to save_config to apply changes."""
+        return copy.deepcopy(self._config)
     
     def update_config(self, **kwargs):
         """Update configuration with new values."""
@@ -140,6 +159,14 @@ class ConfigManager:
     def get_api_keys(self) -> Dict[str, Optional[str]]:
         """Get API keys from configuration and environment variables."""
         
+        if self._api_keys_cache is None:
+            self._api_keys_cache = self._resolve_api_keys()
+        
+        return dict(self._api_keys_cache)
+    
+    def _resolve_api_keys(self) -> Dict[str, Optional[str]]:
+        """Resolve API keys, preferring user config over environment variables."""
+        
         # Priority: User config > Environment variables
         api_keys = {
             'openai_api_key': (
@@ -240,8 +267,19 @@ class ConfigManager:
         else:
             self.logger.error(f"Invalid API provider: {provider}. Valid options: {valid_providers}")
     
-    def get_api_status(self, function_name: str = None) -> Dict[str, Dict[str, Any]]:
-        """Get status of all API providers."""
+    def get_api_status(self, function_name: str = None) -> Mapping[str, Mapping[str, Any]]:
+        """Get status of all API providers, as a read-only mapping."""
+        
+        if function_name not in self._api_status_cache:
+            self._api_status_cache[function_name] = MappingProxyType({
+                provider_id: MappingProxyType(provider_status)
+                for provider_id, provider_status in self._build_api_status(function_name).items()
+            })
+        
+        return self._api_status_cache[function_name]
+    
+    def _build_api_status(self, function_name: str = None) -> Dict[str, Dict[str, Any]]:
+        """Build the status of all API providers."""
         
         api_keys = self.get_api_keys()
         status = {}
@@ -304,7 +342,7 @@ class ConfigManager:
             status['function_config'] = {
                 'function_name': function_name,
                 'preferred_provider': function_config.get('provider', self._config.api_provider),
-                'fallback_providers': function_config.get('fallback_providers', []),
+                'fallback_providers': tuple(function_config.get('fallback_providers', ())),
                 'timeout': function_config.get('timeout', 30),
                 'retry_count': function_config.get('retry_count', 3)
             }
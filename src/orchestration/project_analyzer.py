@@ -7,10 +7,12 @@ structural analysis via UniversalCodeAnalyzer.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, is_dataclass, replace
 from enum import Enum
 from typing import List, Dict, Optional, Any
 
@@ -20,6 +22,8 @@ try:
 except ImportError:
     aiohttp = None
 
+from src.utils.http_session import client_session
+
 # Import ConfigManager
 try:
     from src.cli.config_manager import ConfigManager
@@ -44,6 +48,11 @@ except ImportError:
     Context7AnalysisResult = None
 
 
+# AI provider used when analyze_project_prompt() is called without one; set it
+# once and concurrent tasks inherit it through their copied context
+analysis_provider: ContextVar[Optional[str]] = ContextVar('analysis_provider', default=None)
+
+
 class ProjectType(Enum):
     """Types of projects that can be analyzed."""
     WEB_APPLICATION = "web_application"
@@ -73,9 +82,13 @@ class ProjectAnalysis:
 class ProjectAnalyzer:
     """AI-powered project analysis engine with Tree-sitter structural analysis."""
     
-    def __init__(self, config_manager=None, enable_tree_sitter: bool = True, enable_context7: bool = True):
+    def __init__(self, config_manager=None, enable_tree_sitter: bool = True, enable_context7: bool = True,
+                 session=None):
         self.logger = logging.getLogger(__name__)
         
+        # Optional shared aiohttp.ClientSession; a temporary one is used per call otherwise
+        self.session = session
+        
         # Initialize configuration manager with error handling
         if config_manager:
             self.config_manager = config_manager
@@ -114,6 +127,10 @@ class ProjectAnalyzer:
                 self.context7_analyzer = None
                 self.enable_context7 = False
         
+        # In-process cache of AI analyses keyed by (provider, prompt) hash;
+        # backed by the ConfigManager disk cache when available
+        self._prompt_cache: Dict[str, ProjectAnalysis] = {}
+        
         # Initialize AI provider configurations
         self.ai_providers = {}
         self._initialize_providers()
@@ -213,7 +230,8 @@ class ProjectAnalyzer:
         
         Args:
             prompt: User's project description/requirements
-            provider: AI provider to use for analysis (None for function's preferred provider)
+            provider: AI provider to use for analysis (None for the `analysis_provider`
+                context value, falling back to the function's preferred provider)
             source_files: Optional list of source files for Tree-sitter structural analysis
             
         Returns:
@@ -221,8 +239,15 @@ class ProjectAnalyzer:
         """
         self.logger.info(f"Analyzing project prompt: {prompt[:100]}...")
         
-        # Try AI analysis first
-        ai_analysis = await self._get_ai_analysis(prompt, provider)
+        provider = provider or analysis_provider.get()
+        
+        # Try AI analysis first, reusing a cached response for repeated prompts
+        cache_key = self._prompt_cache_key(prompt, provider)
+        ai_analysis = self._get_cached_analysis(cache_key)
+        if ai_analysis is None:
+            ai_analysis = await self._get_ai_analysis(prompt, provider)
+            if ai_analysis:
+                self._set_cached_analysis(cache_key, ai_analysis)
         
         if ai_analysis:
             # Enhance AI analysis with Tree-sitter structural data if source files provided
@@ -252,6 +277,57 @@ class ProjectAnalyzer:
         
         return pattern_analysis
     
+    def _prompt_cache_key(self, prompt: str, provider: Optional[str]) -> str:
+        """Build the cache key for an AI analysis of a prompt."""
+        digest = hashlib.sha256(f"{provider or 'default'}|{prompt}".encode('utf-8')).hexdigest()
+        return f"project_analysis_{digest}"
+    
+    def _get_cached_analysis(self, cache_key: str) -> Optional[ProjectAnalysis]:
+        """Return a cached AI analysis from memory or the disk cache, if present."""
+        
+        if cache_key in self._prompt_cache:
+            return self._copy_analysis(self._prompt_cache[cache_key])
+        
+        if not self.config_manager:
+            return None
+        
+        try:
+            cached = self.config_manager.get_cached_data(cache_key)
+            if not cached:
+                return None
+            
+            cached['project_type'] = ProjectType(cached['project_type'])
+            analysis = ProjectAnalysis(**cached)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cached analysis {cache_key}: {e}")
+            return None
+        
+        self.logger.info("Using cached AI analysis for prompt")
+        self._prompt_cache[cache_key] = analysis
+        return self._copy_analysis(analysis)
+    
+    def _set_cached_analysis(self, cache_key: str, analysis: ProjectAnalysis):
+        """Store an AI analysis in memory and in the disk cache."""
+        
+        self._prompt_cache[cache_key] = self._copy_analysis(analysis)
+        
+        if not self.config_manager:
+            return
+        
+        try:
+            data = asdict(analysis)
+            data['project_type'] = analysis.project_type.value
+            self.config_manager.set_cached_data(cache_key, data)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache AI analysis: {e}")
+    
+    @staticmethod
+    def _copy_analysis(analysis: ProjectAnalysis) -> ProjectAnalysis:
+        """Copy an analysis so enhancement steps cannot mutate cached entries."""
+        return replace(analysis,
+                       components=analysis.components.copy(),
+                       dependencies=analysis.dependencies.copy())
+    
     async def _enhance_with_structural_analysis(self, analysis: ProjectAnalysis,
                                              source_files: List[str]) -> ProjectAnalysis:
         """
@@ -609,7 +685,7 @@ class ProjectAnalyzer:
                     'model': 'gpt-4' if provider == 'openai' else 'claude-3-sonnet-20240229' if provider == 'anthropic' else 'gemini-pro'
                 }
             
-            async with aiohttp.ClientSession() as session:
+            async with client_session(self.session) as session:
                 async with session.post(url, json=payload, headers=headers, timeout=timeout) as response:
                     if response.status == 200:
                         result = await response.text()
@@ -776,6 +852,17 @@ class ProjectAnalyzer:
         
         return self.context7_analyzer.get_context7_status()
     
+    async def aclose(self):
+        """Close the Context7 session and stop its server process, if one was started."""
+        if self.context7_analyzer is not None:
+            await self.context7_analyzer.aclose()
+    
+    async def __aenter__(self) -> 'ProjectAnalyzer':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     async def validate_project_apis(self, source_files: List[str]) -> List[Dict[str, Any]]:
         """
         Validate API endpoints and patterns across the project using Context7.
@@ -807,7 +894,7 @@ class ProjectAnalyzer:
                         {
                             'file': file_path,
                             'language': language,
-                            'validation': asdict(validation) if hasattr(validation, '__dict__') else validation
+                            'validation': asdict(validation) if is_dataclass(validation) else validation
                         }
                         for validation in file_validations
                     ])
@@ -858,7 +945,7 @@ class ProjectAnalyzer:
                             'language': language,
                             'insights': result.insights,
                             'api_validations': [
-                                asdict(validation) if hasattr(validation, '__dict__') else validation
+                                asdict(validation) if is_dataclass(validation) else validation
                                 for validation in result.api_validations
                             ],
                             'code_issues': result.code_issues,
@@ -7,7 +7,8 @@ resource discovery for project requirements.
 
 import asyncio
 import logging
-from typing import List, Dict, Optional, Set
+import time
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from src.search.tier1_packages import PackageSearcher, PackageResult
@@ -40,6 +41,12 @@ class SearchOrchestrator:
         self.package_searcher = PackageSearcher()
         self.curated_searcher = CuratedSearcher()
         self.github_discoverer = GitHubDiscoverer()
+        
+        # Per-query search tasks keyed by (tier, query, language) with their expiry
+        # time; concurrent identical searches share a single in-flight task
+        self._search_cache: Dict[Tuple[str, str, str], Tuple[float, asyncio.Task]] = {}
+        self.max_cached_searches = 256
+        self.search_cache_ttl = 900.0
     
     async def orchestrate_search(
         self,
@@ -121,7 +128,53 @@ class SearchOrchestrator:
             combined = " ".join(components[:2])
             queries.append(combined)
         
-        return list(set(queries))  # Remove duplicates
+        return list(dict.fromkeys(queries))  # Remove duplicates, keep priority order
+    
+    async def _cached_search(
+        self,
+        tier: str,
+        query: str,
+        language: str,
+        search_func: Callable[[str, str], Awaitable[List[Any]]]
+    ) -> List[Any]:
+        """
+        Run a single-query tier search, reusing cached or in-flight results.
+        
+        The search runs in its own task, which callers await through
+        asyncio.shield so that cancelling one caller leaves it running for the
+        others. Results expire after search_cache_ttl seconds; failures are
+        not kept.
+        """
+        key = (tier, query, language.lower())
+        
+        entry = self._search_cache.get(key)
+        if entry is not None:
+            expires_at, task = entry
+            if expires_at > time.monotonic():
+                return await asyncio.shield(task)
+            del self._search_cache[key]
+        
+        task = asyncio.get_running_loop().create_task(search_func(query, language))
+        task.add_done_callback(lambda done: self._forget_failed_search(key, done))
+        self._search_cache[key] = (time.monotonic() + self.search_cache_ttl, task)
+        
+        # Bound the cache by evicting the oldest entry
+        if len(self._search_cache) > self.max_cached_searches:
+            self._search_cache.pop(next(iter(self._search_cache)))
+        
+        return await asyncio.shield(task)
+    
+    def _forget_failed_search(self, key: Tuple[str, str, str], task: asyncio.Task):
+        """Drop a failed or cancelled search from the cache so the next search retries."""
+        if not task.cancelled() and task.exception() is None:
+            return
+        entry = self._search_cache.get(key)
+        if entry is not None and entry[1] is task:
+            del self._search_cache[key]
+    
+    def clear_search_cache(self):
+        """Forget all cached search results."""
+        self._search_cache.clear()
     
     async def _search_tier1_packages(
         self, 
@@ -136,7 +189,9 @@ class SearchOrchestrator:
         
         for query in queries[:3]:  # Limit queries to prevent overload
             try:
-                packages = await self.package_searcher.search_packages(query, language)
+                packages = await self._cached_search(
+                    'packages', query, language, self.package_searcher.search_packages
+                )
                 all_packages.extend(packages)
             except Exception as e:
                 self.logger.warning(f"Tier 1 search failed for '{query}': {e}")
@@ -170,7 +225,9 @@ class SearchOrchestrator:
         async with self.curated_searcher:
             for query in queries[:2]:  # Limit queries
                 try:
-                    collections = await self.curated_searcher.search_collections(query, language)
+                    collections = await self._cached_search(
+                        'curated', query, language, self.curated_searcher.search_collections
+                    )
                     all_collections.extend(collections)
                 except Exception as e:
                     self.logger.warning(f"Tier 2 search failed for '{query}': {e}")
@@ -204,7 +261,9 @@ class SearchOrchestrator:
         async with self.github_discoverer:
             for query in queries[:2]:  # Limit queries
                 try:
-                    repositories = await self.github_discoverer.discover_repositories(query, language)
+                    repositories = await self._cached_search(
+                        'github', query, language, self.github_discoverer.discover_repositories
+                    )
                     all_repositories.extend(repositories)
                 except Exception as e:
                     self.logger.warning(f"Tier 3 search failed for '{query}': {e}")
@@ -33,6 +33,8 @@ try:
 except ImportError:
     genai = None
 
+from src.utils.http_session import client_session
+
 # Import configuration manager
 try:
     from src.cli.config_manager import ConfigManager
@@ -61,9 +63,12 @@ class AIAnalysisResult:
 class AIIntegratedReporter:
     """AI-powered project reporter with comprehensive analysis capabilities."""
     
-    def __init__(self, config_manager: ConfigManager = None):
+    def __init__(self, config_manager: ConfigManager = None, session=None):
         self.logger = logging.getLogger(__name__)
         
+        # Optional shared aiohttp.ClientSession; a temporary one is used per call otherwise
+        self.session = session
+        
         # Initialize configuration manager
         if config_manager:
             self.config_manager = config_manager
@@ -609,7 +614,7 @@ No external repositories were integrated in this project."""
                 'model': 'gpt-4'
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with client_session(self.session) as session:
                 async with session.post(
                     'https://text.pollinations.ai/',
                     json=payload,
@@ -695,7 +700,7 @@ No external repositories were integrated in this project."""
                 'max_tokens': 2000
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with client_session(self.session) as session:
                 async with session.post(
                     'https://open.bigmodel.cn/api/paas/v4/chat/completions',
                     json=payload,
@@ -736,7 +741,7 @@ No external repositories were integrated in this project."""
                     'model': 'gpt-4'
                 }
                 
-                async with aiohttp.ClientSession() as session:
+                async with client_session(self.session) as session:
                     async with session.post(
                         'https://text.pollinations.ai/',
                         json=payload,
@@ -0,0 +1,11 @@
+"""
+Utilities Module
+
+Helpers shared across the AutoBot Assembly System's modules.
+"""
+
+from .http_session import client_session
+
+__all__ = [
+    'client_session'
+]
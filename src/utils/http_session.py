@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+HTTP Session Helpers
+
+Shared aiohttp session handling for modules that call external AI providers.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+@asynccontextmanager
+async def client_session(session: Optional[Any] = None):
+    """
+    Yield a shared HTTP session, or a temporary one if none was provided.
+    
+    Args:
+        session: Shared aiohttp.ClientSession, which is left open
+        
+    Yields:
+        The shared session, or a temporary one closed on exit
+    """
+    if session is not None:
+        yield session
+        return
+    
+    async with aiohttp.ClientSession() as temporary_session:
+        yield temporary_session
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Test suite for the AST-grep analyzer's structure cache, corpus analysis and dependency
+classification.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.analysis.astgrep_client import (
+    ASTGrepAnalyzer,
+    ClassMetrics,
+    FrameworkDependencies,
+    ImportAnalysis,
+    StructureAnalysis,
+    _decode_analysis,
+    _encode_analysis
+)
+
+
+SOURCE = """import os
+import requests
+from flask import Flask
+
+app = Flask(__name__)
+
+
+class Service(Base):
+    def run(self):
+        return os.getcwd()
+"""
+
+
+class TestStructureCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the persistent structure cache."""
+    
+    def setUp(self):
+        """Set up a source file and a cache location in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, 'astgrep.db')
+        self.file_path = os.path.join(self.temp_dir.name, 'service.py')
+        Path(self.file_path).write_text(SOURCE)
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+    
+    def make_analyzer(self) -> ASTGrepAnalyzer:
+        """Build an analyzer on the shared cache, as a new run would."""
+        analyzer = ASTGrepAnalyzer(
+            use_tree_sitter_fallback=False, enable_context7=False, cache_path=self.cache_path
+        )
+        self.addCleanup(analyzer._cache.close)
+        return analyzer
+    
+    def count_reads(self, analyzer: ASTGrepAnalyzer) -> list:
+        """Record the paths the analyzer reads from disk."""
+        reads = []
+        read_file = analyzer._read_file
+        
+        def counting_read(file_path):
+            reads.append(file_path)
+            return read_file(file_path)
+        
+        analyzer._read_file = counting_read
+        return reads
+    
+    def cached_rows(self, analyzer: ASTGrepAnalyzer) -> list:
+        """Return the (sha, mtime_ns, size) rows stored for the source file."""
+        return analyzer._cache.execute(
+            'SELECT sha, mtime_ns, size FROM base_structure_cache WHERE path = ?',
+            (os.path.abspath(self.file_path),)
+        ).fetchall()
+    
+    def test_encode_decode_round_trip(self):
+        """Test that decoding an encoded analysis rebuilds an equal analysis."""
+        analysis = StructureAnalysis(
+            imports=ImportAnalysis(('os', 'requests'), ('requests',), ('os',), 2),
+            class_metrics=ClassMetrics(1, 2.5, 3, 2),
+            framework_dependencies=FrameworkDependencies(('flask',), 0.4, {'flask': 2}),
+            config_patterns=('settings',),
+            complexity_score=0.3,
+            maintainability_score=0.7,
+            context7_flags=('api_validation',)
+        )
+        
+        decoded = _decode_analysis(_encode_analysis(analysis))
+        
+        self.assertEqual(decoded, analysis)
+        self.assertIsInstance(decoded.imports.imports, tuple)
+        self.assertIsInstance(decoded.framework_dependencies.frameworks, tuple)
+        self.assertIsInstance(decoded.context7_flags, tuple)
+    
+    async def test_unchanged_file_is_not_read(self):
+        """Test that a file with a known mtime and size is served without reading it."""
+        first = await self.make_analyzer().analyze_code_structure(self.file_path, 'python')
+        self.assertEqual(first.imports.imports, ('os', 'requests', 'flask'))
+        
+        analyzer = self.make_analyzer()
+        reads = self.count_reads(analyzer)
+        second = await analyzer.analyze_code_structure(self.file_path, 'python')
+        
+        self.assertEqual(second, first)
+        self.assertEqual(reads, [])
+    
+    async def test_new_mtime_with_same_content_refreshes_row(self):
+        """Test that touching a file re-reads it once and records its new stat."""
+        first = await self.make_analyzer().analyze_code_structure(self.file_path, 'python')
+        stat = os.stat(self.file_path)
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        new_mtime_ns = os.stat(self.file_path).st_mtime_ns
+        
+        analyzer = self.make_analyzer()
+        reads = self.count_reads(analyzer)
+        self.assertEqual(await analyzer.analyze_code_structure(self.file_path, 'python'), first)
+        self.assertEqual(len(reads), 1)
+        
+        rows = self.cached_rows(analyzer)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][1:], (new_mtime_ns, stat.st_size))
+        
+        # The refreshed row serves the next run without a read
+        analyzer = self.make_analyzer()
+        reads = self.count_reads(analyzer)
+        self.assertEqual(await analyzer.analyze_code_structure(self.file_path, 'python'), first)
+        self.assertEqual(reads, [])
+    
+    async def test_changed_content_replaces_older_rows(self):
+        """Test that storing a new version of a file deletes the rows of older versions."""
+        analyzer = self.make_analyzer()
+        await analyzer.analyze_code_structure(self.file_path, 'python')
+        old_sha = self.cached_rows(analyzer)[0][0]
+        
+        Path(self.file_path).write_text(SOURCE + "\nimport json\n")
+        analysis = await self.make_analyzer().analyze_code_structure(self.file_path, 'python')
+        
+        self.assertIn('json', analysis.imports.imports)
+        rows = self.cached_rows(analyzer)
+        self.assertEqual(len(rows), 1)
+        self.assertNotEqual(rows[0][0], old_sha)
+
+
+class TestAnalyzeCorpus(unittest.IsolatedAsyncioTestCase):
+    """Test cases for whole-directory analysis."""
+    
+    def setUp(self):
+        """Set up a small project tree in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.temp_dir.name, 'project')
+        files = {
+            'app.py': SOURCE,
+            'gui.pyw': 'import sys\n',
+            'pkg/util.py': 'import json\n',
+            'pkg/README.md': '# import os\n',
+            'web/index.js': "const fs = require('fs');\n",
+            'node_modules/left_pad/index.py': 'import left_pad\n',
+            '.git/hooks/pre_commit.py': 'import subprocess\n',
+            'build/lib/app.py': SOURCE
+        }
+        for relative_path, content in files.items():
+            file_path = Path(self.root, relative_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
+        
+        self.analyzer = ASTGrepAnalyzer(
+            use_tree_sitter_fallback=False, enable_context7=False,
+            cache_path=os.path.join(self.temp_dir.name, 'astgrep.db')
+        )
+        self.addCleanup(self.analyzer._cache.close)
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+    
+    async def test_analyzes_every_matching_file(self):
+        """Test that skipped directories are pruned and only the language's files are analyzed."""
+        checked = []
+        should_analyze_file = self.analyzer._should_analyze_file
+        
+        def recording_check(file_path):
+            checked.append(file_path)
+            return should_analyze_file(file_path)
+        
+        self.analyzer._should_analyze_file = recording_check
+        analyses = await self.analyzer.analyze_corpus(self.root, 'python', max_concurrency=2)
+        
+        # Skipped directories are checked themselves, but never walked into
+        for skipped in ('node_modules', '.git', 'build'):
+            skipped_dir = os.path.join(self.root, skipped) + '/'
+            self.assertIn(skipped_dir, checked)
+            self.assertFalse([path for path in checked if path.startswith(skipped_dir) and path != skipped_dir])
+        
+        expected = [
+            os.path.join(self.root, relative_path)
+            for relative_path in ('app.py', 'gui.pyw', 'pkg/util.py')
+        ]
+        self.assertEqual(sorted(analyses), sorted(expected))
+        self.assertEqual(analyses[expected[0]].imports.imports, ('os', 'requests', 'flask'))
+        self.assertEqual(analyses[expected[1]].imports.imports, ('sys',))
+        self.assertEqual(analyses[expected[2]].imports.imports, ('json',))
+    
+    async def test_empty_corpus(self):
+        """Test that a tree without files of the language yields no results."""
+        self.assertEqual(await self.analyzer.analyze_corpus(self.root, 'ruby'), {})
+
+
+class TestDependencyClassification(unittest.TestCase):
+    """Test cases for telling standard library imports from external dependencies."""
+    
+    def setUp(self):
+        """Set up an analyzer without optional backends, caching in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.analyzer = ASTGrepAnalyzer(
+            use_tree_sitter_fallback=False, enable_context7=False,
+            cache_path=os.path.join(self.temp_dir.name, 'astgrep.db')
+        )
+        self.addCleanup(self.analyzer._cache.close)
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+    
+    def assertClassification(self, language: str, expected: dict):
+        """Assert whether each import name is external for a language."""
+        for import_name, external in expected.items():
+            with self.subTest(language=language, import_name=import_name):
+                self.assertEqual(self.analyzer._is_external_dependency(import_name, language), external)
+    
+    def test_python(self):
+        """Test that standard library modules match by whole name or as a package prefix."""
+        self.assertClassification('Python', {
+            'os': False,
+            'os.path': False,
+            'collections.abc': False,
+            'typing_extensions': True,
+            'osmnx': True,
+            'requests': True,
+            '.models': False
+        })
+    
+    def test_javascript(self):
+        """Test that Node built-ins are internal and packages or paths are classified by prefix."""
+        self.assertClassification('javascript', {
+            'fs': False,
+            'path': False,
+            'fs-extra': True,
+            'express': True,
+            './utils': False,
+            '../lib/config': False
+        })
+    
+    def test_java(self):
+        """Test that only the listed java.* packages are standard library, matched by whole name."""
+        self.assertClassification('Java', {
+            'java.util': False,
+            'java.util.List': False,
+            'java.time.Instant': False,
+            'java.sql.Connection': True,
+            'java.utility.Helper': True,
+            'javax.inject.Inject': True,
+            'javafx.scene.Scene': True,
+            'org.springframework.boot.SpringApplication': True
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Context7 analyzer's debouncing and result caching.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.analysis.context7_integration import Context7Analyzer, Context7AnalysisResult
+
+
+def make_result(file_path: str, confidence_score: float = 0.9) -> Context7AnalysisResult:
+    """Build a successful analysis result for a file."""
+    return Context7AnalysisResult(
+        success=True,
+        file_path=file_path,
+        language='python',
+        insights={},
+        api_validations=[],
+        code_issues=[],
+        recommendations=[],
+        confidence_score=confidence_score,
+        analysis_timestamp='2024-01-01T00:00:00'
+    )
+
+
+def make_analyzer(temp_dir: str) -> Context7Analyzer:
+    """Build an analyzer that never reaches a Context7 server."""
+    analyzer = Context7Analyzer(enable_fallback=False, cache_path=os.path.join(temp_dir, 'context7.db'))
+    analyzer.context7_available = False
+    return analyzer
+
+
+class TestRealTimeAnalysis(unittest.IsolatedAsyncioTestCase):
+    """Test cases for debounced real-time analysis."""
+    
+    def setUp(self):
+        """Set up an analyzer whose analyze_file counts its calls."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.analyzer = make_analyzer(self.temp_dir.name)
+        self.calls = []
+        
+        async def analyze_file(file_path, language, analysis_types=None):
+            self.calls.append(file_path)
+            await asyncio.sleep(0.01)
+            return make_result(file_path, confidence_score=len(self.calls) / 10)
+        
+        self.analyzer.analyze_file = analyze_file
+    
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.temp_dir.cleanup()
+    
+    async def test_burst_runs_one_analysis(self):
+        """Test that a burst of calls analyzes once and every caller gets the result."""
+        results = await asyncio.gather(*(
+            self.analyzer.real_time_analysis('a.py', 'python', debounce_ms=20)
+            for _ in range(5)
+        ))
+        
+        self.assertEqual(self.calls, ['a.py'])
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertTrue(results[0].success)
+    
+    async def test_cancelled_caller_leaves_others_unaffected(self):
+        """Test that cancelling one caller neither cancels the analysis nor the other callers."""
+        callers = [
+            asyncio.ensure_future(self.analyzer.real_time_analysis('a.py', 'python', debounce_ms=20))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        
+        # The newest caller owns the analysis the others follow
+        callers[-1].cancel()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        
+        self.assertIsInstance(results[-1], asyncio.CancelledError)
+        self.assertTrue(results[0].success)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(self.calls, ['a.py'])
+    
+    async def test_cancelled_superseded_caller(self):
+        """Test that cancelling a superseded caller leaves the newest one unaffected."""
+        callers = [
+            asyncio.ensure_future(self.analyzer.real_time_analysis('a.py', 'python', debounce_ms=20))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        
+        callers[0].cancel()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        
+        self.assertIsInstance(results[0], asyncio.CancelledError)
+        self.assertTrue(results[2].success)
+        self.assertIs(results[1], results[2])
+        self.assertEqual(self.calls, ['a.py'])
+    
+    async def test_files_are_debounced_independently(self):
+        """Test that calls for different files do not supersede each other."""
+        first, second = await asyncio.gather(
+            self.analyzer.real_time_analysis('a.py', 'python', debounce_ms=10),
+            self.analyzer.real_time_analysis('b.py', 'python', debounce_ms=10)
+        )
+        
+        self.assertEqual(sorted(self.calls), ['a.py', 'b.py'])
+        self.assertEqual((first.file_path, second.file_path), ('a.py', 'b.py'))
+    
+    async def test_pending_analyses_are_forgotten(self):
+        """Test that finished analyses are dropped from the pending map."""
+        await self.analyzer.real_time_analysis('a.py', 'python', debounce_ms=1)
+        await asyncio.sleep(0)
+        
+        self.assertEqual(self.analyzer._pending_analyses, {})
+    
+    async def test_forget_pending_keeps_newer_analysis(self):
+        """Test that a superseded analysis does not remove the one that replaced it."""
+        loop = asyncio.get_running_loop()
+        older, newer = loop.create_future(), loop.create_future()
+        self.analyzer._pending_analyses['a.py'] = newer
+        
+        self.analyzer._forget_pending('a.py', older)
+        self.assertIs(self.analyzer._pending_analyses['a.py'], newer)
+        
+        self.analyzer._forget_pending('a.py', newer)
+        self.assertNotIn('a.py', self.analyzer._pending_analyses)
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for the in-memory result cache."""
+    
+    def setUp(self):
+        """Set up an analyzer with a small cache and a controllable clock."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.analyzer = make_analyzer(self.temp_dir.name)
+        self.analyzer.max_cached_results = 2
+        self.analyzer.result_cache_ttl = 300.0
+        
+        self.now = 1000.0
+        patcher = mock.patch('src.analysis.context7_integration.time.monotonic', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.temp_dir.cleanup()
+    
+    def key(self, file_path: str, mtime_ns: int = 1):
+        """Build a cache key the way analyze_file does."""
+        return (file_path, mtime_ns, 10, 'python', ('api', 'security', 'structure'))
+    
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are served until their TTL runs out, then dropped."""
+        result = make_result('a.py')
+        self.analyzer._store_cached_result(self.key('a.py'), result)
+        
+        self.now += 299.0
+        self.assertIs(self.analyzer._get_cached_result(self.key('a.py')), result)
+        
+        self.now += 1.0
+        self.assertIsNone(self.analyzer._get_cached_result(self.key('a.py')))
+        self.assertNotIn(self.key('a.py'), self.analyzer._result_cache)
+        
+        status = self.analyzer.get_context7_status()['result_cache']
+        self.assertEqual((status['hits'], status['misses'], status['size']), (1, 1, 0))
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that storing past the limit evicts the least recently used entry."""
+        self.analyzer._store_cached_result(self.key('a.py'), make_result('a.py'))
+        self.analyzer._store_cached_result(self.key('b.py'), make_result('b.py'))
+        
+        # Reading a.py makes b.py the least recently used
+        self.assertIsNotNone(self.analyzer._get_cached_result(self.key('a.py')))
+        self.analyzer._store_cached_result(self.key('c.py'), make_result('c.py'))
+        
+        self.assertIsNotNone(self.analyzer._get_cached_result(self.key('a.py')))
+        self.assertIsNone(self.analyzer._get_cached_result(self.key('b.py')))
+        self.assertIsNotNone(self.analyzer._get_cached_result(self.key('c.py')))
+    
+    def test_invalidate_file(self):
+        """Test that invalidating a file drops all of its entries and nothing else."""
+        self.analyzer.max_cached_results = 10
+        self.analyzer._store_cached_result(self.key('a.py', 1), make_result('a.py'))
+        self.analyzer._store_cached_result(self.key('a.py', 2), make_result('a.py'))
+        self.analyzer._store_cached_result(self.key('b.py'), make_result('b.py'))
+        
+        self.analyzer.invalidate('a.py')
+        
+        self.assertEqual(list(self.analyzer._result_cache), [self.key('b.py')])
+        
+        self.analyzer.invalidate()
+        self.assertEqual(len(self.analyzer._result_cache), 0)
+    
+    def test_analyze_file_reuses_result_until_file_changes(self):
+        """Test that analyze_file serves unchanged files from the cache."""
+        file_path = os.path.join(self.temp_dir.name, 'module.py')
+        Path(file_path).write_text('x = 1\n')
+        calls = []
+        
+        async def analyze_uncached(path, language, analysis_types):
+            calls.append(path)
+            return make_result(path), False
+        
+        self.analyzer._analyze_uncached = analyze_uncached
+        
+        first = asyncio.run(self.analyzer.analyze_file(file_path, 'python'))
+        second = asyncio.run(self.analyzer.analyze_file(file_path, 'python'))
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        
+        # A modified file gets a new key
+        Path(file_path).write_text('x = 2\ny = 3\n')
+        asyncio.run(self.analyzer.analyze_file(file_path, 'python'))
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()